@@ -9,21 +9,19 @@ from skyflow.vault.detect import (
     Bleep,
     FileInput,
 )
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
 
 """
- * Skyflow Deidentify File Example (concurrent)
+ * Skyflow Deidentify File Example (asyncio)
  *
  * This sample demonstrates how to use all available options for deidentifying files.
- * The SDK is synchronous; this example runs the (blocking) deidentify_file call on a
- * background thread using concurrent.futures.ThreadPoolExecutor so the main thread can
- * continue working. This is thread-based concurrency, not asyncio — the SDK does not
- * expose async/await coroutines.
+ * It awaits skyflow_client.detect().aio.deidentify_file, which polls for the processed
+ * file with asyncio.sleep, so other coroutines keep running while the run completes.
  * Supported file types: images (jpg, png, etc.), pdf, audio (mp3, wav), documents,
  * spreadsheets, presentations, structured text.
 """
 
-def perform_file_deidentification_concurrent():
+async def perform_file_deidentification_async():
     try:
         # Step 1: Configure Credentials
         credentials = {
@@ -87,39 +85,22 @@ def perform_file_deidentification_concurrent():
             # )
         )
 
-        # Create a thread pool executor
-        executor = ThreadPoolExecutor(max_workers=1)
-
-        future = executor.submit(lambda: skyflow_client.detect().deidentify_file(deidentify_request))
-
-        def handle_response(future):
-            exception = future.exception()
-            if exception is not None:
-                if isinstance(exception, SkyflowError):
-                    # Handle Skyflow-specific errors
-                    print(
-                        '\nSkyflow Error:',
-                        {
-                            'http_code': exception.http_code,
-                            'grpc_code': exception.grpc_code,
-                            'http_status': exception.http_status,
-                            'message': exception.message,
-                            'details': exception.details,
-                        },
-                    )
-                else:
-                    # Handle unexpected errors
-                    print('Unexpected Error:', exception)
-                return
-
-            # Handle Successful Response
-            result = future.result()
-            print('\nDeidentify File Response:', result)
-
-        future.add_done_callback(handle_response)
-
-        executor.shutdown(wait=True)
+        # Step 5: Await the de-identification
+        result = await skyflow_client.detect().aio.deidentify_file(deidentify_request)
+        print('\nDeidentify File Response:', result)
 
+    except SkyflowError as error:
+        # Handle Skyflow-specific errors
+        print(
+            '\nSkyflow Error:',
+            {
+                'http_code': error.http_code,
+                'grpc_code': error.grpc_code,
+                'http_status': error.http_status,
+                'message': error.message,
+                'details': error.details,
+            },
+        )
     except Exception as error:
         # Handle unexpected errors
         print('Unexpected Error:', error)
@@ -1 +1,3 @@
-from ._utils import generate_bearer_token, generate_bearer_token_from_creds, is_expired, generate_signed_data_tokens, generate_signed_data_tokens_from_creds
\ No newline at end of file
+from ._utils import generate_bearer_token, generate_bearer_token_from_creds, is_expired, generate_signed_data_tokens, generate_signed_data_tokens_from_creds
+from ._token_cache import TokenCacheBackend, InMemoryTokenCacheBackend, FileTokenCacheBackend, set_token_cache_backend
+from ._signed_token_generator import SignedTokenGenerator
@@ -0,0 +1,102 @@
+import json
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import jwt
+from skyflow.error import SkyflowError
+from skyflow.service_account._utils import _normalize_credentials, _validate_and_resolve_ctx, _load_private_key, \
+    _read_credentials_file, _get_signed_data_token_claims, get_signed_data_token_response_object, invalid_input_error_code
+from skyflow.utils import SkyflowMessages, is_valid_url
+from skyflow.utils.constants import JWT, CredentialField, OptionField, SignedDataToken
+from skyflow.utils.logger import log_info, log_error_log
+
+# Per-process signing state of pool workers, set once by the pool initializer.
+_worker_generator = None
+
+
+def _initialize_worker(credentials, options):
+    global _worker_generator
+    _worker_generator = SignedTokenGenerator(credentials, options)
+
+
+def _sign_chunk(data_tokens):
+    return _worker_generator._sign_all(data_tokens)
+
+
+class SignedTokenGenerator:
+    """Signs data tokens in bulk with a service account's private key.
+
+    The key is loaded once, when the generator is created, instead of once per token.
+    generate() streams (data_token, signed_data_token) tuples in input order and can spread
+    very large batches over a process pool.
+    """
+    def __init__(self, credentials, options = None, logger = None):
+        self.__options = options if options is not None else {}
+        self.__credentials = _normalize_credentials(credentials)
+        self.__logger = logger
+
+        token_uri = self.__credentials.get(CredentialField.TOKEN_URI)
+        if not isinstance(token_uri, str) or not is_valid_url(token_uri):
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_TOKEN_URI.value, logger=logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_TOKEN_URI.value, invalid_input_error_code)
+
+        self.__resolved_ctx = None
+        if OptionField.CTX in self.__options:
+            self.__resolved_ctx = _validate_and_resolve_ctx(self.__options[OptionField.CTX])
+        self.__time_to_live = self.__options.get(OptionField.TIME_TO_LIVE, SignedDataToken.DEFAULT_TIME_TO_LIVE)
+        self.__private_key = _load_private_key(self.__credentials.get(CredentialField.PRIVATE_KEY))
+
+    @classmethod
+    def from_file(cls, credentials_file_path, options = None, logger = None):
+        return cls(_read_credentials_file(credentials_file_path, logger), options, logger)
+
+    @classmethod
+    def from_creds(cls, credentials, options = None, logger = None):
+        try:
+            json_credentials = json.loads(credentials.strip().replace('\n', '\\n'))
+        except Exception:
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_CREDENTIALS_FILE.value, logger=logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_CREDENTIALS_STRING.value, invalid_input_error_code)
+        return cls(json_credentials, options, logger)
+
+    def sign(self, data_token):
+        issued_at = int(time.time())
+        return self.__sign(data_token, issued_at, issued_at + self.__time_to_live)
+
+    def __sign(self, data_token, issued_at, expiry_time):
+        claims = _get_signed_data_token_claims(self.__credentials, data_token, expiry_time, issued_at, self.__resolved_ctx)
+        try:
+            signed_jwt = jwt.encode(claims, self.__private_key, algorithm=JWT.ALGORITHM_RS256)
+        except Exception:
+            raise SkyflowError(SkyflowMessages.Error.INVALID_CREDENTIALS.value, invalid_input_error_code)
+        return get_signed_data_token_response_object(JWT.SIGNED_TOKEN_PREFIX + signed_jwt, data_token)
+
+    def _sign_all(self, data_tokens):
+        issued_at = int(time.time())
+        expiry_time = issued_at + self.__time_to_live
+        return [self.__sign(data_token, issued_at, expiry_time) for data_token in data_tokens]
+
+    def generate(self, data_tokens, processes = None, chunk_size = SignedDataToken.CHUNK_SIZE):
+        """Yield (data_token, signed_data_token) for every token in data_tokens, in order.
+
+        data_tokens may be any iterable and is consumed lazily. With processes set, chunks of
+        chunk_size tokens are signed in that many worker processes, at most two chunks per
+        worker being in flight at a time.
+        """
+        log_info(SkyflowMessages.Info.GET_SIGNED_DATA_TOKENS_TRIGGERED.value, self.__logger)
+        data_tokens = iter(data_tokens)
+        if not processes:
+            for chunk in iter(lambda: list(islice(data_tokens, chunk_size)), []):
+                yield from self._sign_all(chunk)
+        else:
+            with ProcessPoolExecutor(max_workers=processes, initializer=_initialize_worker,
+                                     initargs=(self.__credentials, self.__options)) as executor:
+                pending = deque()
+                for chunk in iter(lambda: list(islice(data_tokens, chunk_size)), []):
+                    pending.append(executor.submit(_sign_chunk, chunk))
+                    if len(pending) >= processes * 2:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+        log_info(SkyflowMessages.Info.GET_SIGNED_DATA_TOKEN_SUCCESS.value, self.__logger)
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+import jwt
+from skyflow.utils.constants import BearerToken, CredentialField, JwtField, OptionField
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+class TokenCacheBackend(ABC):
+    """Storage for bearer tokens shared by every VaultClient in the process.
+
+    Entries are dicts with the token and the wall-clock times at which it should be
+    refreshed and at which it expires. lock returns a context manager that serializes
+    minting for a key, across processes when the backend is shared between them.
+    """
+    @abstractmethod
+    def get(self, key):
+        pass
+
+    @abstractmethod
+    def set(self, key, entry):
+        pass
+
+    @abstractmethod
+    def lock(self, key):
+        pass
+
+
+class InMemoryTokenCacheBackend(TokenCacheBackend):
+    """Keeps up to BearerToken.CACHE_MAX_SIZE entries, and as many locks, evicting expired
+    entries first and then the oldest.
+    """
+    def __init__(self):
+        self.__entries = {}
+        self.__entries_lock = threading.Lock()
+        self.__locks = {}
+        self.__locks_lock = threading.Lock()
+
+    def get(self, key):
+        return self.__entries.get(key)
+
+    def set(self, key, entry):
+        with self.__entries_lock:
+            if key not in self.__entries and len(self.__entries) >= BearerToken.CACHE_MAX_SIZE:
+                self.__evict_entries()
+            self.__entries[key] = entry
+
+    def __evict_entries(self):
+        now = time.time()
+        for key in [key for key, entry in self.__entries.items() if entry.get('expires_at', 0) <= now]:
+            del self.__entries[key]
+        while len(self.__entries) >= BearerToken.CACHE_MAX_SIZE:
+            del self.__entries[next(iter(self.__entries))]
+
+    def lock(self, key):
+        with self.__locks_lock:
+            key_lock = self.__locks.get(key)
+            if key_lock is None:
+                if len(self.__locks) >= BearerToken.CACHE_MAX_SIZE:
+                    # Locks that nobody holds are dropped. At worst, a caller that got one of them
+                    # and has not acquired it yet mints a token alongside the next caller.
+                    self.__locks = {lock_key: held_lock for lock_key, held_lock in self.__locks.items() if held_lock.locked()}
+                key_lock = self.__locks[key] = threading.Lock()
+            return key_lock
+
+    def clear(self):
+        with self.__entries_lock:
+            self.__entries.clear()
+
+
+class FileTokenCacheBackend(TokenCacheBackend):
+    """Keeps one file per cache key in a directory, e.g. on tmpfs, so that pre-forked
+    workers mint a token once between them. Minting is serialized across processes with
+    an advisory file lock where fcntl is available.
+
+    Each write removes expired entries, and then the oldest ones while more than
+    BearerToken.CACHE_MAX_SIZE remain. Lock files are kept, since removing one that
+    another process holds would let two processes lock the same key.
+    """
+    def __init__(self, directory):
+        self.__directory = directory
+        self.__thread_locks = InMemoryTokenCacheBackend()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def __get_path(self, key, suffix):
+        return os.path.join(self.__directory, key + suffix)
+
+    def get(self, key):
+        try:
+            with open(self.__get_path(key, '.json'), 'r') as entry_file:
+                return json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, entry):
+        # Written to a temporary file and renamed so readers never see a partial entry.
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.__directory)
+        try:
+            with os.fdopen(file_descriptor, 'w') as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(temp_path, self.__get_path(key, '.json'))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.__evict_entries(key)
+
+    def __evict_entries(self, kept_key):
+        now = time.time()
+        entries = []
+        for file_name in os.listdir(self.__directory):
+            if not file_name.endswith('.json') or file_name == kept_key + '.json':
+                continue
+            path = os.path.join(self.__directory, file_name)
+            try:
+                with open(path, 'r') as entry_file:
+                    expires_at = json.load(entry_file).get('expires_at', 0)
+                modified_at = os.path.getmtime(path)
+            except (OSError, ValueError, AttributeError):
+                expires_at, modified_at = 0, 0
+            if expires_at <= now:
+                self.__remove(path)
+            else:
+                entries.append((modified_at, path))
+        # The entry just written counts towards the limit too.
+        entries.sort()
+        for _, path in entries[:max(len(entries) + 1 - BearerToken.CACHE_MAX_SIZE, 0)]:
+            self.__remove(path)
+
+    @staticmethod
+    def __remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            # Another process evicted it first.
+            pass
+
+    @contextmanager
+    def lock(self, key):
+        with self.__thread_locks.lock(key):
+            if fcntl is None:
+                yield
+                return
+            with open(self.__get_path(key, '.lock'), 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_token_cache_backend = InMemoryTokenCacheBackend()
+
+
+def set_token_cache_backend(backend):
+    """Replace the process-wide bearer token cache; None disables caching."""
+    global _token_cache_backend
+    _token_cache_backend = backend
+
+
+def get_token_cache_backend():
+    return _token_cache_backend
+
+
+def get_token_cache_key(credentials_identity, options):
+    # Hashed, since the identity may be a credentials string holding the private key.
+    options = options or {}
+    key_parts = [
+        credentials_identity,
+        options.get(OptionField.ROLE_IDS),
+        options.get(OptionField.CTX),
+        options.get(CredentialField.TOKEN_URI_OPTION),
+    ]
+    return hashlib.sha256(json.dumps(key_parts, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+def get_credentials_file_identity(credentials_path):
+    """Return the absolute path of a credentials file with its mtime_ns and size, as the
+    credentials file cache keys it, so that a rewritten file gets a token of its own.
+    """
+    credentials_path = os.path.abspath(credentials_path)
+    try:
+        file_stat = os.stat(credentials_path)
+    except OSError:
+        # Minting reports the unreadable file.
+        return credentials_path
+    return [credentials_path, file_stat.st_mtime_ns, file_stat.st_size]
+
+
+def _is_entry_fresh(entry):
+    return entry is not None and time.time() < entry.get('refresh_at', 0)
+
+
+def _build_entry(token):
+    try:
+        claims = jwt.decode(token, options={OptionField.VERIFY_SIGNATURE: False, OptionField.VERIFY_AUD: False,
+                                            OptionField.VERIFY_EXP: False})
+        expires_at = claims[JwtField.EXP]
+    except Exception:
+        return None
+    issued_at = claims.get(JwtField.IAT, time.time())
+    return {
+        'token': token,
+        'refresh_at': issued_at + (expires_at - issued_at) * BearerToken.REFRESH_RATIO,
+        'expires_at': expires_at,
+    }
+
+
+def get_cached_bearer_token(key, generate_token):
+    """Return the cached token for key, calling generate_token to mint one when there is
+    no entry or the entry is due for refresh. Callers racing on one key mint once.
+    """
+    backend = _token_cache_backend
+    if backend is None:
+        return generate_token()
+    entry = backend.get(key)
+    if _is_entry_fresh(entry):
+        return entry['token']
+    with backend.lock(key):
+        entry = backend.get(key)
+        if _is_entry_fresh(entry):
+            return entry['token']
+        token = generate_token()
+        entry = _build_entry(token)
+        if entry is not None:
+            backend.set(key, entry)
+        return token
@@ -1,8 +1,10 @@
 import json
 import datetime
+import os
 import re
 import time
 import jwt
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from urllib.parse import urlparse
 from skyflow.error import SkyflowError
 from skyflow.service_account.client.auth_client import AuthClient
@@ -18,6 +20,16 @@ invalid_input_error_code = SkyflowMessages.ErrorCodes.INVALID_INPUT.value
 
 _CTX_KEY_PATTERN = re.compile(CTX_KEY_REGEX)
 
+# Decoded exp claims by token string, so repeated is_expired checks of the same token skip jwt.decode.
+_TOKEN_EXPIRY_CACHE = {}
+_TOKEN_EXPIRY_CACHE_SIZE = 256
+
+# Parsed credentials files by (path, mtime, size), and loaded private keys by PEM string, so
+# minting a token does not re-read the file or re-parse the key unless the file has changed.
+_CREDENTIALS_FILE_CACHE = {}
+_PRIVATE_KEY_CACHE = {}
+_CREDENTIALS_CACHE_SIZE = 64
+
 _SNAKE_TO_CAMEL_CRED_MAP = {
     'private_key': CredentialField.PRIVATE_KEY,
     'client_id':   CredentialField.CLIENT_ID,
@@ -58,6 +70,17 @@ def _validate_and_resolve_ctx(ctx):
         invalid_input_error_code
     )
 
+def _get_token_expiry(token):
+    expiry = _TOKEN_EXPIRY_CACHE.get(token)
+    if expiry is None:
+        decoded = jwt.decode(
+            token, options={OptionField.VERIFY_SIGNATURE: False, OptionField.VERIFY_AUD: False, OptionField.VERIFY_EXP: False})
+        expiry = decoded[JwtField.EXP]
+        if len(_TOKEN_EXPIRY_CACHE) >= _TOKEN_EXPIRY_CACHE_SIZE:
+            _TOKEN_EXPIRY_CACHE.clear()
+        _TOKEN_EXPIRY_CACHE[token] = expiry
+    return expiry
+
 def is_expired(token, logger = None):
     if token is None:
         return True
@@ -66,9 +89,7 @@ def is_expired(token, logger = None):
         return True
 
     try:
-        decoded = jwt.decode(
-            token, options={OptionField.VERIFY_SIGNATURE: False, OptionField.VERIFY_AUD: False})
-        if time.time() >= decoded[JwtField.EXP]:
+        if time.time() >= _get_token_expiry(token):
             log_info(SkyflowMessages.Info.BEARER_TOKEN_EXPIRED.value, logger)
             log_error_log(SkyflowMessages.ErrorLogs.INVALID_BEARER_TOKEN.value)
             return True
@@ -79,9 +100,13 @@ def is_expired(token, logger = None):
         log_error_log(SkyflowMessages.Error.JWT_DECODE_ERROR.value, logger)
         return True
 
-def generate_bearer_token(credentials_file_path, options = None, logger = None):
-    log_info(SkyflowMessages.Info.GET_BEARER_TOKEN_TRIGGERED.value, logger)
+def _read_credentials_file(credentials_file_path, logger = None):
     try:
+        file_stat = os.stat(credentials_file_path)
+        cache_key = (os.path.abspath(credentials_file_path), file_stat.st_mtime_ns, file_stat.st_size)
+        credentials = _CREDENTIALS_FILE_CACHE.get(cache_key)
+        if credentials is not None:
+            return credentials
         with open(credentials_file_path, 'r') as credentials_file:
             try:
                 credentials = json.load(credentials_file)
@@ -92,6 +117,30 @@ def generate_bearer_token(credentials_file_path, options = None, logger = None):
         raise
     except Exception:
         raise SkyflowError(SkyflowMessages.Error.INVALID_CREDENTIAL_FILE_PATH.value, invalid_input_error_code)
+    if isinstance(credentials, dict):
+        if len(_CREDENTIALS_FILE_CACHE) >= _CREDENTIALS_CACHE_SIZE:
+            _CREDENTIALS_FILE_CACHE.clear()
+        _CREDENTIALS_FILE_CACHE[cache_key] = credentials
+    return credentials
+
+def _load_private_key(private_key):
+    # Keys that cannot be loaded are passed to jwt.encode as they are, which reports them as before.
+    if not isinstance(private_key, str):
+        return private_key
+    loaded_key = _PRIVATE_KEY_CACHE.get(private_key)
+    if loaded_key is None:
+        try:
+            loaded_key = load_pem_private_key(private_key.encode('utf-8'), password=None)
+        except Exception:
+            return private_key
+        if len(_PRIVATE_KEY_CACHE) >= _CREDENTIALS_CACHE_SIZE:
+            _PRIVATE_KEY_CACHE.clear()
+        _PRIVATE_KEY_CACHE[private_key] = loaded_key
+    return loaded_key
+
+def generate_bearer_token(credentials_file_path, options = None, logger = None):
+    log_info(SkyflowMessages.Info.GET_BEARER_TOKEN_TRIGGERED.value, logger)
+    credentials = _read_credentials_file(credentials_file_path, logger)
     result = get_service_account_token(credentials, options, logger)
     return result
 
@@ -138,7 +187,7 @@ def get_service_account_token(credentials, options, logger):
             log_error_log(SkyflowMessages.ErrorLogs.INVALID_TOKEN_URI.value, logger=logger)
             raise SkyflowError(SkyflowMessages.Error.INVALID_TOKEN_URI.value, invalid_input_error_code)
 
-    signed_token = get_signed_jwt(options, client_id, key_id, token_uri, private_key, logger)
+    signed_token = get_signed_jwt(options, client_id, key_id, token_uri, _load_private_key(private_key), logger)
     base_url = get_base_url(token_uri)
     auth_client = AuthClient(base_url)
     auth_api = auth_client.get_auth_api()
@@ -179,6 +228,19 @@ def get_signed_jwt(options, client_id, key_id, token_uri, private_key, logger):
 
 
 
+def _get_signed_data_token_claims(credentials_obj, token, expiry_time, issued_at, resolved_ctx):
+    claims = {
+        JwtField.ISS: JWT.ISSUER_SDK,
+        JwtField.KEY: credentials_obj.get(CredentialField.KEY_ID),
+        JwtField.EXP: expiry_time,
+        JwtField.SUB: credentials_obj.get(CredentialField.CLIENT_ID),
+        JwtField.TOK: token,
+        JwtField.IAT: issued_at,
+    }
+    if resolved_ctx is not None:
+        claims[JwtField.CTX] = resolved_ctx
+    return claims
+
 def get_signed_tokens(credentials_obj, options):
     options = options if options is not None else {}
     credentials_obj = _normalize_credentials(credentials_obj)
@@ -195,19 +257,10 @@ def get_signed_tokens(credentials_obj, options):
         resolved_ctx = _validate_and_resolve_ctx(options[OptionField.CTX])
 
     results = []
+    private_key = _load_private_key(credentials_obj.get(CredentialField.PRIVATE_KEY))
     if options and options.get(OptionField.DATA_TOKENS):
         for token in options[OptionField.DATA_TOKENS]:
-            claims = {
-                JwtField.ISS: JWT.ISSUER_SDK,
-                JwtField.KEY: credentials_obj.get(CredentialField.KEY_ID),
-                JwtField.EXP: expiry_time,
-                JwtField.SUB: credentials_obj.get(CredentialField.CLIENT_ID),
-                JwtField.TOK: token,
-                JwtField.IAT: int(time.time()),
-            }
-            if resolved_ctx is not None:
-                claims[JwtField.CTX] = resolved_ctx
-            private_key = credentials_obj.get(CredentialField.PRIVATE_KEY)
+            claims = _get_signed_data_token_claims(credentials_obj, token, expiry_time, int(time.time()), resolved_ctx)
             try:
                 signed_jwt = jwt.encode(claims, private_key, algorithm=JWT.ALGORITHM_RS256)
             except Exception:
@@ -219,17 +272,7 @@ def get_signed_tokens(credentials_obj, options):
 
 def generate_signed_data_tokens(credentials_file_path, options):
     log_info(SkyflowMessages.Info.GET_SIGNED_DATA_TOKENS_TRIGGERED.value)
-    try:
-        with open(credentials_file_path, 'r') as credentials_file:
-            try:
-                credentials = json.load(credentials_file)
-            except Exception:
-                raise SkyflowError(SkyflowMessages.Error.FILE_INVALID_JSON.value.format(credentials_file_path),
-                                   invalid_input_error_code)
-    except SkyflowError:
-        raise
-    except Exception:
-        raise SkyflowError(SkyflowMessages.Error.INVALID_CREDENTIAL_FILE_PATH.value, invalid_input_error_code)
+    credentials = _read_credentials_file(credentials_file_path)
     return get_signed_tokens(credentials, options)
 
 def generate_signed_data_tokens_from_creds(credentials, options):
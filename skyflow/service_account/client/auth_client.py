@@ -1,5 +1,12 @@
+import threading
+import httpx
 from skyflow.generated.rest.client import Skyflow
-from skyflow.utils.constants import OPTIONAL_TOKEN
+from skyflow.utils.constants import OPTIONAL_TOKEN, HttpClient
+
+# Auth API clients by base url. They carry no per-caller state, so every token mint against
+# the same token_uri reuses one client and its warm connections.
+_API_CLIENTS = {}
+_API_CLIENTS_LOCK = threading.Lock()
 
 class AuthClient:
     def __init__(self, url):
@@ -7,7 +14,13 @@ class AuthClient:
         self.__api_client = self.initialize_api_client()
 
     def initialize_api_client(self):
-        return Skyflow(base_url=self.__url, token=OPTIONAL_TOKEN)
+        with _API_CLIENTS_LOCK:
+            api_client = _API_CLIENTS.get(self.__url)
+            if api_client is None:
+                http_client = httpx.Client(timeout=HttpClient.TIMEOUT, follow_redirects=True)
+                api_client = Skyflow(base_url=self.__url, token=OPTIONAL_TOKEN, httpx_client=http_client)
+                _API_CLIENTS[self.__url] = api_client
+            return api_client
 
     def get_auth_api(self):
-        return self.__api_client.authentication
\ No newline at end of file
+        return self.__api_client.authentication
@@ -2,4 +2,4 @@ from ..utils.enums import LogLevel, Env, TokenType
 from ._skyflow_messages import SkyflowMessages
 from ._version import SDK_VERSION
 from ._helpers import get_base_url, format_scope, is_valid_url
-from ._utils import get_credentials, get_vault_url, construct_invoke_connection_request, get_metrics, parse_insert_response, handle_exception, parse_update_record_response, parse_delete_response, parse_detokenize_response, parse_tokenize_response, parse_query_response, parse_get_response, parse_invoke_connection_response, validate_api_key, encode_column_values, parse_deidentify_text_response, parse_reidentify_text_response, convert_detected_entity_to_entity_info 
+from ._utils import get_credentials, get_vault_url, construct_invoke_connection_request, get_metrics, get_metrics_headers, construct_insert_records, get_chunks, get_async_chunks, get_insert_chunk_request, get_insert_chunk_requests, get_skyflow_error, get_chunk_errors, merge_chunk_results, merge_insert_responses, merge_update_responses, get_get_many_fields, merge_get_responses, merge_delete_responses, is_retryable_error, construct_update_record, construct_update_batch_records, construct_get_records_params, construct_get_page_params, get_page_ranges, construct_detokenize_records, construct_tokenize_records, get_tokenize_value_key, get_distinct_tokenize_values, merge_tokenize_response, open_file_for_file_upload, parse_insert_response, handle_exception, parse_update_record_response, parse_update_batch_response, parse_delete_response, parse_detokenize_response, parse_detokenize_records, parse_detokenize_batch_records, parse_tokenize_response, parse_query_response, parse_query_rows, split_query_limit, is_query_ordered, get_query_page, parse_get_response, parse_invoke_connection_response, validate_api_key, encode_column_values, parse_deidentify_text_response, parse_reidentify_text_response, convert_detected_entity_to_entity_info 
@@ -0,0 +1,101 @@
+import base64
+import io
+import os
+import re
+
+from .constants import FileProcessing
+
+_NON_BASE64_CHARS = re.compile(rb'[^A-Za-z0-9+/=]')
+
+
+def iter_base64_chunks(base64_str, chunk_size = FileProcessing.STREAM_CHUNK_SIZE):
+    """Yield the bytes that base64_str decodes to, about chunk_size bytes at a time.
+
+    Like base64.b64decode, base64_str may be str or bytes, characters outside the base64
+    alphabet are ignored, and ValueError is raised for non-ASCII or incorrectly padded input.
+    """
+    step = max(chunk_size // 3, 1) * 4
+    pending = b''
+    for start in range(0, len(base64_str), step):
+        piece = base64_str[start:start + step]
+        if isinstance(piece, str):
+            piece = piece.encode('ascii')
+        # Decode whole 4-character quanta so that chunk boundaries never split one.
+        quanta = pending + _NON_BASE64_CHARS.sub(b'', piece)
+        whole = len(quanta) - len(quanta) % 4
+        pending = quanta[whole:]
+        if whole:
+            yield base64.b64decode(quanta[:whole])
+    if pending:
+        yield base64.b64decode(pending)
+
+
+def encode_file_to_base64(file_obj, chunk_size = FileProcessing.STREAM_CHUNK_SIZE):
+    """Return the base64 encoding of everything file_obj reads, as a str, reading and
+    encoding about chunk_size bytes at a time instead of reading the whole file first.
+    """
+    chunk_size = max(chunk_size // 3, 1) * 3
+    encoded_chunks = []
+    chunk = file_obj.read(chunk_size)
+    while chunk:
+        # Only the last chunk may be padded, so top up a short read to whole 3-byte groups.
+        while len(chunk) % 3:
+            rest = file_obj.read(3 - len(chunk) % 3)
+            if not rest:
+                break
+            chunk += rest
+        encoded_chunks.append(base64.b64encode(chunk).decode('ascii'))
+        chunk = file_obj.read(chunk_size)
+    return ''.join(encoded_chunks)
+
+
+class Base64Reader(io.RawIOBase):
+    """Read-only binary stream over the bytes that a base64 string decodes to, decoded
+    chunk by chunk as it is read.
+
+    Seeking is limited to rewinding and to finding the decoded length, which is all a
+    multipart upload needs.
+    """
+    def __init__(self, base64_str, chunk_size = FileProcessing.STREAM_CHUNK_SIZE):
+        self.__base64_str = base64_str
+        self.__chunk_size = chunk_size
+        self.__length = None
+        self.__rewind()
+
+    def __rewind(self):
+        self.__chunks = iter_base64_chunks(self.__base64_str, self.__chunk_size)
+        self.__buffer = b''
+        self.__position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.__buffer:
+            self.__buffer = next(self.__chunks, b'')
+            if not self.__buffer:
+                return 0
+        size = min(len(buffer), len(self.__buffer))
+        buffer[:size] = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        self.__position += size
+        return size
+
+    def tell(self):
+        return self.__position
+
+    def seek(self, offset, whence = os.SEEK_SET):
+        if whence == os.SEEK_END and offset == 0:
+            if self.__length is None:
+                self.__length = sum(len(chunk) for chunk in iter_base64_chunks(self.__base64_str, self.__chunk_size))
+            self.__chunks = iter(())
+            self.__buffer = b''
+            self.__position = self.__length
+        elif whence == os.SEEK_SET and offset == 0:
+            self.__rewind()
+        elif not (whence == os.SEEK_SET and offset == self.__position):
+            raise io.UnsupportedOperation('seek')
+        return self.__position
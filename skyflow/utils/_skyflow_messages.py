@@ -25,6 +25,11 @@ class SkyflowMessages:
         INVALID_CLUSTER_ID = f"{error_prefix} Initialization failed. Invalid cluster Id for vault with id {{}}. Specify cluster Id as a string."
         INVALID_ENV = f"{error_prefix} Initialization failed. Invalid env for vault with id {{}}. Specify a valid env."
         INVALID_KEY = f"{error_prefix} Initialization failed. Invalid {{}}. Specify a valid key"
+        INVALID_CONNECTION_LIMIT = f"{error_prefix} Initialization failed. Invalid {{}} for {{}} with id {{}}. Specify a positive integer."
+        INVALID_HTTP_TIMEOUT = f"{error_prefix} Initialization failed. Invalid {{}} for {{}} with id {{}}. Specify a positive number of seconds."
+        INVALID_MAX_RETRIES = f"{error_prefix} Initialization failed. Invalid max_retries for {{}} with id {{}}. Specify a non-negative integer."
+        INVALID_HTTP2 = f"{error_prefix} Initialization failed. Invalid http2 for {{}} with id {{}}. Specify http2 as a boolean."
+        HTTP2_NOT_INSTALLED = f"{error_prefix} Initialization failed. http2 is enabled for {{}} with id {{}} but the 'h2' package is not installed. Install it with `pip install httpx[http2]`."
         VAULT_ID_NOT_IN_CONFIG_LIST = f"{error_prefix} Validation error. Vault id {{}} is missing from the config. Specify the vault id from configs."
         EMPTY_VAULT_CONFIGS = f"{error_prefix} Validation error. Specify at least one vault config."
         EMPTY_CONNECTION_CONFIGS = f"{error_prefix} Validation error. Specify at least one connection config."
@@ -103,6 +108,19 @@ class SkyflowMessages:
         BATCH_INSERT_FAILURE = f"{error_prefix} Insert operation failed."
         GET_FAILURE = f"{error_prefix} Get operation failed."
         HOMOGENOUS_NOT_SUPPORTED_WITH_UPSERT = f"{error_prefix} Validation error. Homogenous is not supported when upsert is passed."
+        INVALID_BULK_OPTION = f"{error_prefix} Validation error. Invalid {{}} in {{}} request. Specify {{}} as a positive integer."
+        INVALID_CACHE_COLUMN_GROUPS = f"{error_prefix} Validation error. Invalid column_groups in TOKENIZE request. Specify column_groups as a non-empty list of column group names."
+        INVALID_GET_MANY_OPTIONS = f"{error_prefix} Validation error. Invalid get many request. Specify ids, and do not specify offset, limit, column_name or column_values."
+        INVALID_BULK_RETRIES = f"{error_prefix} Validation error. Invalid max_retries in {{}} request. Specify max_retries as a non-negative integer."
+        INVALID_UPDATE_MANY_DATA = f"{error_prefix} Validation error. Invalid data in UPDATE request. Specify data as a non-empty list of records, each with a skyflow_id."
+        INVALID_UPDATE_MANY_TOKENS = f"{error_prefix} Validation error. Invalid tokens in UPDATE request. Specify tokens as a list with one entry per record in data."
+        INVALID_FILE_UPLOAD_BATCH_REQUESTS = f"{error_prefix} Validation error. Invalid requests in file upload batch. Specify requests as a list or iterable of FileUploadRequest."
+        INVALID_CHECKPOINT_PATH = f"{error_prefix} Validation error. Invalid checkpoint_path in file upload batch. Specify checkpoint_path as the path of a file in an existing directory."
+        INVALID_PROGRESS_CALLBACK = f"{error_prefix} Validation error. Invalid on_progress in file upload batch. Specify on_progress as a callable."
+        INVALID_DEIDENTIFY_FILES_REQUESTS = f"{error_prefix} Validation error. Invalid requests in deidentify files. Specify requests as a list or iterable of DeidentifyFileRequest."
+        INVALID_PAGE_SIZE = f"{error_prefix} Validation error. Invalid page_size in {{}} request. Specify page_size as an integer from 1 to {{}}."
+        INVALID_DURATION_OPTION = f"{error_prefix} Validation error. Invalid {{}} in {{}} request. Specify {{}} as a non-negative number of seconds."
+        INVALID_QUERY_LIMIT = f"{error_prefix} Validation error. Invalid LIMIT or OFFSET in iterate query request. End the query with at most one LIMIT count and one OFFSET start, or with LIMIT start, count."
 
         EMPTY_TABLE_VALUE = f"{error_prefix} Validation error. 'table' can't be empty. Specify a table."
         INVALID_TABLE_VALUE = f"{error_prefix} Validation error. Invalid type of table. Specify table as a string"
@@ -117,6 +135,8 @@ class SkyflowMessages:
         SERVER_ERROR = f"{error_prefix} Validation error. Check SkyflowError.data for details."
         QUERY_FAILED = f"{error_prefix} Query operation failed."
         DETOKENIZE_FIELD = f"{error_prefix} Detokenize operation failed."
+        DETOKENIZE_BATCH_MISMATCH = f"{error_prefix} Detokenize operation failed. The records returned for the batch don't match the tokens sent."
+        DETOKENIZE_BATCH_TIMED_OUT = f"{error_prefix} Detokenize operation failed. The batch it joined wasn't answered within {{}} seconds."
         UPDATE_FAILED = f"{error_prefix} Update operation failed."
         TOKENIZE_FAILED = f"{error_prefix} Tokenize operation failed."
         INVOKE_CONNECTION_FAILED = f"{error_prefix} Invoke Connection operation failed."
@@ -250,28 +270,38 @@ class SkyflowMessages:
         DETECT_FILE_TRIGGERED = f"{INFO}: [{error_prefix}] Detect file method triggered."
         DETECT_FILE_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Deidentify file request resolved."
         DETECT_FILE_SUCCESS = f"{INFO}: [{error_prefix}] File deidentified."
+        DETECT_FILE_SUBMITTED = f"{INFO}: [{error_prefix}] File submitted for deidentification. Polling its run in the background."
+        DETECT_FILES_TRIGGERED = f"{INFO}: [{error_prefix}] Deidentify files method triggered. Submitting up to {{}} files at a time."
+        DETECT_FILES_SUCCESS = f"{INFO}: [{error_prefix}] Files deidentified. {{}} completed, {{}} still in progress, {{}} failed."
 
         VALIDATE_INSERT_REQUEST = f"{INFO}: [{error_prefix}] Validating insert request."
         INSERT_TRIGGERED = f"{INFO}: [{error_prefix}] Insert method triggered."
         INSERT_SUCCESS = f"{INFO}: [{error_prefix}] Data inserted."
         INSERT_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Insert request resolved."
+        INSERT_CHUNKS_TRIGGERED = f"{INFO}: [{error_prefix}] Insert many method triggered. Sending {{}} chunks."
 
         VALIDATE_UPDATE_REQUEST = f"{INFO}: [{error_prefix}] Validating update request."
         UPDATE_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Update request resolved."
         UPDATE_SUCCESS = f"{INFO}: [{error_prefix}] Data updated."
         UPDATE_TRIGGERED = f"{INFO}: [{error_prefix}] Update method triggered."
+        UPDATE_CHUNKS_TRIGGERED = f"{INFO}: [{error_prefix}] Update many method triggered. Sending {{}} chunks."
 
         DELETE_TRIGGERED = f"{INFO}: [{error_prefix}] Delete method triggered."
+        DELETE_CHUNKS_TRIGGERED = f"{INFO}: [{error_prefix}] Delete many method triggered. Sending {{}} chunks."
+        DELETE_CHUNK_RETRIED = f"{INFO}: [{error_prefix}] Delete chunk failed with a retryable error. Retrying in {{}} seconds."
         VALIDATING_DELETE_REQUEST = f"{INFO}: [{error_prefix}] Validating delete request."
         DELETE_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Delete request resolved."
         DELETE_SUCCESS = f"{INFO}: [{error_prefix}] Data deleted."
 
         GET_TRIGGERED = f"{INFO}: [{error_prefix}] Get method triggered."
+        GET_CHUNKS_TRIGGERED = f"{INFO}: [{error_prefix}] Get many method triggered. Sending {{}} chunks of skyflow IDs."
+        ITER_RECORDS_TRIGGERED = f"{INFO}: [{error_prefix}] Iterate records method triggered. Reading {{}} in pages of {{}} records."
         VALIDATE_GET_REQUEST = f"{INFO}: [{error_prefix}] Validating get request."
         GET_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Get request resolved."
         GET_SUCCESS = f"{INFO}: [{error_prefix}] Data revealed."
 
         QUERY_TRIGGERED = f"{INFO}: [{error_prefix}] Query method triggered."
+        ITER_QUERY_TRIGGERED = f"{INFO}: [{error_prefix}] Iterate query method triggered. Reading rows in pages of {{}}."
         VALIDATING_QUERY_REQUEST = f"{INFO}: [{error_prefix}] Validating query request."
         QUERY_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Query request resolved."
         QUERY_SUCCESS = f"{INFO}: [{error_prefix}] Query executed."
@@ -280,8 +310,11 @@ class SkyflowMessages:
         VALIDATE_DETOKENIZE_REQUEST = f"{INFO}: [{error_prefix}] Validating detokenize request."
         DETOKENIZE_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Detokenize request resolved."
         DETOKENIZE_SUCCESS = f"{INFO}: [{error_prefix}] Data detokenized."
+        DETOKENIZE_CACHE_HITS = f"{INFO}: [{error_prefix}] Detokenize cache returned {{}} of {{}} tokens."
+        DETOKENIZE_BATCH_TRIGGERED = f"{INFO}: [{error_prefix}] Detokenize batch triggered. Sending {{}} tokens for {{}} requests."
 
         TOKENIZE_TRIGGERED = f"{INFO}: [{error_prefix}] Tokenize method triggered."
+        TOKENIZE_VALUES_RESOLVED = f"{INFO}: [{error_prefix}] Tokenize request resolved to {{}} distinct uncached values out of {{}}."
         VALIDATING_TOKENIZE_REQUEST = f"{INFO}: [{error_prefix}] Validating tokenize request."
         TOKENIZE_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] Tokenize request resolved."
         TOKENIZE_SUCCESS = f"{INFO}: [{error_prefix}] Data tokenized."
@@ -290,6 +323,8 @@ class SkyflowMessages:
         VALIDATING_FILE_UPLOAD_REQUEST = f"{INFO}: [{error_prefix}] Validating file upload request."
         FILE_UPLOAD_REQUEST_RESOLVED = f"{INFO}: [{error_prefix}] File upload request resolved."
         FILE_UPLOAD_SUCCESS = f"{INFO}: [{error_prefix}] File uploaded successfully."
+        FILE_UPLOAD_BATCH_TRIGGERED = f"{INFO}: [{error_prefix}] Upload files method triggered. Uploading up to {{}} files at a time."
+        FILE_UPLOAD_BATCH_SUCCESS = f"{INFO}: [{error_prefix}] Files uploaded. {{}} uploaded, {{}} skipped as already uploaded, {{}} failed."
 
         INVOKE_CONNECTION_TRIGGERED = f"{INFO}: [{error_prefix}] Invoke connection method triggered."
         VALIDATING_INVOKE_CONNECTION_REQUEST = f"{INFO}: [{error_prefix}] Validating invoke connection request."
@@ -326,6 +361,9 @@ class SkyflowMessages:
         CLUSTER_ID_IS_REQUIRED = f"{ERROR}: [{error_prefix}] Invalid vault config. Cluster ID is required."
         EMPTY_CLUSTER_ID = f"{ERROR}: [{error_prefix}] Invalid vault config. Cluster ID can not be empty."
         ENV_IS_REQUIRED = f"{ERROR}: [{error_prefix}] Invalid vault config. Env is required."
+        INVALID_HTTP_CLIENT_OPTION = f"{ERROR}: [{error_prefix}] Invalid {{}} config. {{}} is invalid."
+        INVALID_BULK_OPTION = f"{ERROR}: [{error_prefix}] Invalid {{}} request. {{}} is invalid."
+        INVALID_QUERY_LIMIT = f"{ERROR}: [{error_prefix}] Invalid iterate query request. LIMIT or OFFSET clause can't be read."
         CONNECTION_ID_IS_REQUIRED = f"{ERROR}: [{error_prefix}] Invalid connection config. Connection ID is required."
         EMPTY_CONNECTION_ID = f"{ERROR}: [{error_prefix}] Invalid connection config. Connection ID can not be empty."
         CONNECTION_URL_IS_REQUIRED = f"{ERROR}: [{error_prefix}] Invalid connection config. Connection URL is required."
@@ -429,6 +467,10 @@ class SkyflowMessages:
             "Old positional order: (table, skyflow_id, column_name). "
             "New order: FileUploadRequest(table, column_name=..., skyflow_id=...)."
         )
+        ITER_QUERY_WITHOUT_ORDER_BY = (
+            f"{WARN}: [{error_prefix}] Iterate query has no ORDER BY. Its pages are read by OFFSET, "
+            "so without a stable order rows can be skipped or repeated across pages."
+        )
 
 
 
@@ -10,11 +10,14 @@ import requests
 import platform
 import sys
 import re
+import types
+from contextlib import contextmanager
 from urllib.parse import quote
 from skyflow.error import SkyflowError
 from skyflow.generated.rest import V1UpdateRecordResponse, V1BulkDeleteRecordResponse, \
     V1DetokenizeResponse, V1TokenizeResponse, V1GetQueryResponse, V1BulkGetRecordResponse, \
-    DeidentifyStringResponse, ErrorResponse, IdentifyResponse
+    DeidentifyStringResponse, ErrorResponse, IdentifyResponse, V1FieldRecords, V1BatchRecord, \
+    V1TokenizeRecordRequest, V1DetokenizeRecordRequest
 from skyflow.generated.rest.core.http_response import HttpResponse
 from skyflow.utils.logger import log_error_log
 from skyflow.vault.detect import DeidentifyTextResponse, ReidentifyTextResponse
@@ -22,9 +25,11 @@ from skyflow.vault.detect import EntityInfo, TextIndex
 from . import SkyflowMessages, SDK_VERSION
 from .constants import (PROTOCOL, HttpHeader, ApiKey, ContentType as ContentTypeConstants, 
                         EncodingType, BooleanString, ResponseField, CredentialField, SdkPrefix, 
-                        SdkMetricsKey, ErrorDefaults, HttpStatusCode)
-from .enums import Env, ContentType, EnvUrls
-from skyflow.vault.data import InsertResponse, UpdateResponse, DeleteResponse, QueryResponse, GetResponse
+                        SdkMetricsKey, ErrorDefaults, HttpStatusCode, RequestParameter, FileUploadField, SKY_META_DATA_HEADER, BulkOperation, SqlCommand)
+from .enums import Env, ContentType, EnvUrls, RequestMethod
+from .enums.redaction_type import RedactionType
+from ._base64_stream import Base64Reader
+from skyflow.vault.data import InsertRequest, InsertResponse, UpdateResponse, UpdateManyResponse, DeleteResponse, QueryResponse, QueryRow, GetResponse
 from .validations import validate_invoke_connection_params
 from ..vault.connection import InvokeConnectionResponse
 from ..vault.tokens import DetokenizeResponse, TokenizeResponse
@@ -261,6 +266,165 @@ def get_metrics():
     })
     return _CACHED_METRICS
 
+_CACHED_METRICS_HEADERS: dict = {}
+
+def get_metrics_headers():
+    # The sky-metadata header is serialized once per process and shared by reference, read-only.
+    if not _CACHED_METRICS_HEADERS:
+        _CACHED_METRICS_HEADERS[SKY_META_DATA_HEADER] = json.dumps(get_metrics())
+    return types.MappingProxyType(_CACHED_METRICS_HEADERS)
+
+def construct_insert_records(request):
+    if request.continue_on_error:
+        batch_record_list = []
+        for i, value in enumerate(request.values):
+            token = request.tokens[i] if request.tokens is not None and i < len(request.tokens) else None
+            batch_record = V1BatchRecord(
+                fields=value,
+                table_name=request.table,
+                method=RequestMethod.POST.value,
+                tokenization=request.return_tokens,
+                upsert=request.upsert,
+                tokens=token
+            )
+            batch_record_list.append(batch_record)
+        return batch_record_list
+
+    if request.tokens is None:
+        return [V1FieldRecords(fields=record) for record in request.values]
+
+    bulk_record_list = []
+    for i, value in enumerate(request.values):
+        token = request.tokens[i] if i < len(request.tokens) else None
+        bulk_record_list.append(V1FieldRecords(fields=value, tokens=token))
+    return bulk_record_list
+
+def construct_update_record(request):
+    field = {key: value for key, value in request.data.items() if key != ResponseField.SKYFLOW_ID}
+    return V1FieldRecords(fields=field, tokens=request.tokens)
+
+def construct_update_batch_records(request, chunk_start, chunk):
+    batch_records = []
+    for position, data in enumerate(chunk):
+        token = request.tokens[chunk_start + position] if request.tokens is not None else None
+        batch_records.append(V1BatchRecord(
+            fields={key: value for key, value in data.items() if key != ResponseField.SKYFLOW_ID},
+            table_name=request.table,
+            method=RequestMethod.PUT.value,
+            id=data.get(ResponseField.SKYFLOW_ID),
+            tokenization=request.return_tokens,
+            tokens=token
+        ))
+    return batch_records
+
+def construct_get_records_params(request, ids, fields):
+    return {
+        'object_name': request.table,
+        'skyflow_ids': ids,
+        'redaction': request.redaction_type.value if request.redaction_type is not None else None,
+        'tokenization': request.return_tokens,
+        'fields': fields,
+        'offset': request.offset,
+        'limit': request.limit,
+        'download_url': request.download_url,
+        'column_name': request.column_name,
+        'column_values': request.column_values
+    }
+
+def construct_get_page_params(table, fields, redaction_type, offset, limit):
+    return {
+        'object_name': table,
+        'redaction': redaction_type.value if redaction_type is not None else None,
+        'fields': fields,
+        'offset': str(offset),
+        'limit': str(limit)
+    }
+
+def get_page_ranges(page_size, limit=None, offset=0):
+    """Yield the (offset, limit) of each page of at most page_size rows from offset, until
+    limit rows are covered, or without end when limit is None.
+    """
+    while limit is None or limit > 0:
+        page_limit = page_size if limit is None else min(page_size, limit)
+        yield offset, page_limit
+        offset += page_limit
+        if limit is not None:
+            limit -= page_limit
+
+def construct_detokenize_records(request):
+    return [
+        V1DetokenizeRecordRequest(
+            token=item.get(ResponseField.TOKEN),
+            redaction=item.get(RequestParameter.REDACTION_TYPE) or item.get(RequestParameter.REDACTION, RedactionType.DEFAULT)
+        )
+        for item in request.data
+    ]
+
+def construct_tokenize_records(request):
+    return [
+        V1TokenizeRecordRequest(value=item[RequestParameter.VALUE], column_group=item[RequestParameter.COLUMN_GROUP])
+        for item in request.values
+    ]
+
+def get_tokenize_value_key(item):
+    # The type is part of the key so that e.g. 1 and True are not treated as one value.
+    value = item[RequestParameter.VALUE]
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return item[RequestParameter.COLUMN_GROUP], type(value).__name__, value
+
+def get_distinct_tokenize_values(values):
+    """Return the distinct (value, column_group) items of values and, for each item of
+    values, the position of its distinct item. Unhashable values are never merged.
+    """
+    distinct_values = []
+    positions = []
+    seen = {}
+    for item in values:
+        key = get_tokenize_value_key(item)
+        if key is not None and key in seen:
+            positions.append(seen[key])
+            continue
+        if key is not None:
+            seen[key] = len(distinct_values)
+        positions.append(len(distinct_values))
+        distinct_values.append(item)
+    return distinct_values, positions
+
+def merge_tokenize_response(tokenize_response, positions, cached_fields):
+    """Fan the fields of tokenize_response, which answers the distinct uncached values, back
+    out to one field per requested value, taking cached fields where there are any.
+    """
+    tokenized_fields = tokenize_response.tokenized_fields
+    uncached_positions = iter(positions)
+    merged_fields = [dict(cached_field) if cached_field is not None else dict(tokenized_fields[next(uncached_positions)])
+                     for cached_field in cached_fields]
+    return TokenizeResponse(tokenized_fields=merged_fields, errors=tokenize_response.errors)
+
+@contextmanager
+def open_file_for_file_upload(request):
+    """Yield the (file_name, file) to upload for request, where file is a stream that is
+    read chunk by chunk as the multipart body is sent. A file opened from file_path is
+    closed on exit; a file_object passed by the caller is left open.
+    """
+    if request.file_path:
+        if not request.file_name:
+            request.file_name = os.path.basename(request.file_path)
+
+        with open(request.file_path, "rb") as f:
+            yield (request.file_name, f)
+
+    elif request.base64 and request.file_name:
+        yield (request.file_name, Base64Reader(request.base64))
+
+    elif request.file_object is not None and hasattr(request.file_object, FileUploadField.NAME) and request.file_object.name:
+        yield (os.path.basename(request.file_object.name), request.file_object)
+
+    else:
+        yield None
+
 def parse_insert_response(api_response, continue_on_error):
     # Retrieve the headers and data from the API response
     api_response_headers = api_response.headers
@@ -310,6 +474,159 @@ def parse_insert_response(api_response, continue_on_error):
 
     return insert_response
 
+def get_chunks(values, chunk_size, max_chunk_bytes = None):
+    """Yield (start_index, chunk) pairs of consecutive values, with at most chunk_size values and,
+    when max_chunk_bytes is set, at most that many bytes of JSON per chunk. A single value larger
+    than max_chunk_bytes is sent in a chunk of its own. values may be any iterable; it is consumed lazily.
+    """
+    chunk, chunk_start, chunk_bytes = [], 0, 0
+    for index, value in enumerate(values):
+        value_bytes = len(json.dumps(value, default=str)) if max_chunk_bytes else 0
+        if chunk and (len(chunk) >= chunk_size or (max_chunk_bytes and chunk_bytes + value_bytes > max_chunk_bytes)):
+            yield chunk_start, chunk
+            chunk, chunk_start, chunk_bytes = [], index, 0
+        chunk.append(value)
+        chunk_bytes += value_bytes
+    if chunk:
+        yield chunk_start, chunk
+
+async def get_async_chunks(values, chunk_size, max_chunk_bytes = None):
+    """Async counterpart of get_chunks for async iterables."""
+    chunk, chunk_start, chunk_bytes, index = [], 0, 0, 0
+    async for value in values:
+        value_bytes = len(json.dumps(value, default=str)) if max_chunk_bytes else 0
+        if chunk and (len(chunk) >= chunk_size or (max_chunk_bytes and chunk_bytes + value_bytes > max_chunk_bytes)):
+            yield chunk_start, chunk
+            chunk, chunk_start, chunk_bytes = [], index, 0
+        chunk.append(value)
+        chunk_bytes += value_bytes
+        index += 1
+    if chunk:
+        yield chunk_start, chunk
+
+def get_insert_chunk_request(request, chunk_start, values, tokens = None):
+    if tokens is None and isinstance(request.tokens, list):
+        tokens = request.tokens[chunk_start:chunk_start + len(values)]
+    return InsertRequest(
+        table=request.table,
+        values=values,
+        tokens=tokens or None,
+        upsert=request.upsert,
+        homogeneous=request.homogeneous,
+        token_mode=request.token_mode,
+        return_tokens=request.return_tokens,
+        continue_on_error=request.continue_on_error
+    )
+
+def get_insert_chunk_requests(request):
+    """Yield (chunk_start, InsertRequest) for each chunk of a bulk insert request. values, and
+    tokens when it is not a list, may be any iterables and are consumed one chunk at a time.
+    """
+    if request.tokens is None or isinstance(request.tokens, list):
+        for chunk_start, values in get_chunks(request.values, request.chunk_size, request.max_chunk_bytes):
+            yield chunk_start, get_insert_chunk_request(request, chunk_start, values)
+    else:
+        records = zip(request.values, request.tokens)
+        for chunk_start, chunk in get_chunks(records, request.chunk_size, request.max_chunk_bytes):
+            yield chunk_start, get_insert_chunk_request(request, chunk_start, [value for value, _ in chunk],
+                                                        [token for _, token in chunk])
+
+def get_skyflow_error(error, logger = None):
+    if isinstance(error, SkyflowError):
+        return error
+    try:
+        handle_exception(error, logger)
+    except SkyflowError as skyflow_error:
+        return skyflow_error
+
+def get_chunk_errors(error, chunk_start, chunk_length):
+    return [{
+        ResponseField.REQUEST_INDEX: chunk_start + position,
+        ResponseField.REQUEST_ID: error.request_id,
+        ResponseField.ERROR: error.message,
+        ResponseField.HTTP_CODE: error.http_code,
+    } for position in range(chunk_length)]
+
+def merge_chunk_results(chunk_results, get_fields):
+    """Merge (chunk_start, chunk_length, response or SkyflowError) results into one list of
+    fields and one list of errors, whose request_index values refer to positions in the
+    original request. get_fields returns a response's fields. A failed chunk contributes one
+    error per value it held.
+    """
+    fields = []
+    errors = []
+    for chunk_start, chunk_length, result in chunk_results:
+        if isinstance(result, SkyflowError):
+            errors.extend(get_chunk_errors(result, chunk_start, chunk_length))
+            continue
+        for position, field in enumerate(get_fields(result) or []):
+            request_index = field.get(ResponseField.REQUEST_INDEX, position)
+            fields.append({**field, ResponseField.REQUEST_INDEX: chunk_start + request_index})
+        for error in result.errors or []:
+            errors.append({**error, ResponseField.REQUEST_INDEX: chunk_start + error[ResponseField.REQUEST_INDEX]})
+    return fields, errors if len(errors) > 0 else None
+
+def merge_insert_responses(chunk_results):
+    inserted_fields, errors = merge_chunk_results(chunk_results, lambda response: response.inserted_fields)
+    return InsertResponse(inserted_fields=inserted_fields, errors=errors)
+
+def merge_update_responses(chunk_results):
+    updated_fields, errors = merge_chunk_results(chunk_results, lambda response: response.updated_fields)
+    return UpdateManyResponse(updated_fields=updated_fields, errors=errors)
+
+def is_retryable_error(error):
+    if isinstance(error, (httpx.ConnectError, httpx.TimeoutException)):
+        return True
+    return getattr(error, 'status_code', None) in BulkOperation.RETRY_STATUS_CODES
+
+def merge_delete_responses(chunk_results):
+    """Merge (chunk_start, chunk_ids, DeleteResponse or SkyflowError) results into one
+    DeleteResponse. A failed chunk contributes one error per ID it held, with that ID and
+    its request_index.
+    """
+    deleted_ids = []
+    errors = []
+    for chunk_start, chunk_ids, result in chunk_results:
+        if isinstance(result, SkyflowError):
+            for skyflow_id, error in zip(chunk_ids, get_chunk_errors(result, chunk_start, len(chunk_ids))):
+                errors.append({**error, ResponseField.SKYFLOW_ID: skyflow_id})
+            continue
+        deleted_ids.extend(result.deleted_ids or [])
+    return DeleteResponse(deleted_ids=deleted_ids, errors=errors if len(errors) > 0 else None)
+
+def get_get_many_fields(fields):
+    """Return the fields to fetch for get_many, which adds skyflow_id to a field list that lacks
+    it, so that records can be put back in the order of the requested IDs.
+    """
+    if fields is None or ResponseField.SKYFLOW_ID in fields:
+        return fields
+    return fields + [ResponseField.SKYFLOW_ID]
+
+def merge_get_responses(chunk_results, fields = None):
+    """Merge (chunk_start, chunk_ids, GetResponse or SkyflowError) results into one
+    GetResponse, whose records are in the order of the requested IDs. A failed chunk
+    contributes one error per ID it held, with that ID and its request_index, so an ID that
+    is in neither data nor errors was not found. fields is the field list of the request: a
+    skyflow_id added to it by get_get_many_fields is removed from the records again.
+    """
+    strip_skyflow_id = fields is not None and ResponseField.SKYFLOW_ID not in fields
+    data = []
+    errors = []
+    for chunk_start, chunk_ids, result in chunk_results:
+        if isinstance(result, SkyflowError):
+            for skyflow_id, error in zip(chunk_ids, get_chunk_errors(result, chunk_start, len(chunk_ids))):
+                errors.append({**error, ResponseField.SKYFLOW_ID: skyflow_id})
+            continue
+        records_by_id = {record.get(ResponseField.SKYFLOW_ID): record for record in result.data}
+        for skyflow_id in chunk_ids:
+            record = records_by_id.get(skyflow_id)
+            if record is None:
+                continue
+            if strip_skyflow_id:
+                record = {field: value for field, value in record.items() if field != ResponseField.SKYFLOW_ID}
+            data.append(record)
+    return GetResponse(data=data, errors=errors if len(errors) > 0 else None)
+
 def parse_update_record_response(api_response: V1UpdateRecordResponse):
     update_response = UpdateResponse()
     updated_field = dict()
@@ -321,6 +638,31 @@ def parse_update_record_response(api_response: V1UpdateRecordResponse):
 
     return update_response
 
+def parse_update_batch_response(api_response):
+    request_id = api_response.headers.get(HttpHeader.X_REQUEST_ID)
+    updated_fields = []
+    errors = []
+    for index, response in enumerate(api_response.data.responses):
+        body = response.get(ResponseField.BODY) or {}
+        if response.get(ResponseField.STATUS) == HttpStatusCode.OK:
+            records = body.get(ResponseField.RECORDS, [body])
+            for record in records:
+                updated_field = {
+                    ResponseField.SKYFLOW_ID: record.get(ResponseField.SKYFLOW_ID),
+                    ResponseField.REQUEST_INDEX: index
+                }
+                if record.get(ResponseField.TOKENS):
+                    updated_field.update(record[ResponseField.TOKENS])
+                updated_fields.append(updated_field)
+        else:
+            errors.append({
+                ResponseField.REQUEST_INDEX: index,
+                ResponseField.REQUEST_ID: request_id,
+                ResponseField.ERROR: body.get(ResponseField.ERROR),
+                ResponseField.HTTP_CODE: response.get(ResponseField.STATUS),
+            })
+    return UpdateManyResponse(updated_fields=updated_fields, errors=errors if len(errors) > 0 else None)
+
 def parse_delete_response(api_response: V1BulkDeleteRecordResponse):
     delete_response = DeleteResponse()
     deleted_ids = api_response.record_id_response
@@ -344,10 +686,13 @@ def parse_detokenize_response(api_response: HttpResponse[V1DetokenizeResponse]):
     api_response_data = api_response.data
     # Retrieve the request ID from the headers
     request_id = api_response_headers.get(HttpHeader.X_REQUEST_ID)
+    return parse_detokenize_records(api_response_data.records, request_id)
+
+def parse_detokenize_records(records, request_id = None):
     detokenized_fields = []
     errors = []
 
-    for record in api_response_data.records:
+    for record in records:
         if record.error:
             errors.append({
                 ResponseField.TOKEN: record.token,
@@ -362,14 +707,24 @@ def parse_detokenize_response(api_response: HttpResponse[V1DetokenizeResponse]):
                 ResponseField.TYPE: value_type
             })
 
-    detokenized_fields = detokenized_fields
-    errors = errors
     detokenize_response = DetokenizeResponse()
     detokenize_response.detokenized_fields = detokenized_fields
     detokenize_response.errors = errors if len(errors) > 0 else None
 
     return detokenize_response
 
+def parse_detokenize_batch_records(records, request_id, continue_on_error, logger=None):
+    """Parse the records that a detokenize batch returned for one call, and raise the first
+    error when the call was made without continue_on_error. Records only report tokens that
+    weren't found, so the error has the not found status that the call would have failed
+    with on its own.
+    """
+    detokenize_response = parse_detokenize_records(records, request_id)
+    if detokenize_response.errors and not continue_on_error:
+        log_error_log(SkyflowMessages.ErrorLogs.DETOKENIZE_REQUEST_REJECTED.value, logger)
+        raise SkyflowError(detokenize_response.errors[0][ResponseField.ERROR], HttpStatusCode.NOT_FOUND, request_id=request_id)
+    return detokenize_response
+
 def parse_tokenize_response(api_response: V1TokenizeResponse):
     tokenize_response = TokenizeResponse()
     tokenized_fields = [{ResponseField.TOKEN: record.token} for record in api_response.records]
@@ -390,6 +745,52 @@ def parse_query_response(api_response: V1GetQueryResponse):
     query_response.fields = fields
     return query_response
 
+def parse_query_rows(api_response: V1GetQueryResponse):
+    return [QueryRow(record.fields) for record in api_response.records]
+
+def split_query_limit(query, logger=None):
+    """Split a trailing LIMIT and OFFSET clause off query, and return the rest of the query,
+    the limit (None when there is none) and the offset (0 when there is none).
+
+    The clauses may come in either order, and LIMIT offset, count is read as a LIMIT and an
+    OFFSET. A LIMIT or OFFSET that is left at the end of the query raises a SkyflowError.
+    """
+    base_query = re.sub(r'\s*;?\s*$', '', query)
+    limit, offset = None, None
+    while True:
+        limit_match = None if limit is not None else \
+            re.search(r'\s+LIMIT\s+(\d+)(?:\s*,\s*(\d+))?$', base_query, re.IGNORECASE)
+        if limit_match is not None:
+            if limit_match.group(2) is None:
+                limit = int(limit_match.group(1))
+            elif offset is None:
+                offset, limit = int(limit_match.group(1)), int(limit_match.group(2))
+            else:
+                break
+            base_query = base_query[:limit_match.start()]
+            continue
+        offset_match = None if offset is not None else \
+            re.search(r'\s+OFFSET\s+(\d+)$', base_query, re.IGNORECASE)
+        if offset_match is None:
+            break
+        offset = int(offset_match.group(1))
+        base_query = base_query[:offset_match.start()]
+
+    if re.search(r'\b(?:LIMIT|OFFSET)\s+(?:\d+|ALL)\b[^()\']*$', base_query, re.IGNORECASE):
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_QUERY_LIMIT.value, logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_QUERY_LIMIT.value, invalid_input_error_code)
+    return base_query, limit, offset if offset is not None else 0
+
+def is_query_ordered(query):
+    """Return whether query has an ORDER BY outside of its subqueries."""
+    previous_query = None
+    while previous_query != query:
+        previous_query, query = query, re.sub(r'\([^()]*\)', '', query)
+    return re.search(r'\bORDER\s+BY\b', query, re.IGNORECASE) is not None
+
+def get_query_page(query, offset, limit):
+    return f"{query} {SqlCommand.LIMIT} {limit} {SqlCommand.OFFSET} {offset}"
+
 def parse_invoke_connection_response(api_response: requests.Response):
     status_code = api_response.status_code
     content = api_response.content
@@ -415,7 +816,7 @@ def parse_invoke_connection_response(api_response: requests.Response):
 
         return InvokeConnectionResponse(data=data, metadata=metadata, errors=None)
         
-    except HTTPError:
+    except (HTTPError, httpx.HTTPStatusError):
         message = SkyflowMessages.Error.API_ERROR.value.format(status_code)  
         request_id = api_response.headers.get(HttpHeader.X_REQUEST_ID)
         
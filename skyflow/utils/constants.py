@@ -21,6 +21,7 @@ class HttpStatusCode:
     OK = 200
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
+    NOT_FOUND = 404
     INTERNAL_SERVER_ERROR = 500
 
 
@@ -39,6 +40,14 @@ class DetectStatus:
 class Detect:
     WAIT_TIME = 64
 
+class HttpClient:
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 5.0
+    TIMEOUT = 60.0
+    RETRY_STATUS_CODES = [502, 503, 504]
+    RETRY_BACKOFF_FACTOR = 0.5
+
 class FileExtension:
     JSON = 'json'
     MP3 = 'mp3'
@@ -65,6 +74,7 @@ class FileProcessing:
     PROCESSED_PREFIX = 'processed-'
     DEIDENTIFIED_PREFIX = 'deidentified.'
     ENTITIES = 'entities'
+    STREAM_CHUNK_SIZE = 192 * 1024
 
 
 class EncodingType:
@@ -82,6 +92,53 @@ class JWT:
     ROLE_PREFIX = 'role:'
 
 
+class BearerToken:
+    REFRESH_RATIO = 0.8
+    CACHE_MAX_SIZE = 256
+
+
+class BulkOperation:
+    CHUNK_SIZE = 25
+    MAX_CHUNK_BYTES = 1024 * 1024
+    MAX_IN_FLIGHT = 8
+    MAX_RETRIES = 3
+    RETRY_STATUS_CODES = [429, 502, 503, 504]
+
+
+class BulkOptionField:
+    CHUNK_SIZE = 'chunk_size'
+    MAX_CHUNK_BYTES = 'max_chunk_bytes'
+    MAX_IN_FLIGHT = 'max_in_flight'
+    MAX_BATCH_SIZE = 'max_batch_size'
+    MAX_WAIT_TIME = 'max_wait_time'
+    MAX_SIZE = 'max_size'
+    TTL = 'ttl'
+    COLUMN_GROUPS = 'column_groups'
+    PAGE_SIZE = 'page_size'
+    MAX_RETRIES = 'max_retries'
+
+
+class DetokenizeBatch:
+    MAX_BATCH_SIZE = 25
+    MAX_WAIT_TIME = 0.005
+
+
+class Pagination:
+    PAGE_SIZE = 25
+    MAX_PAGE_SIZE = 25
+    MAX_IN_FLIGHT = 2
+
+
+class ResultCache:
+    MAX_SIZE = 10000
+    TTL = 300
+
+
+class SignedDataToken:
+    DEFAULT_TIME_TO_LIVE = 60
+    CHUNK_SIZE = 1000
+
+
 class ApiKey:
     SKY_PREFIX = 'sky-'
     LENGTH = 42
@@ -118,6 +175,7 @@ class ResponseField:
     TOKENIZED_DATA = 'tokenized_data'
     SIGNED_TOKEN = 'signed_token'
     RESPONSES = 'responses'
+    KEY = 'key'
 
 
 class CredentialField:
@@ -161,6 +219,7 @@ class OptionField:
     CONTROLLER = 'controller'
     VERIFY_SIGNATURE = 'verify_signature'
     VERIFY_AUD = 'verify_aud'
+    VERIFY_EXP = 'verify_exp'
 
 
 class ConfigField:
@@ -168,6 +227,12 @@ class ConfigField:
     CLUSTER_ID = 'cluster_id'
     ENV = 'env'
     VAULT_ID = 'vault_id'
+    MAX_CONNECTIONS = 'max_connections'
+    MAX_KEEPALIVE_CONNECTIONS = 'max_keepalive_connections'
+    KEEPALIVE_EXPIRY = 'keepalive_expiry'
+    HTTP2 = 'http2'
+    TIMEOUT = 'timeout'
+    MAX_RETRIES = 'max_retries'
 
 
 class RequestParameter:
@@ -264,6 +329,7 @@ class RequestOperation:
     TOKENIZE = 'TOKENIZE'
     DETOKENIZE = 'DETOKENIZE'
     FILE_UPLOAD = 'FILE_UPLOAD'
+    DETECT_FILE = 'DETECT_FILE'
 
 
 class ConfigType:
@@ -273,6 +339,8 @@ class ConfigType:
 
 class SqlCommand:
     SELECT = 'SELECT'
+    LIMIT = 'LIMIT'
+    OFFSET = 'OFFSET'
 
 
 class SdkPrefix:
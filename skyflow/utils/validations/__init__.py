@@ -1,6 +1,8 @@
 from ._validations import (
     validate_vault_config,
     validate_insert_request,
+    validate_bulk_options,
+    validate_insert_stream_request,
     validate_connection_config,
     validate_update_vault_config,
     validate_update_connection_config,
@@ -9,13 +11,22 @@ from ._validations import (
     validate_delete_request,
     validate_query_request,
     validate_get_request,
+    validate_get_many_request,
+    validate_iter_records_options,
+    validate_iter_query_options,
     validate_update_request,
+    validate_update_many_request,
     validate_detokenize_request,
+    validate_detokenize_batch_options,
+    validate_cache_options,
     validate_tokenize_request,
+    validate_tokenize_cache_options,
     validate_file_upload_request,
+    validate_file_upload_batch,
     validate_invoke_connection_params,
     validate_deidentify_text_request,
     validate_reidentify_text_request,
     validate_deidentify_file_request,
+    validate_deidentify_files_options,
     validate_get_detect_run_request,
 )
\ No newline at end of file
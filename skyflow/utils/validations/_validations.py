@@ -1,4 +1,4 @@
-import base64
+import importlib.util
 import json
 import os
 from skyflow.service_account import is_expired
@@ -9,24 +9,38 @@ from skyflow.utils import SkyflowMessages
 from skyflow.utils.constants import (
     ApiKey, ResponseField, RequestParameter,
     FileUploadField,
-    DeidentifyFileRequestField, RequestOperation, ConfigType, SqlCommand, ConfigField, OptionField, CredentialField, Detect
+    DeidentifyFileRequestField, RequestOperation, ConfigType, SqlCommand, ConfigField, OptionField, CredentialField, Detect,
+    BulkOptionField, Pagination
 )
 from skyflow.utils.logger import log_info, log_warn, log_error_log
 from skyflow.vault.detect import DeidentifyTextRequest, ReidentifyTextRequest, TokenFormat, Transformations, \
     GetDetectRunRequest, Bleep, DeidentifyFileRequest
 from skyflow.vault.detect._file_input import FileInput
+from skyflow.vault.data import UpdateRequest, QueryRequest
 from skyflow.utils._helpers import is_valid_url
+from skyflow.utils._base64_stream import iter_base64_chunks
 
 valid_vault_config_keys = [
     ConfigField.VAULT_ID, 
     ConfigField.CLUSTER_ID, 
     ConfigField.CREDENTIALS, 
-    ConfigField.ENV
+    ConfigField.ENV,
+    ConfigField.MAX_CONNECTIONS,
+    ConfigField.MAX_KEEPALIVE_CONNECTIONS,
+    ConfigField.KEEPALIVE_EXPIRY,
+    ConfigField.HTTP2,
+    ConfigField.TIMEOUT
 ]
 valid_connection_config_keys = [
     OptionField.CONNECTION_ID, 
     OptionField.CONNECTION_URL, 
-    ConfigField.CREDENTIALS
+    ConfigField.CREDENTIALS,
+    ConfigField.MAX_CONNECTIONS,
+    ConfigField.MAX_KEEPALIVE_CONNECTIONS,
+    ConfigField.KEEPALIVE_EXPIRY,
+    ConfigField.HTTP2,
+    ConfigField.TIMEOUT,
+    ConfigField.MAX_RETRIES
 ]
 valid_credentials_keys = [
     CredentialField.PATH, 
@@ -184,6 +198,36 @@ def validate_keys(logger, config, config_keys):
             log_error_log(SkyflowMessages.ErrorLogs.INVALID_KEY.value.format(key), logger)
             raise SkyflowError(SkyflowMessages.Error.INVALID_KEY.value.format(key), invalid_input_error_code)
 
+def validate_http_client_options(logger, config, config_type, config_id):
+    for key in [ConfigField.MAX_CONNECTIONS, ConfigField.MAX_KEEPALIVE_CONNECTIONS]:
+        if key in config:
+            value = config.get(key)
+            if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+                log_error_log(SkyflowMessages.ErrorLogs.INVALID_HTTP_CLIENT_OPTION.value.format(config_type, key), logger)
+                raise SkyflowError(SkyflowMessages.Error.INVALID_CONNECTION_LIMIT.value.format(key, config_type, config_id), invalid_input_error_code)
+
+    for key in [ConfigField.KEEPALIVE_EXPIRY, ConfigField.TIMEOUT]:
+        if key in config:
+            value = config.get(key)
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+                log_error_log(SkyflowMessages.ErrorLogs.INVALID_HTTP_CLIENT_OPTION.value.format(config_type, key), logger)
+                raise SkyflowError(SkyflowMessages.Error.INVALID_HTTP_TIMEOUT.value.format(key, config_type, config_id), invalid_input_error_code)
+
+    if ConfigField.MAX_RETRIES in config:
+        value = config.get(ConfigField.MAX_RETRIES)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_HTTP_CLIENT_OPTION.value.format(config_type, ConfigField.MAX_RETRIES), logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_MAX_RETRIES.value.format(config_type, config_id), invalid_input_error_code)
+
+    if ConfigField.HTTP2 in config:
+        if not isinstance(config.get(ConfigField.HTTP2), bool):
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_HTTP_CLIENT_OPTION.value.format(config_type, ConfigField.HTTP2), logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_HTTP2.value.format(config_type, config_id), invalid_input_error_code)
+        # httpx only negotiates HTTP/2 when the optional h2 package is installed.
+        if config.get(ConfigField.HTTP2) and importlib.util.find_spec('h2') is None:
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_HTTP_CLIENT_OPTION.value.format(config_type, ConfigField.HTTP2), logger)
+            raise SkyflowError(SkyflowMessages.Error.HTTP2_NOT_INSTALLED.value.format(config_type, config_id), invalid_input_error_code)
+
 def validate_vault_config(logger, config):
     log_info(SkyflowMessages.Info.VALIDATING_VAULT_CONFIG.value, logger)
     validate_keys(logger, config, valid_vault_config_keys)
@@ -214,6 +258,8 @@ def validate_vault_config(logger, config):
         log_error_log(SkyflowMessages.ErrorLogs.ENV_IS_REQUIRED.value, logger)
         raise SkyflowError(SkyflowMessages.Error.INVALID_ENV.value.format(vault_id), invalid_input_error_code)
 
+    validate_http_client_options(logger, config, ConfigType.VAULT, vault_id)
+
     return True
 
 def validate_update_vault_config(logger, config):
@@ -240,6 +286,8 @@ def validate_update_vault_config(logger, config):
 
     validate_credentials(logger, config.get(ConfigField.CREDENTIALS), ConfigType.VAULT, vault_id)
 
+    validate_http_client_options(logger, config, ConfigType.VAULT, vault_id)
+
     return True
 
 def validate_connection_config(logger, config):
@@ -265,6 +313,8 @@ def validate_connection_config(logger, config):
 
     validate_credentials(logger, config.get(ConfigField.CREDENTIALS), ConfigType.CONNECTION, connection_id)
 
+    validate_http_client_options(logger, config, ConfigType.CONNECTION, connection_id)
+
     return True
 
 def validate_update_connection_config(logger, config):
@@ -289,6 +339,8 @@ def validate_update_connection_config(logger, config):
         raise SkyflowError(SkyflowMessages.Error.EMPTY_CREDENTIALS.value.format(ConfigType.CONNECTION, connection_id), invalid_input_error_code)
     validate_credentials(logger, config.get(ConfigField.CREDENTIALS))
 
+    validate_http_client_options(logger, config, ConfigType.CONNECTION, connection_id)
+
     return True
 
 def validate_file_from_request(file_input: FileInput):
@@ -453,6 +505,15 @@ def validate_deidentify_file_request(logger, request: DeidentifyFileRequest):
             log_error_log(SkyflowMessages.Error.WAIT_TIME_GREATER_THEN_64.value, logger)
             raise SkyflowError(SkyflowMessages.Error.WAIT_TIME_GREATER_THEN_64.value, invalid_input_error_code)
 
+def validate_deidentify_files_options(logger, requests, max_in_flight):
+    # Each request is validated as it is submitted, so that an invalid file fails on its own.
+    if isinstance(requests, (str, bytes, dict)) or not hasattr(requests, '__iter__'):
+        raise SkyflowError(SkyflowMessages.Error.INVALID_DEIDENTIFY_FILES_REQUESTS.value, invalid_input_error_code)
+
+    if isinstance(max_in_flight, bool) or not isinstance(max_in_flight, int) or max_in_flight <= 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(RequestOperation.DETECT_FILE, BulkOptionField.MAX_IN_FLIGHT), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(BulkOptionField.MAX_IN_FLIGHT, RequestOperation.DETECT_FILE, BulkOptionField.MAX_IN_FLIGHT), invalid_input_error_code)
+
 def validate_insert_request(logger, request):
     if not isinstance(request.table, str):
         log_error_log(SkyflowMessages.ErrorLogs.TABLE_IS_REQUIRED.value.format(RequestOperation.INSERT), logger = logger)
@@ -526,6 +587,83 @@ def validate_insert_request(logger, request):
                 log_error_log(SkyflowMessages.ErrorLogs.MISMATCH_OF_FIELDS_AND_TOKENS.value.format(RequestOperation.INSERT), logger=logger)
                 raise SkyflowError(SkyflowMessages.Error.MISMATCH_OF_FIELDS_AND_TOKENS.value, invalid_input_error_code)
 
+def validate_bulk_options(logger, request, operation):
+    # max_chunk_bytes may be None to bound chunks by record count only.
+    for option in [BulkOptionField.CHUNK_SIZE, BulkOptionField.MAX_CHUNK_BYTES, BulkOptionField.MAX_IN_FLIGHT]:
+        value = getattr(request, option, None)
+        if option == BulkOptionField.MAX_CHUNK_BYTES and value is None:
+            continue
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, option), logger=logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(option, operation, option), invalid_input_error_code)
+    # max_retries is only set on requests whose chunks are safe to retry.
+    if hasattr(request, BulkOptionField.MAX_RETRIES):
+        max_retries = request.max_retries
+        if isinstance(max_retries, bool) or not isinstance(max_retries, int) or max_retries < 0:
+            log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, BulkOptionField.MAX_RETRIES), logger=logger)
+            raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_RETRIES.value.format(operation), invalid_input_error_code)
+
+def validate_detokenize_batch_options(logger, max_batch_size, max_wait_time):
+    if isinstance(max_batch_size, bool) or not isinstance(max_batch_size, int) or max_batch_size <= 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(RequestOperation.DETOKENIZE, BulkOptionField.MAX_BATCH_SIZE), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(BulkOptionField.MAX_BATCH_SIZE, RequestOperation.DETOKENIZE, BulkOptionField.MAX_BATCH_SIZE), invalid_input_error_code)
+    if isinstance(max_wait_time, bool) or not isinstance(max_wait_time, (int, float)) or max_wait_time < 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(RequestOperation.DETOKENIZE, BulkOptionField.MAX_WAIT_TIME), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_DURATION_OPTION.value.format(BulkOptionField.MAX_WAIT_TIME, RequestOperation.DETOKENIZE, BulkOptionField.MAX_WAIT_TIME), invalid_input_error_code)
+
+def validate_cache_options(logger, operation, max_size, ttl):
+    if isinstance(max_size, bool) or not isinstance(max_size, int) or max_size <= 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, BulkOptionField.MAX_SIZE), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(BulkOptionField.MAX_SIZE, operation, BulkOptionField.MAX_SIZE), invalid_input_error_code)
+    if isinstance(ttl, bool) or not isinstance(ttl, (int, float)) or ttl < 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, BulkOptionField.TTL), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_DURATION_OPTION.value.format(BulkOptionField.TTL, operation, BulkOptionField.TTL), invalid_input_error_code)
+
+def validate_tokenize_cache_options(logger, column_groups, max_size, ttl):
+    if isinstance(column_groups, str) or not isinstance(column_groups, (list, tuple, set, frozenset)) or not column_groups \
+            or not all(isinstance(column_group, str) and column_group.strip() for column_group in column_groups):
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(RequestOperation.TOKENIZE, BulkOptionField.COLUMN_GROUPS), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_CACHE_COLUMN_GROUPS.value, invalid_input_error_code)
+    validate_cache_options(logger, RequestOperation.TOKENIZE, max_size, ttl)
+
+def validate_iter_records_options(logger, table, fields, redaction_type, page_size, max_in_flight):
+    if not isinstance(table, str):
+        log_error_log(SkyflowMessages.ErrorLogs.TABLE_IS_REQUIRED.value.format(RequestOperation.GET), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_TABLE_VALUE.value, invalid_input_error_code)
+    if not table.strip():
+        log_error_log(SkyflowMessages.ErrorLogs.EMPTY_TABLE_NAME.value.format(RequestOperation.GET), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.EMPTY_TABLE_VALUE.value, invalid_input_error_code)
+
+    if fields is not None and (not isinstance(fields, list) or not fields):
+        log_error_log(SkyflowMessages.ErrorLogs.EMPTY_FIELDS.value.format(RequestOperation.GET), logger = logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_FIELDS_VALUE.value.format(type(fields)), invalid_input_error_code)
+
+    if redaction_type is not None and not isinstance(redaction_type, RedactionType):
+        raise SkyflowError(SkyflowMessages.Error.INVALID_REDACTION_TYPE.value.format(type(redaction_type)), invalid_input_error_code)
+
+    validate_page_options(logger, RequestOperation.GET, page_size, max_in_flight)
+
+def validate_iter_query_options(logger, query, page_size, max_in_flight):
+    validate_query_request(logger, QueryRequest(query))
+    validate_page_options(logger, RequestOperation.QUERY, page_size, max_in_flight)
+
+def validate_page_options(logger, operation, page_size, max_in_flight):
+    if isinstance(page_size, bool) or not isinstance(page_size, int) or not 0 < page_size <= Pagination.MAX_PAGE_SIZE:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, BulkOptionField.PAGE_SIZE), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_PAGE_SIZE.value.format(operation, Pagination.MAX_PAGE_SIZE), invalid_input_error_code)
+
+    if isinstance(max_in_flight, bool) or not isinstance(max_in_flight, int) or max_in_flight <= 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(operation, BulkOptionField.MAX_IN_FLIGHT), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(BulkOptionField.MAX_IN_FLIGHT, operation, BulkOptionField.MAX_IN_FLIGHT), invalid_input_error_code)
+
+def validate_insert_stream_request(logger, request):
+    # Records are validated chunk by chunk as they are read, with validate_insert_request.
+    values = request.values
+    if isinstance(values, (str, bytes, dict)) or not (hasattr(values, '__iter__') or hasattr(values, '__aiter__')):
+        log_error_log(SkyflowMessages.ErrorLogs.VALUES_IS_REQUIRED.value.format(RequestOperation.INSERT), logger = logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_TYPE_OF_DATA_IN_INSERT.value, invalid_input_error_code)
+    validate_bulk_options(logger, request, RequestOperation.INSERT)
+
 def validate_delete_request(logger, request):
     if not isinstance(request.table, str):
         log_error_log(SkyflowMessages.ErrorLogs.TABLE_IS_REQUIRED.value.format(RequestOperation.DELETE), logger=logger)
@@ -555,6 +693,15 @@ def validate_query_request(logger, request):
         command = request.query
         raise SkyflowError(SkyflowMessages.Error.INVALID_QUERY_COMMAND.value.format(command), invalid_input_error_code)
 
+def validate_get_many_request(logger, request):
+    # Chunks are fetched by skyflow ID only, so paging and column lookups do not apply.
+    if not request.ids or any(getattr(request, option, None) is not None
+                              for option in ['offset', 'limit', 'column_name', 'column_values']):
+        log_error_log(SkyflowMessages.ErrorLogs.EMPTY_IDS.value.format(RequestOperation.GET), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_GET_MANY_OPTIONS.value, invalid_input_error_code)
+    validate_get_request(logger, request)
+    validate_bulk_options(logger, request, RequestOperation.GET)
+
 def validate_get_request(logger, request):
     redaction_type = request.redaction_type
     column_name = request.column_name
@@ -695,6 +842,25 @@ def validate_update_request(logger, request):
                 SkyflowMessages.Error.INSUFFICIENT_TOKENS_PASSED_FOR_TOKEN_MODE_ENABLE_STRICT.value,
                 invalid_input_error_code)
 
+def validate_update_many_request(logger, request):
+    data = request.data
+    if not isinstance(data, list) or not data or not all(
+            isinstance(record, dict) and isinstance(record.get(ResponseField.SKYFLOW_ID), str)
+            and record[ResponseField.SKYFLOW_ID].strip() for record in data):
+        log_error_log(SkyflowMessages.ErrorLogs.SKYFLOW_ID_IS_REQUIRED.value.format(RequestOperation.UPDATE), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_UPDATE_MANY_DATA.value, invalid_input_error_code)
+
+    tokens = request.tokens
+    if tokens is not None and (not isinstance(tokens, list) or len(tokens) != len(data)):
+        log_error_log(SkyflowMessages.ErrorLogs.EMPTY_TOKENS.value.format(RequestOperation.UPDATE), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_UPDATE_MANY_TOKENS.value, invalid_input_error_code)
+
+    # Each record must be a valid single update on its own.
+    for index, record in enumerate(data):
+        validate_update_request(logger, UpdateRequest(request.table, record, tokens=tokens[index] if tokens is not None else None,
+                                                      return_tokens=request.return_tokens, token_mode=request.token_mode))
+    validate_bulk_options(logger, request, RequestOperation.UPDATE)
+
 def validate_detokenize_request(logger, request):
     if not isinstance(request.continue_on_error, bool):
         raise SkyflowError(SkyflowMessages.Error.INVALID_CONTINUE_ON_ERROR_TYPE.value, invalid_input_error_code)
@@ -799,7 +965,9 @@ def validate_file_upload_request(logger, request):
         if is_none_or_empty(file_name):
             raise SkyflowError(SkyflowMessages.Error.INVALID_FILE_NAME.value, invalid_input_error_code)
         try:
-            base64.b64decode(base64_str)
+            # Decode chunk by chunk, so that a large file is never held in memory decoded.
+            for _ in iter_base64_chunks(base64_str):
+                pass
         except Exception:
             raise SkyflowError(SkyflowMessages.Error.INVALID_BASE64_STRING.value, invalid_input_error_code)
         return
@@ -815,6 +983,25 @@ def validate_file_upload_request(logger, request):
     # If none of the above, raise missing file source error
     raise SkyflowError(SkyflowMessages.Error.MISSING_FILE_SOURCE.value, invalid_input_error_code)
 
+def validate_file_upload_batch(logger, batch):
+    requests = batch.requests
+    if isinstance(requests, (str, bytes, dict)) or not hasattr(requests, '__iter__'):
+        raise SkyflowError(SkyflowMessages.Error.INVALID_FILE_UPLOAD_BATCH_REQUESTS.value, invalid_input_error_code)
+
+    max_in_flight = batch.max_in_flight
+    if isinstance(max_in_flight, bool) or not isinstance(max_in_flight, int) or max_in_flight <= 0:
+        log_error_log(SkyflowMessages.ErrorLogs.INVALID_BULK_OPTION.value.format(RequestOperation.FILE_UPLOAD, BulkOptionField.MAX_IN_FLIGHT), logger=logger)
+        raise SkyflowError(SkyflowMessages.Error.INVALID_BULK_OPTION.value.format(BulkOptionField.MAX_IN_FLIGHT, RequestOperation.FILE_UPLOAD, BulkOptionField.MAX_IN_FLIGHT), invalid_input_error_code)
+
+    checkpoint_path = batch.checkpoint_path
+    if checkpoint_path is not None and (not isinstance(checkpoint_path, str) or not checkpoint_path.strip()
+                                        or os.path.isdir(checkpoint_path)
+                                        or not os.path.isdir(os.path.dirname(os.path.abspath(checkpoint_path)))):
+        raise SkyflowError(SkyflowMessages.Error.INVALID_CHECKPOINT_PATH.value, invalid_input_error_code)
+
+    if batch.on_progress is not None and not callable(batch.on_progress):
+        raise SkyflowError(SkyflowMessages.Error.INVALID_PROGRESS_CALLBACK.value, invalid_input_error_code)
+
 def is_none_or_empty(value: str) -> bool:
     return value is None or (isinstance(value, str) and value.strip() == "")
 
@@ -1,9 +1,23 @@
+import asyncio
+import threading
+import time
+import httpx
+import jwt
 from skyflow.error import SkyflowError
-from skyflow.generated.rest.client import Skyflow
+from skyflow.generated.rest.client import Skyflow, AsyncSkyflow
 from skyflow.service_account import generate_bearer_token, generate_bearer_token_from_creds, is_expired
-from skyflow.utils import get_vault_url, get_credentials, SkyflowMessages
-from skyflow.utils.logger import log_info
-from skyflow.utils.constants import OptionField, CredentialField, ConfigField
+from skyflow.service_account._token_cache import get_cached_bearer_token, get_token_cache_key, get_credentials_file_identity
+from skyflow.utils import get_vault_url, get_credentials, get_metrics_headers, SkyflowMessages
+from skyflow.utils.logger import log_info, log_error_log
+from skyflow.utils.constants import OptionField, CredentialField, ConfigField, HttpClient, JwtField, BearerToken
+
+HTTP_CLIENT_CONFIG_KEYS = [
+    ConfigField.MAX_CONNECTIONS,
+    ConfigField.MAX_KEEPALIVE_CONNECTIONS,
+    ConfigField.KEEPALIVE_EXPIRY,
+    ConfigField.HTTP2,
+    ConfigField.TIMEOUT
+]
 
 
 class VaultClient:
@@ -13,12 +27,24 @@ class VaultClient:
         self.__log_level = None
         self.__client_configuration = None
         self.__api_client = None
+        self.__async_api_clients = {}
+        self.__token_provider = None
+        self.__http_client = None
+        self.__async_http_clients = {}
         self.__logger = None
         self.__is_config_updated = False
         self.__bearer_token = None
+        self.__token_lock = threading.Lock()
+        self.__token_refresh_at = None
+        self.__token_expires_at = None
+        self.__timed_bearer_token = None
+        self.__is_token_refreshing = False
+        self.__config_version = 0
         self.__credentials = None
         self.__vault_url = None
         self.__is_static_token = None
+        self.__retired_async_http_clients = []
+        self.__close_tasks = set()
 
     def set_common_skyflow_credentials(self, credentials):
         self.__common_skyflow_credentials = credentials
@@ -31,7 +57,8 @@ class VaultClient:
         if self.__api_client is not None and not self.__is_config_updated:
             if self.__is_static_token:
                 return
-            if self.__bearer_token is not None and not is_expired(self.__bearer_token):
+            if not self.__is_bearer_token_expired():
+                self.__refresh_bearer_token_if_due(self.__credentials)
                 return
 
         needs_reinit = self.__api_client is None or self.__is_config_updated
@@ -46,9 +73,81 @@ class VaultClient:
         if needs_reinit:
             self.initialize_api_client(self.__vault_url, bearer_token)
 
+    async def initialize_client_configuration_async(self):
+        """Awaitable counterpart of initialize_client_configuration.
+
+        Reading credentials and minting a bearer token block, so when either is needed it runs
+        in a worker thread instead of on the event loop. A valid token is reused in place.
+        """
+        if self.__retired_async_http_clients:
+            await self.__close_retired_async_http_clients()
+        if self.__api_client is not None and not self.__is_config_updated and \
+                (self.__is_static_token or not self.__is_bearer_token_expired()):
+            self.initialize_client_configuration()
+            return
+        await asyncio.to_thread(self.initialize_client_configuration)
+
     def initialize_api_client(self, vault_url, bearer_token):
         token_provider = lambda: self.__bearer_token if self.__bearer_token is not None else bearer_token  # noqa: E731
-        self.__api_client = Skyflow(base_url=vault_url, token=token_provider)
+        # The static sky-metadata header is set once on the client; only the bearer token is read
+        # per request.
+        self.__api_client = Skyflow(base_url=vault_url, token=token_provider, headers=get_metrics_headers(),
+                                    httpx_client=self.get_http_client())
+        self.__token_provider = token_provider
+        self.__async_api_clients = {}
+
+    @staticmethod
+    def __get_event_loop():
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @staticmethod
+    def __drop_closed_loops(clients):
+        return {loop: client for loop, client in clients.items() if loop is None or not loop.is_closed()}
+
+    def get_async_api_client(self):
+        # Created lazily so that sync-only callers never pay for an unused httpx.AsyncClient.
+        loop = self.__get_event_loop()
+        async_api_client = self.__async_api_clients.get(loop)
+        if async_api_client is None:
+            async_api_client = AsyncSkyflow(base_url=self.__vault_url, token=self.__token_provider,
+                                            headers=get_metrics_headers(), httpx_client=self.get_async_http_client())
+            self.__async_api_clients = self.__drop_closed_loops(self.__async_api_clients)
+            self.__async_api_clients[loop] = async_api_client
+        return async_api_client
+
+    def __get_http_client_options(self):
+        limits = httpx.Limits(
+            max_connections=self.__config.get(ConfigField.MAX_CONNECTIONS, HttpClient.MAX_CONNECTIONS),
+            max_keepalive_connections=self.__config.get(ConfigField.MAX_KEEPALIVE_CONNECTIONS, HttpClient.MAX_KEEPALIVE_CONNECTIONS),
+            keepalive_expiry=self.__config.get(ConfigField.KEEPALIVE_EXPIRY, HttpClient.KEEPALIVE_EXPIRY)
+        )
+        return {
+            'limits': limits,
+            'timeout': self.get_timeout(),
+            'http2': self.__config.get(ConfigField.HTTP2, False),
+            'follow_redirects': True
+        }
+
+    def get_http_client(self):
+        # The pool outlives api client re-initialization; the bearer token is read per request
+        # through the token provider, so rotating it never drops warm connections.
+        if self.__http_client is None:
+            self.__http_client = httpx.Client(**self.__get_http_client_options())
+        return self.__http_client
+
+    def get_async_http_client(self):
+        # An httpx.AsyncClient is bound to the event loop that first uses it, so each loop gets
+        # its own, as with repeated asyncio.run calls. Those of closed loops are dropped.
+        loop = self.__get_event_loop()
+        async_http_client = self.__async_http_clients.get(loop)
+        if async_http_client is None:
+            async_http_client = httpx.AsyncClient(**self.__get_http_client_options())
+            self.__async_http_clients = self.__drop_closed_loops(self.__async_http_clients)
+            self.__async_http_clients[loop] = async_http_client
+        return async_http_client
 
     def get_records_api(self):
         return self.__api_client.records
@@ -65,46 +164,172 @@ class VaultClient:
     def get_detect_file_api(self):
         return self.__api_client.files
 
+    def get_async_records_api(self):
+        return self.get_async_api_client().records
+
+    def get_async_tokens_api(self):
+        return self.get_async_api_client().tokens
+
+    def get_async_query_api(self):
+        return self.get_async_api_client().query
+
+    def get_async_detect_text_api(self):
+        return self.get_async_api_client().strings
+
+    def get_async_detect_file_api(self):
+        return self.get_async_api_client().files
+
+    def get_timeout(self):
+        return self.__config.get(ConfigField.TIMEOUT, HttpClient.TIMEOUT)
+
     def get_vault_id(self):
         return self.__config.get(ConfigField.VAULT_ID)
 
-    def get_bearer_token(self, credentials):
-        if CredentialField.API_KEY in credentials:
-            return credentials.get(CredentialField.API_KEY)
-        elif CredentialField.TOKEN in credentials:
-            return credentials.get(CredentialField.TOKEN)
-
+    def __get_bearer_token_options(self, credentials):
         options = {
             OptionField.ROLE_IDS: self.__config.get(OptionField.ROLES),
             OptionField.CTX: self.__config.get(OptionField.CTX)
         }
         if CredentialField.TOKEN_URI_OPTION in credentials and credentials.get(CredentialField.TOKEN_URI_OPTION):
             options[CredentialField.TOKEN_URI_OPTION] = credentials.get(CredentialField.TOKEN_URI_OPTION)
+        return options
+
+    def __generate_bearer_token(self, credentials, options):
+        # Tokens are shared through the process-wide cache, so vaults and connections configured
+        # with the same service account, roles and ctx mint one token between them.
+        if CredentialField.PATH in credentials:
+            credentials_path = credentials.get(CredentialField.PATH)
+            return get_cached_bearer_token(
+                get_token_cache_key(get_credentials_file_identity(credentials_path), options),
+                lambda: generate_bearer_token(credentials_path, options, self.__logger)[0]
+            )
+        credentials_string = credentials.get(CredentialField.CREDENTIALS_STRING)
+
+        def generate():
+            log_info(SkyflowMessages.Info.GENERATE_BEARER_TOKEN_FROM_CREDENTIALS_STRING_TRIGGERED.value, self.__logger)
+            bearer_token, _ = generate_bearer_token_from_creds(
+                credentials_string,
+                options,
+                self.__logger
+            )
+            return bearer_token
+        return get_cached_bearer_token(get_token_cache_key(credentials_string, options), generate)
+
+    def __set_bearer_token(self, bearer_token):
+        # exp is decoded once per minted token and tracked on the monotonic clock, so the
+        # per-request expiry check is a float comparison that wall-clock jumps cannot skew.
+        self.__token_refresh_at = None
+        self.__token_expires_at = None
+        try:
+            claims = jwt.decode(bearer_token, options={OptionField.VERIFY_SIGNATURE: False, OptionField.VERIFY_AUD: False,
+                                                       OptionField.VERIFY_EXP: False})
+            now, monotonic_now = time.time(), time.monotonic()
+            expires_at = claims[JwtField.EXP]
+            issued_at = claims.get(JwtField.IAT, now)
+            self.__token_expires_at = monotonic_now + (expires_at - now)
+            self.__token_refresh_at = monotonic_now + (issued_at + (expires_at - issued_at) * BearerToken.REFRESH_RATIO - now)
+        except Exception:
+            # Tokens without a readable exp claim fall back to is_expired and are only regenerated once they expire.
+            pass
+        self.__timed_bearer_token = bearer_token
+        self.__bearer_token = bearer_token
+
+    def __is_bearer_token_expired(self):
+        if self.__bearer_token is None:
+            return True
+        if self.__token_expires_at is None or self.__timed_bearer_token is not self.__bearer_token:
+            return is_expired(self.__bearer_token)
+        return time.monotonic() >= self.__token_expires_at
+
+    def __refresh_bearer_token_if_due(self, credentials):
+        if self.__token_refresh_at is None or time.monotonic() < self.__token_refresh_at:
+            return
+        with self.__token_lock:
+            if self.__is_token_refreshing or self.__token_refresh_at is None or time.monotonic() < self.__token_refresh_at:
+                return
+            self.__is_token_refreshing = True
+        refresh_thread = threading.Thread(target=self.__refresh_bearer_token,
+                                          args=(credentials, self.__config_version), daemon=True)
+        refresh_thread.start()
 
-        if self.__bearer_token is None or self.__is_config_updated or is_expired(self.__bearer_token):
-            if CredentialField.PATH in credentials:
-                self.__bearer_token, _ = generate_bearer_token(
-                    credentials.get(CredentialField.PATH),
-                    options,
-                    self.__logger
-                )
-            else:
-                credentials_string = credentials.get(CredentialField.CREDENTIALS_STRING)
-                log_info(SkyflowMessages.Info.GENERATE_BEARER_TOKEN_FROM_CREDENTIALS_STRING_TRIGGERED.value, self.__logger)
-                self.__bearer_token, _ = generate_bearer_token_from_creds(
-                    credentials_string,
-                    options,
-                    self.__logger
-                )
-            self.__is_config_updated = False
+    def __refresh_bearer_token(self, credentials, config_version):
+        # Runs off the request path while the current token is still valid; callers keep using it until the swap.
+        try:
+            bearer_token = self.__generate_bearer_token(credentials, self.__get_bearer_token_options(credentials))
+            with self.__token_lock:
+                if config_version == self.__config_version:
+                    self.__set_bearer_token(bearer_token)
+        except Exception:
+            log_error_log(SkyflowMessages.ErrorLogs.FAILED_TO_GET_BEARER_TOKEN.value, self.__logger)
+            with self.__token_lock:
+                # Retry halfway to expiry instead of on every request while the auth server is failing.
+                if self.__token_expires_at is not None:
+                    now = time.monotonic()
+                    self.__token_refresh_at = now + max(self.__token_expires_at - now, 0) / 2
+        finally:
+            self.__is_token_refreshing = False
+
+    def get_bearer_token(self, credentials):
+        if CredentialField.API_KEY in credentials:
+            return credentials.get(CredentialField.API_KEY)
+        elif CredentialField.TOKEN in credentials:
+            return credentials.get(CredentialField.TOKEN)
+
+        if self.__is_config_updated or self.__is_bearer_token_expired():
+            # Single-flight: threads arriving while a token is being minted wait for it instead of minting their own.
+            with self.__token_lock:
+                if self.__is_config_updated or self.__is_bearer_token_expired():
+                    self.__set_bearer_token(self.__generate_bearer_token(credentials, self.__get_bearer_token_options(credentials)))
+                    self.__is_config_updated = False
         else:
             log_info(SkyflowMessages.Info.REUSE_BEARER_TOKEN.value, self.__logger)
+            self.__refresh_bearer_token_if_due(credentials)
 
         return self.__bearer_token
 
     def update_config(self, config):
+        drain_time = self.__config.get(ConfigField.TIMEOUT, HttpClient.TIMEOUT)
         self.__config.update(config)
         self.__is_config_updated = True
+        self.__config_version += 1
+        if any(key in config for key in HTTP_CLIENT_CONFIG_KEYS):
+            # Pool settings changed: the next initialization builds a new pool. Requests already
+            # sent on the old pools may still be running in other threads or tasks, so the old
+            # pools are closed once the old timeout has passed, or left to the garbage collector
+            # when there is none.
+            if self.__http_client is not None and drain_time is not None:
+                close_timer = threading.Timer(drain_time, self.__http_client.close)
+                close_timer.daemon = True
+                close_timer.start()
+            if drain_time is not None:
+                self.__retired_async_http_clients.extend(
+                    (loop, async_http_client, drain_time) for loop, async_http_client in self.__async_http_clients.items())
+            self.__http_client = None
+            self.__async_http_clients = {}
+            self.__async_api_clients = {}
+
+    async def __close_retired_async_http_clients(self):
+        # aclose must run on the client's own event loop, so retired clients are closed from the
+        # next async call on that loop. Clients of closed loops have nothing left to release.
+        running_loop = asyncio.get_running_loop()
+        retired_async_http_clients = []
+        for loop, async_http_client, drain_time in self.__retired_async_http_clients:
+            if loop is None or loop is running_loop:
+                close_task = asyncio.ensure_future(self.__aclose_after(async_http_client, drain_time))
+                self.__close_tasks.add(close_task)
+                close_task.add_done_callback(self.__close_tasks.discard)
+            elif not loop.is_closed():
+                retired_async_http_clients.append((loop, async_http_client, drain_time))
+        self.__retired_async_http_clients = retired_async_http_clients
+
+    @staticmethod
+    async def __aclose_after(async_http_client, drain_time):
+        await asyncio.sleep(drain_time)
+        try:
+            await async_http_client.aclose()
+        except Exception:
+            # A client bound to an event loop that has since closed has nothing left to release.
+            pass
 
     def get_config(self):
         return self.__config
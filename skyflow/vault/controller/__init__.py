@@ -1,3 +1,6 @@
 from ._vault import Vault
+from ._async_vault import AsyncVault
 from ._connections import Connection
-from ._detect import Detect
\ No newline at end of file
+from ._async_connection import AsyncConnection
+from ._detect import Detect
+from ._async_detect import AsyncDetect
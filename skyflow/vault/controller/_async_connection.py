@@ -0,0 +1,59 @@
+import asyncio
+import httpx
+from urllib3.util.retry import Retry
+from skyflow.error import SkyflowError
+from skyflow.utils import SkyflowMessages, parse_invoke_connection_response
+from skyflow.utils.logger import log_info, log_error_log
+from skyflow.vault.connection import InvokeConnectionRequest
+from skyflow.utils.constants import ConfigField, HttpClient
+
+
+class AsyncConnection:
+    """Awaitable counterpart of Connection.
+
+    Requests are prepared by the Connection it is obtained from and sent through the pooled
+    httpx.AsyncClient of the connection config, which also enables HTTP/2 when configured.
+    """
+    def __init__(self, vault_client, connection):
+        self.__vault_client = vault_client
+        self.__connection = connection
+
+    async def __send(self, invoke_connection_request):
+        client = self.__vault_client.get_async_http_client()
+        max_retries = self.__vault_client.get_config().get(ConfigField.MAX_RETRIES, 0)
+        # Same policy as the sync session: retry connect errors, and gateway errors on idempotent methods only.
+        retry_on_status = invoke_connection_request.method in Retry.DEFAULT_ALLOWED_METHODS
+        attempt = 0
+        while True:
+            try:
+                response = await client.request(
+                    invoke_connection_request.method,
+                    invoke_connection_request.url,
+                    headers=dict(invoke_connection_request.headers),
+                    content=invoke_connection_request.body
+                )
+                if attempt >= max_retries or not retry_on_status or response.status_code not in HttpClient.RETRY_STATUS_CODES:
+                    return response
+                await response.aclose()
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                # The request was never sent, so it is safe to retry whatever its method.
+                if attempt >= max_retries:
+                    raise
+            await asyncio.sleep(HttpClient.RETRY_BACKOFF_FACTOR * (2 ** attempt))
+            attempt += 1
+
+    async def invoke(self, request: InvokeConnectionRequest):
+        invoke_connection_request = self.__connection._prepare_request(request)
+
+        log_info(SkyflowMessages.Info.INVOKE_CONNECTION_TRIGGERED.value, self.__vault_client.get_logger())
+
+        try:
+            response = await self.__send(invoke_connection_request)
+            invoke_connection_response = parse_invoke_connection_response(response)
+            return invoke_connection_response
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.INVOKE_CONNECTION_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            if isinstance(e, SkyflowError): raise e
+            raise SkyflowError(SkyflowMessages.Error.INVOKE_CONNECTION_FAILED.value,
+                               SkyflowMessages.ErrorCodes.SERVER_ERROR.value)
@@ -0,0 +1,234 @@
+import asyncio
+from skyflow.error import SkyflowError
+from skyflow.utils._skyflow_messages import SkyflowMessages
+from skyflow.utils._utils import handle_exception, get_skyflow_error, parse_deidentify_text_response, parse_reidentify_text_response
+from skyflow.utils.constants import DetectStatus, DeidentifyField, BulkOperation, Detect as DetectConstants
+from skyflow.utils.logger import log_info, log_error_log
+from skyflow.utils.validations import validate_deidentify_file_request, validate_deidentify_files_options, validate_get_detect_run_request
+from skyflow.utils.validations._validations import validate_deidentify_text_request, validate_reidentify_text_request
+from skyflow.vault.detect import DeidentifyTextRequest, DeidentifyTextResponse, ReidentifyTextRequest, \
+    ReidentifyTextResponse, DeidentifyFileRequest, DeidentifyFileResponse, GetDetectRunRequest, DetectRun
+from ._detect_run_scheduler import DetectRunScheduler
+
+class AsyncDetect:
+    """Awaitable counterpart of Detect.
+
+    Request building and response parsing are delegated to the Detect it is obtained from;
+    only the API calls and the run polling differ, the latter waiting with asyncio.sleep
+    so that many file runs can be awaited concurrently on one event loop.
+    """
+    def __init__(self, vault_client, detect):
+        self.__vault_client = vault_client
+        self.__detect = detect
+
+    async def __initialize(self):
+        await self.__vault_client.initialize_client_configuration_async()
+
+    async def __poll_for_processed_file(self, run_id, max_wait_time=None):
+        max_wait_time = DetectConstants.WAIT_TIME if max_wait_time is None else max_wait_time
+        files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+        current_wait_time = 1  # Start with 1 second
+        try:
+            while True:
+                response = (await files_api.get_run(run_id, vault_id=self.__vault_client.get_vault_id())).data
+                status = response.status
+                if status == DetectStatus.IN_PROGRESS:
+                    if current_wait_time >= max_wait_time:
+                        return DeidentifyFileResponse(run_id=run_id, status=DetectStatus.IN_PROGRESS)
+                    else:
+                        next_wait_time = current_wait_time * 2
+                        if next_wait_time >= max_wait_time:
+                            wait_time = max_wait_time - current_wait_time
+                            current_wait_time = max_wait_time
+                        else:
+                            wait_time = next_wait_time
+                            current_wait_time = next_wait_time
+                        await asyncio.sleep(wait_time)
+                elif status == DetectStatus.SUCCESS or status == DetectStatus.FAILED:
+                    return response
+        except Exception as e:
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def deidentify_text(self, request: DeidentifyTextRequest) -> DeidentifyTextResponse:
+        log_info(SkyflowMessages.Info.VALIDATING_DEIDENTIFY_TEXT_INPUT.value, self.__vault_client.get_logger())
+        validate_deidentify_text_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        detect_api = self.__vault_client.get_async_detect_text_api()
+        deidentify_text_kwargs = self.__detect._get_deidentify_text_kwargs(request)
+
+        try:
+            log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await detect_api.deidentify_string(**deidentify_text_kwargs)
+            deidentify_text_response = parse_deidentify_text_response(api_response)
+            log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_SUCCESS.value, self.__vault_client.get_logger())
+            return deidentify_text_response
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DEIDENTIFY_TEXT_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def reidentify_text(self, request: ReidentifyTextRequest) -> ReidentifyTextResponse:
+        log_info(SkyflowMessages.Info.VALIDATING_REIDENTIFY_TEXT_INPUT.value, self.__vault_client.get_logger())
+        validate_reidentify_text_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        detect_api = self.__vault_client.get_async_detect_text_api()
+        reidentify_text_kwargs = self.__detect._get_reidentify_text_kwargs(request)
+
+        try:
+            log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await detect_api.reidentify_string(**reidentify_text_kwargs)
+            reidentify_text_response = parse_reidentify_text_response(api_response)
+            log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_SUCCESS.value, self.__vault_client.get_logger())
+            return reidentify_text_response
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.REIDENTIFY_TEXT_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def deidentify_file(self, request: DeidentifyFileRequest):
+        log_info(SkyflowMessages.Info.DETECT_FILE_TRIGGERED.value, self.__vault_client.get_logger())
+        validate_deidentify_file_request(self.__vault_client.get_logger(), request)
+        await self.__initialize()
+        files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+        file_name, file_extension, base64_string = await asyncio.to_thread(self.__detect._read_file, request)
+
+        try:
+            api_call, api_kwargs = self.__detect._get_deidentify_file_call(files_api, request, file_extension, base64_string)
+
+            log_info(SkyflowMessages.Info.DETECT_FILE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+            api_response = await api_call(**api_kwargs)
+
+            run_id = getattr(api_response.data, DeidentifyField.RUN_ID, None)
+
+            processed_response = await self.__poll_for_processed_file(run_id, request.wait_time)
+            parsed_response = self.__detect._build_deidentify_file_response(processed_response, request, file_name, run_id)
+            log_info(SkyflowMessages.Info.DETECT_FILE_SUCCESS.value, self.__vault_client.get_logger())
+            return parsed_response
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value,
+                          self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def submit_deidentify_file(self, request: DeidentifyFileRequest) -> DetectRun:
+        """Awaitable counterpart of Detect.submit_deidentify_file. The run is polled by the
+        Detect's background thread; await asyncio.wrap_future(run) for its response.
+        """
+        log_info(SkyflowMessages.Info.DETECT_FILE_TRIGGERED.value, self.__vault_client.get_logger())
+        validate_deidentify_file_request(self.__vault_client.get_logger(), request)
+        await self.__initialize()
+        files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+        file_name, file_extension, base64_string = await asyncio.to_thread(self.__detect._read_file, request)
+
+        try:
+            api_call, api_kwargs = self.__detect._get_deidentify_file_call(files_api, request, file_extension, base64_string)
+
+            log_info(SkyflowMessages.Info.DETECT_FILE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+            api_response = await api_call(**api_kwargs)
+            run_id = getattr(api_response.data, DeidentifyField.RUN_ID, None)
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value,
+                          self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+        return self.__detect._track_detect_run(run_id, request, file_name)
+
+    async def __submit_deidentify_file(self, files_api, request: DeidentifyFileRequest):
+        try:
+            validate_deidentify_file_request(self.__vault_client.get_logger(), request)
+            file_name, file_extension, base64_string = await asyncio.to_thread(self.__detect._read_file, request)
+            api_call, api_kwargs = self.__detect._get_deidentify_file_call(files_api, request, file_extension, base64_string)
+            api_response = await api_call(**api_kwargs)
+            return file_name, getattr(api_response.data, DeidentifyField.RUN_ID, None)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    async def __get_run(self, files_api, run_id):
+        try:
+            return (await files_api.get_run(run_id, vault_id=self.__vault_client.get_vault_id())).data
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def deidentify_files(self, requests, max_in_flight=BulkOperation.MAX_IN_FLIGHT):
+        """Async generator counterpart of Detect.deidentify_files; each round polls its runs concurrently."""
+        log_info(SkyflowMessages.Info.DETECT_FILES_TRIGGERED.value.format(max_in_flight), self.__vault_client.get_logger())
+        validate_deidentify_files_options(self.__vault_client.get_logger(), requests, max_in_flight)
+        return self.__deidentify_files(requests, max_in_flight)
+
+    async def __deidentify_files(self, requests, max_in_flight):
+        requests = enumerate(requests)
+        scheduler = DetectRunScheduler()
+        submitting = {}
+        statuses = []
+        try:
+            while True:
+                while len(submitting) < max_in_flight:
+                    entry = next(requests, None)
+                    if entry is None:
+                        break
+                    await self.__initialize()
+                    files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+                    submitting[asyncio.ensure_future(self.__submit_deidentify_file(files_api, entry[1]))] = entry
+                if not submitting and not scheduler:
+                    break
+
+                if submitting:
+                    done, _ = await asyncio.wait(submitting, timeout=scheduler.get_delay(), return_when=asyncio.FIRST_COMPLETED)
+                else:
+                    done = ()
+                    await asyncio.sleep(scheduler.get_delay())
+                for task in done:
+                    request_index, request = submitting.pop(task)
+                    result = task.result()
+                    if isinstance(result, SkyflowError):
+                        statuses.append(DetectStatus.FAILED)
+                        yield self.__detect._get_failed_deidentify_file_response(request_index, result)
+                    else:
+                        file_name, run_id = result
+                        scheduler.add(run_id, (request_index, request, file_name),
+                                      DetectConstants.WAIT_TIME if request.wait_time is None else request.wait_time)
+
+                run_ids = scheduler.get_due_run_ids()
+                if run_ids:
+                    await self.__initialize()
+                    files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+                    results = await asyncio.gather(*[self.__get_run(files_api, run_id) for run_id in run_ids])
+                    for run_id, result in zip(run_ids, results):
+                        response = self.__detect._get_deidentify_files_result(scheduler, run_id, result)
+                        if response is not None:
+                            statuses.append(response.status)
+                            yield response
+                    scheduler.end_round()
+        finally:
+            # Submissions still running when the caller stops iterating are abandoned.
+            for task in submitting:
+                task.cancel()
+        log_info(SkyflowMessages.Info.DETECT_FILES_SUCCESS.value.format(
+            statuses.count(DetectStatus.SUCCESS), statuses.count(DetectStatus.IN_PROGRESS), statuses.count(DetectStatus.FAILED)),
+            self.__vault_client.get_logger())
+
+    async def get_detect_run(self, request: GetDetectRunRequest):
+        log_info(SkyflowMessages.Info.GET_DETECT_RUN_TRIGGERED.value, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.VALIDATING_GET_DETECT_RUN_INPUT.value, self.__vault_client.get_logger())
+        validate_get_detect_run_request(self.__vault_client.get_logger(), request)
+        await self.__initialize()
+
+        files_api = self.__vault_client.get_async_detect_file_api().with_raw_response
+        run_id = request.run_id
+        try:
+            response = await files_api.get_run(
+                run_id,
+                vault_id=self.__vault_client.get_vault_id()
+            )
+            parsed_response = self.__detect._parse_get_detect_run_response(response.data, run_id)
+            log_info(SkyflowMessages.Info.GET_DETECT_RUN_SUCCESS.value, self.__vault_client.get_logger())
+            return parsed_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value,
+                          self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
@@ -0,0 +1,597 @@
+import asyncio
+from collections import deque
+from skyflow.utils import SkyflowMessages, parse_insert_response, \
+    handle_exception, parse_update_record_response, parse_delete_response, parse_detokenize_response, \
+    parse_tokenize_response, parse_query_response, parse_query_rows, split_query_limit, is_query_ordered, get_query_page, parse_get_response, construct_insert_records, \
+    construct_update_record, construct_detokenize_records, construct_tokenize_records, open_file_for_file_upload, \
+    get_async_chunks, get_insert_chunk_request, get_insert_chunk_requests, get_skyflow_error, merge_insert_responses, parse_detokenize_batch_records, construct_get_records_params, construct_get_page_params, get_page_ranges, get_chunks, get_get_many_fields, merge_get_responses, merge_delete_responses, is_retryable_error, \
+    construct_update_batch_records, parse_update_batch_response, merge_update_responses
+from skyflow.utils.constants import ResponseField, RequestOperation, HttpClient, HttpHeader, DetokenizeBatch, ResultCache, Pagination
+from skyflow.utils.logger import log_info, log_warn, log_error_log
+from skyflow.utils.validations import validate_insert_request, validate_bulk_options, validate_insert_stream_request, validate_delete_request, validate_query_request, \
+    validate_get_request, validate_get_many_request, validate_iter_records_options, validate_iter_query_options, validate_update_request, validate_update_many_request, validate_detokenize_request, validate_detokenize_batch_options, validate_cache_options, validate_tokenize_request, validate_tokenize_cache_options, validate_file_upload_request, validate_file_upload_batch
+from skyflow.vault.data import InsertRequest, BulkInsertRequest, UpdateRequest, UpdateManyRequest, DeleteRequest, BulkDeleteRequest, GetRequest, BulkGetRequest, QueryRequest, FileUploadRequest, FileUploadResponse, FileUploadBatch
+from skyflow.vault.tokens import DetokenizeRequest, DetokenizeResponse, TokenizeRequest
+from ._detokenize_batcher import AsyncDetokenizeBatcher
+from ._detokenize_cache import DetokenizeCache
+from ._tokenize_cache import TokenizeCache, TokenizePlan
+from ._file_upload_tracker import FileUploadTracker
+
+class AsyncVault:
+    """Awaitable counterpart of Vault.
+
+    Shares the VaultClient (configuration and bearer token) of the Vault it is obtained from,
+    and sends every call through a single pooled httpx.AsyncClient per vault. Bearer tokens are
+    minted in a worker thread, so they never block the event loop.
+    """
+    def __init__(self, vault_client):
+        self.__vault_client = vault_client
+        self.__detokenize_batcher = None
+        self.__detokenize_cache = None
+        self.__tokenize_cache = None
+
+    async def __initialize(self):
+        await self.__vault_client.initialize_client_configuration_async()
+
+    async def insert(self, request: InsertRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
+        validate_insert_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.INSERT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api().with_raw_response
+
+        try:
+            log_info(SkyflowMessages.Info.INSERT_TRIGGERED.value, self.__vault_client.get_logger())
+            insert_response = await self.__insert_records(records_api, request)
+            log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
+            return insert_response
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.INSERT_RECORDS_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __insert_records(self, records_api, request):
+        insert_body = construct_insert_records(request)
+        if request.continue_on_error:
+            api_response = await records_api.record_service_batch_operation(self.__vault_client.get_vault_id(),
+                                                                            records=insert_body, continue_on_error=request.continue_on_error, byot=request.token_mode.value)
+
+        else:
+            api_response = await records_api.record_service_insert_record(self.__vault_client.get_vault_id(),
+                                                                          request.table, records=insert_body, tokenization=request.return_tokens, upsert=request.upsert, homogeneous=request.homogeneous, byot=request.token_mode.value)
+        return parse_insert_response(api_response, request.continue_on_error)
+
+    async def __insert_chunk(self, records_api, chunk_request, semaphore):
+        async with semaphore:
+            try:
+                return await self.__insert_records(records_api, chunk_request)
+            except Exception as e:
+                log_error_log(SkyflowMessages.ErrorLogs.INSERT_RECORDS_REJECTED.value, self.__vault_client.get_logger())
+                return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    async def insert_many(self, request: BulkInsertRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
+        validate_insert_request(self.__vault_client.get_logger(), request)
+        validate_bulk_options(self.__vault_client.get_logger(), request, RequestOperation.INSERT)
+        log_info(SkyflowMessages.Info.INSERT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api().with_raw_response
+
+        chunks = list(get_insert_chunk_requests(request))
+        log_info(SkyflowMessages.Info.INSERT_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        semaphore = asyncio.Semaphore(request.max_in_flight)
+        results = await asyncio.gather(*(
+            self.__insert_chunk(records_api, chunk_request, semaphore) for _, chunk_request in chunks))
+        insert_response = merge_insert_responses(
+            (chunk_start, len(chunk_request.values), result) for (chunk_start, chunk_request), result in zip(chunks, results))
+        log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
+        return insert_response
+
+    async def __get_insert_chunk_requests(self, request):
+        if hasattr(request.values, '__aiter__'):
+            async for chunk_start, values in get_async_chunks(request.values, request.chunk_size, request.max_chunk_bytes):
+                yield chunk_start, get_insert_chunk_request(request, chunk_start, values)
+        else:
+            for chunk_start, chunk_request in get_insert_chunk_requests(request):
+                yield chunk_start, chunk_request
+
+    def insert_stream(self, request: BulkInsertRequest):
+        """Async generator counterpart of Vault.insert_stream; request.values may also be an async
+        iterable, in which case tokens, if any, must be a list aligned with it.
+        """
+        log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
+        validate_insert_stream_request(self.__vault_client.get_logger(), request)
+        return self.__insert_stream(request)
+
+    async def __insert_stream(self, request):
+        semaphore = asyncio.Semaphore(request.max_in_flight)
+        pending = {}
+        try:
+            async for chunk_start, chunk_request in self.__get_insert_chunk_requests(request):
+                validate_insert_request(self.__vault_client.get_logger(), chunk_request)
+                await self.__initialize()
+                records_api = self.__vault_client.get_async_records_api().with_raw_response
+                task = asyncio.ensure_future(self.__insert_chunk(records_api, chunk_request, semaphore))
+                pending[task] = (chunk_start, len(chunk_request.values))
+                # Chunks that finished meanwhile are yielded before the next chunk is read.
+                done = [task for task in pending if task.done()]
+                if not done and len(pending) >= request.max_in_flight:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield merge_insert_responses([(*pending.pop(task), task.result())])
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield merge_insert_responses([(*pending.pop(task), task.result())])
+        finally:
+            for task in pending:
+                task.cancel()
+        log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
+
+    async def update(self, request: UpdateRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_UPDATE_REQUEST.value, self.__vault_client.get_logger())
+        validate_update_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.UPDATE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        record = construct_update_record(request)
+
+        records_api = self.__vault_client.get_async_records_api()
+        try:
+            log_info(SkyflowMessages.Info.UPDATE_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await records_api.record_service_update_record(
+                self.__vault_client.get_vault_id(),
+                request.table,
+                id=request.data.get(ResponseField.SKYFLOW_ID),
+                record=record,
+                tokenization=request.return_tokens,
+                byot=request.token_mode.value
+            )
+            log_info(SkyflowMessages.Info.UPDATE_SUCCESS.value, self.__vault_client.get_logger())
+            update_response = parse_update_record_response(api_response)
+            return update_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.UPDATE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __update_chunk(self, records_api, request, chunk_start, chunk, semaphore):
+        async with semaphore:
+            try:
+                api_response = await records_api.record_service_batch_operation(
+                    self.__vault_client.get_vault_id(),
+                    records=construct_update_batch_records(request, chunk_start, chunk),
+                    continue_on_error=True,
+                    byot=request.token_mode.value
+                )
+                return parse_update_batch_response(api_response)
+            except Exception as e:
+                log_error_log(SkyflowMessages.ErrorLogs.UPDATE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+                return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    async def update_many(self, request: UpdateManyRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_UPDATE_REQUEST.value, self.__vault_client.get_logger())
+        validate_update_many_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.UPDATE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api().with_raw_response
+
+        chunks = list(get_chunks(request.data, request.chunk_size))
+        log_info(SkyflowMessages.Info.UPDATE_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        semaphore = asyncio.Semaphore(request.max_in_flight)
+        results = await asyncio.gather(*(self.__update_chunk(records_api, request, chunk_start, chunk, semaphore)
+                                         for chunk_start, chunk in chunks))
+        update_response = merge_update_responses(
+            (chunk_start, len(chunk), result) for (chunk_start, chunk), result in zip(chunks, results))
+        log_info(SkyflowMessages.Info.UPDATE_SUCCESS.value, self.__vault_client.get_logger())
+        return update_response
+
+    async def delete(self, request: DeleteRequest):
+        log_info(SkyflowMessages.Info.VALIDATING_DELETE_REQUEST.value, self.__vault_client.get_logger())
+        validate_delete_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.DELETE_REQUEST_RESOLVED.value,  self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api()
+        try:
+            log_info(SkyflowMessages.Info.DELETE_TRIGGERED.value, self.__vault_client.get_logger())
+            delete_response = await self.__delete_records(records_api, request.table, request.ids)
+            log_info(SkyflowMessages.Info.DELETE_SUCCESS.value, self.__vault_client.get_logger())
+            return delete_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DELETE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __delete_records(self, records_api, table, ids):
+        api_response = await records_api.record_service_bulk_delete_record(
+            self.__vault_client.get_vault_id(),
+            table,
+            skyflow_ids=ids
+        )
+        return parse_delete_response(api_response)
+
+    async def __delete_chunk(self, records_api, request, ids, semaphore):
+        async with semaphore:
+            attempt = 0
+            while True:
+                try:
+                    return await self.__delete_records(records_api, request.table, ids)
+                except Exception as e:
+                    if attempt >= request.max_retries or not is_retryable_error(e):
+                        log_error_log(SkyflowMessages.ErrorLogs.DELETE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+                        return get_skyflow_error(e, self.__vault_client.get_logger())
+                wait_time = HttpClient.RETRY_BACKOFF_FACTOR * (2 ** attempt)
+                log_info(SkyflowMessages.Info.DELETE_CHUNK_RETRIED.value.format(wait_time), self.__vault_client.get_logger())
+                await asyncio.sleep(wait_time)
+                attempt += 1
+
+    async def delete_many(self, request: BulkDeleteRequest):
+        log_info(SkyflowMessages.Info.VALIDATING_DELETE_REQUEST.value, self.__vault_client.get_logger())
+        validate_delete_request(self.__vault_client.get_logger(), request)
+        validate_bulk_options(self.__vault_client.get_logger(), request, RequestOperation.DELETE)
+        log_info(SkyflowMessages.Info.DELETE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api()
+
+        chunks = list(get_chunks(request.ids, request.chunk_size))
+        log_info(SkyflowMessages.Info.DELETE_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        semaphore = asyncio.Semaphore(request.max_in_flight)
+        results = await asyncio.gather(*(self.__delete_chunk(records_api, request, chunk_ids, semaphore)
+                                         for _, chunk_ids in chunks))
+        delete_response = merge_delete_responses(
+            (chunk_start, chunk_ids, result) for (chunk_start, chunk_ids), result in zip(chunks, results))
+        log_info(SkyflowMessages.Info.DELETE_SUCCESS.value, self.__vault_client.get_logger())
+        return delete_response
+
+    async def get(self, request: GetRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_GET_REQUEST.value, self.__vault_client.get_logger())
+        validate_get_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.GET_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api()
+        try:
+            log_info(SkyflowMessages.Info.GET_TRIGGERED.value, self.__vault_client.get_logger())
+            get_response = await self.__get_records(records_api, request, request.ids, request.fields)
+            log_info(SkyflowMessages.Info.GET_SUCCESS.value, self.__vault_client.get_logger())
+            return get_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __get_records(self, records_api, request, ids, fields):
+        api_response = await records_api.record_service_bulk_get_record(
+            self.__vault_client.get_vault_id(),
+            **construct_get_records_params(request, ids, fields)
+        )
+        return parse_get_response(api_response)
+
+    async def __get_chunk(self, records_api, request, ids, fields, semaphore):
+        async with semaphore:
+            try:
+                return await self.__get_records(records_api, request, ids, fields)
+            except Exception as e:
+                log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+                return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    async def get_many(self, request: BulkGetRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_GET_REQUEST.value, self.__vault_client.get_logger())
+        validate_get_many_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.GET_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        records_api = self.__vault_client.get_async_records_api()
+        fields = get_get_many_fields(request.fields)
+
+        chunks = list(get_chunks(request.ids, request.chunk_size))
+        log_info(SkyflowMessages.Info.GET_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        semaphore = asyncio.Semaphore(request.max_in_flight)
+        results = await asyncio.gather(*(self.__get_chunk(records_api, request, chunk_ids, fields, semaphore)
+                                         for _, chunk_ids in chunks))
+        get_response = merge_get_responses(
+            ((chunk_start, chunk_ids, result) for (chunk_start, chunk_ids), result in zip(chunks, results)), request.fields)
+        log_info(SkyflowMessages.Info.GET_SUCCESS.value, self.__vault_client.get_logger())
+        return get_response
+
+    async def __get_records_page(self, records_api, table, fields, redaction_type, offset, limit):
+        try:
+            api_response = await records_api.record_service_bulk_get_record(
+                self.__vault_client.get_vault_id(),
+                **construct_get_page_params(table, fields, redaction_type, offset, limit)
+            )
+            return parse_get_response(api_response).data
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    def iter_records(self, table, fields = None, redaction_type = None, page_size = Pagination.PAGE_SIZE, max_in_flight = Pagination.MAX_IN_FLIGHT):
+        """Yield every record of table as a dict, reading it page_size records at a time.
+
+        Up to max_in_flight pages are fetched ahead of the caller, so the next page is usually
+        ready by the time the current one is consumed, and at most that many pages are held.
+        """
+        validate_iter_records_options(self.__vault_client.get_logger(), table, fields, redaction_type, page_size, max_in_flight)
+        log_info(SkyflowMessages.Info.ITER_RECORDS_TRIGGERED.value.format(table, page_size), self.__vault_client.get_logger())
+        return self.__iter_pages(self.__vault_client.get_async_records_api,
+                                 lambda records_api, offset, limit: self.__get_records_page(records_api, table, fields, redaction_type, offset, limit),
+                                 get_page_ranges(page_size), max_in_flight)
+
+    async def __iter_pages(self, get_api, get_page, page_ranges, max_in_flight):
+        """Yield the items of the page at each (offset, limit) of page_ranges, fetched with
+        get_page(api, offset, limit), until a page comes back short.
+        """
+        pages = deque()
+        next_range = next(page_ranges, None)
+        try:
+            while True:
+                if len(pages) < max_in_flight and next_range is not None:
+                    # The token can expire during a long read, so it is refreshed for each batch.
+                    await self.__initialize()
+                    api = get_api()
+                while len(pages) < max_in_flight and next_range is not None:
+                    offset, limit = next_range
+                    pages.append((limit, asyncio.ensure_future(get_page(api, offset, limit))))
+                    next_range = next(page_ranges, None)
+                if not pages:
+                    return
+                limit, page_future = pages.popleft()
+                page = await page_future
+                for item in page:
+                    yield item
+                if len(page) < limit:
+                    return
+        finally:
+            for _, pending_page in pages:
+                pending_page.cancel()
+
+    async def __get_query_page(self, query_api, query):
+        try:
+            api_response = await query_api.query_service_execute_query(
+                self.__vault_client.get_vault_id(),
+                query=query
+            )
+            return parse_query_rows(api_response)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.QUERY_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    def iter_query(self, query, page_size = Pagination.PAGE_SIZE, max_in_flight = Pagination.MAX_IN_FLIGHT):
+        """Yield every row that the SELECT query returns as a QueryRow, reading it page_size
+        rows at a time with LIMIT and OFFSET.
+
+        A trailing LIMIT or OFFSET in query bounds the rows read. Up to max_in_flight pages are
+        fetched ahead of the caller, and at most that many pages are held. Since pages are read
+        by OFFSET, query needs an ORDER BY on a unique column for its rows to be read exactly once.
+        """
+        validate_iter_query_options(self.__vault_client.get_logger(), query, page_size, max_in_flight)
+        base_query, query_limit, query_offset = split_query_limit(query, self.__vault_client.get_logger())
+        if not is_query_ordered(base_query):
+            log_warn(SkyflowMessages.Warning.ITER_QUERY_WITHOUT_ORDER_BY.value, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.ITER_QUERY_TRIGGERED.value.format(page_size), self.__vault_client.get_logger())
+        return self.__iter_pages(self.__vault_client.get_async_query_api,
+                                 lambda query_api, offset, limit: self.__get_query_page(query_api, get_query_page(base_query, offset, limit)),
+                                 get_page_ranges(page_size, query_limit, query_offset), max_in_flight)
+
+    async def query(self, request: QueryRequest):
+        log_info(SkyflowMessages.Info.VALIDATING_QUERY_REQUEST.value, self.__vault_client.get_logger())
+        validate_query_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.QUERY_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        query_api = self.__vault_client.get_async_query_api()
+        try:
+            log_info(SkyflowMessages.Info.QUERY_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await query_api.query_service_execute_query(
+                self.__vault_client.get_vault_id(),
+                query=request.query
+            )
+            log_info(SkyflowMessages.Info.QUERY_SUCCESS.value, self.__vault_client.get_logger())
+            query_response = parse_query_response(api_response)
+            return query_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.QUERY_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    def enable_detokenize_batching(self, max_batch_size = DetokenizeBatch.MAX_BATCH_SIZE, max_wait_time = DetokenizeBatch.MAX_WAIT_TIME):
+        """Coalesce concurrent detokenize calls on this vault into batched API calls.
+
+        A batch is sent once it holds max_batch_size tokens or max_wait_time seconds after
+        its first call. Each call still returns only its own detokenized_fields and errors;
+        a call without continue_on_error raises when any of its own tokens fail.
+        """
+        validate_detokenize_batch_options(self.__vault_client.get_logger(), max_batch_size, max_wait_time)
+        self.__detokenize_batcher = AsyncDetokenizeBatcher(self.__send_detokenize_batch, max_batch_size, max_wait_time)
+
+    def disable_detokenize_batching(self):
+        self.__detokenize_batcher = None
+
+    def enable_detokenize_cache(self, max_size = ResultCache.MAX_SIZE, ttl = ResultCache.TTL):
+        """Answer detokenize calls on this vault from an in-memory cache where possible.
+
+        Detokenized values are kept for ttl seconds, up to max_size of them with the least
+        recently used evicted first, and only the tokens that miss the cache are sent.
+        """
+        validate_cache_options(self.__vault_client.get_logger(), RequestOperation.DETOKENIZE, max_size, ttl)
+        self.__detokenize_cache = DetokenizeCache(max_size, ttl)
+
+    def disable_detokenize_cache(self):
+        self.__detokenize_cache = None
+
+    @property
+    def detokenize_cache(self):
+        return self.__detokenize_cache
+
+    async def detokenize(self, request: DetokenizeRequest):
+        log_info(SkyflowMessages.Info.VALIDATE_DETOKENIZE_REQUEST.value, self.__vault_client.get_logger())
+        validate_detokenize_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.DETOKENIZE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+        if self.__detokenize_cache is not None:
+            return await self.__detokenize_cached(request)
+        return await self.__detokenize(request)
+
+    async def __detokenize_cached(self, request):
+        cache = self.__detokenize_cache
+        vault_id = self.__vault_client.get_vault_id()
+        cached_fields, uncached_data = cache.get_uncached_data(vault_id, request.data)
+        log_info(SkyflowMessages.Info.DETOKENIZE_CACHE_HITS.value.format(len(request.data) - len(uncached_data), len(request.data)), self.__vault_client.get_logger())
+        if uncached_data:
+            response = await self.__detokenize(DetokenizeRequest(data=uncached_data, continue_on_error=request.continue_on_error))
+        else:
+            response = DetokenizeResponse(detokenized_fields=[], errors=None)
+        return cache.merge(vault_id, request.data, cached_fields, response)
+
+    async def __detokenize(self, request):
+        tokens_list = construct_detokenize_records(request)
+        if self.__detokenize_batcher is not None:
+            return await self.__detokenize_batched(request, tokens_list)
+        tokens_api = self.__vault_client.get_async_tokens_api().with_raw_response
+        try:
+            log_info(SkyflowMessages.Info.DETOKENIZE_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await tokens_api.record_service_detokenize(
+                self.__vault_client.get_vault_id(),
+                detokenization_parameters=tokens_list,
+                continue_on_error = request.continue_on_error
+            )
+            log_info(SkyflowMessages.Info.DETOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
+            detokenize_response = parse_detokenize_response(api_response)
+            return detokenize_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __send_detokenize_batch(self, tokens_list, request_count):
+        # Sent with continue_on_error so that one caller's bad token does not fail the others.
+        log_info(SkyflowMessages.Info.DETOKENIZE_BATCH_TRIGGERED.value.format(len(tokens_list), request_count), self.__vault_client.get_logger())
+        tokens_api = self.__vault_client.get_async_tokens_api().with_raw_response
+        api_response = await tokens_api.record_service_detokenize(
+            self.__vault_client.get_vault_id(),
+            detokenization_parameters=tokens_list,
+            continue_on_error=True
+        )
+        return api_response.headers.get(HttpHeader.X_REQUEST_ID), api_response.data.records
+
+    async def __detokenize_batched(self, request, tokens_list):
+        try:
+            request_id, records = await self.__detokenize_batcher.detokenize(tokens_list, self.__vault_client.get_timeout())
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            raise get_skyflow_error(e, self.__vault_client.get_logger())
+        detokenize_response = parse_detokenize_batch_records(records, request_id, request.continue_on_error, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.DETOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
+        return detokenize_response
+
+    def enable_tokenize_cache(self, column_groups, max_size = ResultCache.MAX_SIZE, ttl = ResultCache.TTL):
+        """Answer tokenize calls for values of column_groups from an in-memory cache where possible.
+
+        List only column groups with deterministic tokenization. Tokens are kept for ttl
+        seconds, up to max_size of them with the least recently used evicted first.
+        """
+        validate_tokenize_cache_options(self.__vault_client.get_logger(), column_groups, max_size, ttl)
+        self.__tokenize_cache = TokenizeCache(column_groups, max_size, ttl)
+
+    def disable_tokenize_cache(self):
+        self.__tokenize_cache = None
+
+    @property
+    def tokenize_cache(self):
+        return self.__tokenize_cache
+
+    async def tokenize(self, request: TokenizeRequest):
+        """Tokenize request.values, sending each distinct (value, column_group) pair once.
+
+        Tokens are fanned back out so that tokenized_fields still has one entry per value.
+        """
+        log_info(SkyflowMessages.Info.VALIDATING_TOKENIZE_REQUEST.value, self.__vault_client.get_logger())
+        validate_tokenize_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.TOKENIZE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        await self.__initialize()
+
+        vault_id = self.__vault_client.get_vault_id()
+        plan = TokenizePlan(vault_id, request.values, self.__tokenize_cache)
+        log_info(SkyflowMessages.Info.TOKENIZE_VALUES_RESOLVED.value.format(len(plan.distinct_values), len(request.values)), self.__vault_client.get_logger())
+        if not plan.distinct_values:
+            return plan.get_response()
+
+        records_list = construct_tokenize_records(TokenizeRequest(values=plan.distinct_values))
+        tokens_api = self.__vault_client.get_async_tokens_api()
+        try:
+            log_info(SkyflowMessages.Info.TOKENIZE_TRIGGERED.value, self.__vault_client.get_logger())
+            api_response = await tokens_api.record_service_tokenize(
+                vault_id,
+                tokenization_parameters=records_list
+            )
+            tokenize_response = plan.get_response(parse_tokenize_response(api_response))
+            log_info(SkyflowMessages.Info.TOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
+            return tokenize_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.TOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    async def __upload_file(self, file_upload_api, request):
+        with open_file_for_file_upload(request) as file:
+            api_response = await file_upload_api.upload_file_v_2(
+                self.__vault_client.get_vault_id(),
+                table_name=request.table,
+                column_name=request.column_name,
+                file=file,
+                skyflow_id=request.skyflow_id,
+                return_file_metadata= False
+            )
+        return api_response.data.skyflow_id
+
+    async def __upload_batch_file(self, file_upload_api, request):
+        try:
+            validate_file_upload_request(self.__vault_client.get_logger(), request)
+            return await self.__upload_file(file_upload_api, request)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.FILE_UPLOAD_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    async def upload_files(self, batch: FileUploadBatch):
+        """Awaitable counterpart of Vault.upload_files; batch.requests must be a list or a
+        synchronous iterable.
+        """
+        log_info(SkyflowMessages.Info.FILE_UPLOAD_BATCH_TRIGGERED.value.format(batch.max_in_flight), self.__vault_client.get_logger())
+        validate_file_upload_batch(self.__vault_client.get_logger(), batch)
+        tracker = FileUploadTracker(batch)
+        pending = {}
+        try:
+            for request_index, request in enumerate(batch.requests):
+                key = await asyncio.to_thread(tracker.get_key, request)
+                uploaded_skyflow_id = tracker.get_uploaded_skyflow_id(key)
+                if uploaded_skyflow_id is not None:
+                    tracker.skip(request_index, uploaded_skyflow_id)
+                    continue
+                await self.__initialize()
+                file_upload_api = self.__vault_client.get_async_records_api().with_raw_response
+                task = asyncio.ensure_future(self.__upload_batch_file(file_upload_api, request))
+                pending[task] = (request_index, key)
+                if len(pending) >= batch.max_in_flight:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        tracker.add_result(*pending.pop(task), task.result())
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    tracker.add_result(*pending.pop(task), task.result())
+        finally:
+            for task in pending:
+                task.cancel()
+        upload_response = tracker.get_response()
+        log_info(SkyflowMessages.Info.FILE_UPLOAD_BATCH_SUCCESS.value.format(
+            len(upload_response.uploaded_files) - tracker.skipped, tracker.skipped, len(upload_response.errors or [])), self.__vault_client.get_logger())
+        return upload_response
+
+    async def upload_file(self, request: FileUploadRequest):
+        log_info(SkyflowMessages.Info.FILE_UPLOAD_TRIGGERED.value, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.VALIDATING_FILE_UPLOAD_REQUEST.value, self.__vault_client.get_logger())
+        validate_file_upload_request(self.__vault_client.get_logger(), request)
+        await self.__initialize()
+        file_upload_api = self.__vault_client.get_async_records_api().with_raw_response
+        try:
+            skyflow_id = await self.__upload_file(file_upload_api, request)
+            log_info(SkyflowMessages.Info.FILE_UPLOAD_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+            log_info(SkyflowMessages.Info.FILE_UPLOAD_SUCCESS.value, self.__vault_client.get_logger())
+            upload_response = FileUploadResponse(
+                skyflow_id=skyflow_id,
+                errors=None
+            )
+            return upload_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.FILE_UPLOAD_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
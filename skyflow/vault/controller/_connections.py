@@ -1,19 +1,64 @@
-import json
+import threading
 import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+from urllib3.util.retry import Retry
 from skyflow.error import SkyflowError
-from skyflow.utils import construct_invoke_connection_request, SkyflowMessages, get_metrics, \
+from skyflow.utils import construct_invoke_connection_request, SkyflowMessages, get_metrics_headers, \
     parse_invoke_connection_response
 from skyflow.utils.logger import log_info, log_error_log
 from skyflow.vault.connection import InvokeConnectionRequest
-from skyflow.utils.constants import SKY_META_DATA_HEADER, SKYFLOW, HttpHeader, OptionField, ConfigField
+from skyflow.utils.constants import SKYFLOW, HttpHeader, OptionField, ConfigField, HttpClient, \
+    UrlProtocol
 from skyflow.utils import get_credentials
+from ._async_connection import AsyncConnection
 
 
 class Connection:
     def __init__(self, vault_client):
         self.__vault_client = vault_client
+        self.__session = None
+        self.__session_options = None
+        self.__session_lock = threading.Lock()
+        self.__async_connection = None
 
-    def invoke(self, request: InvokeConnectionRequest):
+    @property
+    def aio(self) -> AsyncConnection:
+        if self.__async_connection is None:
+            self.__async_connection = AsyncConnection(self.__vault_client, self)
+        return self.__async_connection
+
+    def __get_session(self):
+        # The session is pooled across threads; only max_connections and max_retries apply to
+        # it, while max_keepalive_connections, keepalive_expiry and http2 apply to aio.invoke.
+        config = self.__vault_client.get_config()
+        session_options = (config.get(ConfigField.MAX_CONNECTIONS, DEFAULT_POOLSIZE), config.get(ConfigField.MAX_RETRIES, 0))
+        with self.__session_lock:
+            if self.__session is not None and self.__session_options == session_options:
+                return self.__session
+            if self.__session is not None:
+                # Closing only drops idle connections, so requests in flight on it still finish.
+                self.__session.close()
+            max_connections, max_retries = session_options
+            adapter = HTTPAdapter(
+                pool_maxsize=max_connections,
+                # Connect errors are always safe to retry; gateway errors only for idempotent methods,
+                # so a request to a card processor is never replayed after it was accepted.
+                max_retries=Retry(
+                    total=max_retries,
+                    read=False,
+                    status_forcelist=HttpClient.RETRY_STATUS_CODES,
+                    backoff_factor=HttpClient.RETRY_BACKOFF_FACTOR,
+                    raise_on_status=False
+                )
+            )
+            session = requests.Session()
+            session.mount(f"{UrlProtocol.HTTPS}://", adapter)
+            session.mount(f"{UrlProtocol.HTTP}://", adapter)
+            self.__session_options = session_options
+            self.__session = session
+            return session
+
+    def _prepare_request(self, request: InvokeConnectionRequest):
         log_info(SkyflowMessages.Info.VALIDATING_INVOKE_CONNECTION_REQUEST.value, self.__vault_client.get_logger())
         config = self.__vault_client.get_config()
         connection_url = config.get(OptionField.CONNECTION_URL)
@@ -24,18 +69,20 @@ class Connection:
 
         bearer_token = self.__vault_client.get_bearer_token(credentials)
 
-        session = requests.Session()
-
         if not HttpHeader.X_SKYFLOW_AUTHORIZATION_HEADER.lower() in invoke_connection_request.headers:
             invoke_connection_request.headers[SKYFLOW.X_SKYFLOW_AUTHORIZATION] = bearer_token
 
-        invoke_connection_request.headers[SKY_META_DATA_HEADER] = json.dumps(get_metrics())
+        invoke_connection_request.headers.update(get_metrics_headers())
+        return invoke_connection_request
+
+    def invoke(self, request: InvokeConnectionRequest):
+        invoke_connection_request = self._prepare_request(request)
+        session = self.__get_session()
 
         log_info(SkyflowMessages.Info.INVOKE_CONNECTION_TRIGGERED.value, self.__vault_client.get_logger())
 
         try:
-            response = session.send(invoke_connection_request)
-            session.close()
+            response = session.send(invoke_connection_request, timeout=self.__vault_client.get_config().get(ConfigField.TIMEOUT, HttpClient.TIMEOUT))
             invoke_connection_response = parse_invoke_connection_response(response)
             return invoke_connection_response
 
@@ -43,4 +90,4 @@ class Connection:
             log_error_log(SkyflowMessages.ErrorLogs.INVOKE_CONNECTION_REQUEST_REJECTED.value, self.__vault_client.get_logger())
             if isinstance(e, SkyflowError): raise e
             raise SkyflowError(SkyflowMessages.Error.INVOKE_CONNECTION_FAILED.value,
-                               SkyflowMessages.ErrorCodes.SERVER_ERROR.value)
\ No newline at end of file
+                               SkyflowMessages.ErrorCodes.SERVER_ERROR.value)
@@ -1,35 +1,43 @@
 import io
-import json
 import os
 import base64
 import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from skyflow.error import SkyflowError
 from skyflow.generated.rest import FileDataDeidentifyText, FileDataDeidentifyPdf, FileDataDeidentifyPresentation, \
     FileDataDeidentifySpreadsheet, FileDataDeidentifyDocument, FileDataDeidentifyStructuredText, FileData, \
     FileDataDeidentifyImage, Format, FileDataDeidentifyAudio, WordCharacterCount, DetectRunsResponse
 from skyflow.utils._skyflow_messages import SkyflowMessages
-from skyflow.utils._utils import get_attribute, get_metrics, handle_exception, parse_deidentify_text_response, parse_reidentify_text_response
-from skyflow.utils.constants import (SKY_META_DATA_HEADER, DetectStatus, FileExtension,
-                                      FileProcessing, EncodingType, DeidentifyField, DeidentifyFileRequestField, FileUploadField, OptionField, Detect as DetectConstants)
+from skyflow.utils._base64_stream import encode_file_to_base64
+from skyflow.utils._utils import get_attribute, handle_exception, get_skyflow_error, get_chunk_errors, \
+    parse_deidentify_text_response, parse_reidentify_text_response
+from skyflow.utils.constants import (DetectStatus, FileExtension, BulkOperation,
+                                      FileProcessing, DeidentifyField, DeidentifyFileRequestField, FileUploadField, OptionField, Detect as DetectConstants)
 from skyflow.utils.logger import log_info, log_error_log
-from skyflow.utils.validations import validate_deidentify_file_request, validate_get_detect_run_request
+from skyflow.utils.validations import validate_deidentify_file_request, validate_deidentify_files_options, validate_get_detect_run_request
 from skyflow.utils.validations._validations import validate_deidentify_text_request, validate_reidentify_text_request
 from typing import Dict, Any
+from ._async_detect import AsyncDetect
+from ._detect_run_poller import DetectRunPoller
+from ._detect_run_scheduler import DetectRunScheduler
 from skyflow.vault.detect import DeidentifyTextRequest, DeidentifyTextResponse, ReidentifyTextRequest, \
-    ReidentifyTextResponse, DeidentifyFileRequest, DeidentifyFileResponse, GetDetectRunRequest
+    ReidentifyTextResponse, DeidentifyFileRequest, DeidentifyFileResponse, GetDetectRunRequest, DetectRun
 
 class Detect:
     def __init__(self, vault_client):
         self.__vault_client = vault_client
+        self.__async_detect = None
+        self.__run_poller = DetectRunPoller(self.__get_submitted_run, self._build_deidentify_file_response)
+
+    @property
+    def aio(self) -> AsyncDetect:
+        if self.__async_detect is None:
+            self.__async_detect = AsyncDetect(self.__vault_client, self)
+        return self.__async_detect
 
     def __initialize(self):
         self.__vault_client.initialize_client_configuration()
 
-    def __get_headers(self):
-        headers = {
-            SKY_META_DATA_HEADER: json.dumps(get_metrics())
-        }
-        return headers
-      
     def __build_deidentify_text_body(self, request: DeidentifyTextRequest) -> Dict[str, Any]:
         deidentify_text_body = {}
         parsed_entity_types = request.entities
@@ -63,7 +71,7 @@ class Detect:
         current_wait_time = 1  # Start with 1 second
         try:
             while True:
-                response = files_api.get_run(run_id, vault_id=self.__vault_client.get_vault_id(), request_options={'additional_headers': self.__get_headers()}).data
+                response = files_api.get_run(run_id, vault_id=self.__vault_client.get_vault_id()).data
                 status = response.status
                 if status == DetectStatus.IN_PROGRESS:
                     if current_wait_time >= max_wait_time:
@@ -224,26 +232,37 @@ class Detect:
             }
         }
 
+    def _get_deidentify_text_kwargs(self, request: DeidentifyTextRequest) -> Dict[str, Any]:
+        deidentify_text_body = self.__build_deidentify_text_body(request)
+        return {
+            OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+            DeidentifyField.TEXT: deidentify_text_body[DeidentifyField.TEXT],
+            DeidentifyField.ENTITY_TYPES: deidentify_text_body[DeidentifyField.ENTITY_TYPES],
+            DeidentifyField.ALLOW_REGEX: deidentify_text_body[DeidentifyField.ALLOW_REGEX],
+            DeidentifyField.RESTRICT_REGEX: deidentify_text_body[DeidentifyField.RESTRICT_REGEX],
+            DeidentifyField.TOKEN_TYPE: deidentify_text_body[DeidentifyField.TOKEN_TYPE],
+            DeidentifyField.TRANSFORMATIONS: deidentify_text_body[DeidentifyField.TRANSFORMATIONS],
+        }
+
+    def _get_reidentify_text_kwargs(self, request: ReidentifyTextRequest) -> Dict[str, Any]:
+        reidentify_text_body = self.__build_reidentify_text_body(request)
+        return {
+            OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+            DeidentifyField.TEXT: reidentify_text_body[DeidentifyField.TEXT],
+            DeidentifyField.FORMAT: reidentify_text_body[DeidentifyField.FORMAT],
+        }
+
     def deidentify_text(self, request: DeidentifyTextRequest) -> DeidentifyTextResponse:
         log_info(SkyflowMessages.Info.VALIDATING_DEIDENTIFY_TEXT_INPUT.value, self.__vault_client.get_logger())
         validate_deidentify_text_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
         detect_api = self.__vault_client.get_detect_text_api()
-        deidentify_text_body = self.__build_deidentify_text_body(request)
+        deidentify_text_kwargs = self._get_deidentify_text_kwargs(request)
         
         try:
             log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_TRIGGERED.value, self.__vault_client.get_logger())
-            api_response = detect_api.deidentify_string(
-              vault_id=self.__vault_client.get_vault_id(),
-              text=deidentify_text_body[DeidentifyField.TEXT],
-              entity_types=deidentify_text_body[DeidentifyField.ENTITY_TYPES],
-              allow_regex=deidentify_text_body[DeidentifyField.ALLOW_REGEX],
-              restrict_regex=deidentify_text_body[DeidentifyField.RESTRICT_REGEX],
-              token_type=deidentify_text_body[DeidentifyField.TOKEN_TYPE],
-              transformations=deidentify_text_body[DeidentifyField.TRANSFORMATIONS],
-              request_options={'additional_headers': self.__get_headers()}
-            )
+            api_response = detect_api.deidentify_string(**deidentify_text_kwargs)
             deidentify_text_response = parse_deidentify_text_response(api_response)
             log_info(SkyflowMessages.Info.DEIDENTIFY_TEXT_SUCCESS.value, self.__vault_client.get_logger())
             return deidentify_text_response
@@ -258,16 +277,11 @@ class Detect:
         log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
         detect_api = self.__vault_client.get_detect_text_api()
-        reidentify_text_body = self.__build_reidentify_text_body(request)
+        reidentify_text_kwargs = self._get_reidentify_text_kwargs(request)
         
         try:
             log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_TRIGGERED.value, self.__vault_client.get_logger())
-            api_response = detect_api.reidentify_string(
-                vault_id=self.__vault_client.get_vault_id(),
-                text=reidentify_text_body[DeidentifyField.TEXT],
-                format=reidentify_text_body[DeidentifyField.FORMAT],
-                request_options={'additional_headers': self.__get_headers()}
-            )
+            api_response = detect_api.reidentify_string(**reidentify_text_kwargs)
             reidentify_text_response = parse_reidentify_text_response(api_response)
             log_info(SkyflowMessages.Info.REIDENTIFY_TEXT_SUCCESS.value, self.__vault_client.get_logger())
             return reidentify_text_response
@@ -283,156 +297,193 @@ class Detect:
             return file_input.file
 
         if hasattr(file_input, FileUploadField.FILE_PATH) and file_input.file_path is not None:
-            with open(file_input.file_path, 'rb') as f:
-                content = f.read()
-            bio = io.BytesIO(content)
-            bio.name = file_input.file_path
-            return bio
+            return open(file_input.file_path, 'rb')
+
+    def _read_file(self, request: DeidentifyFileRequest):
+        file_obj = self.__get_file_from_request(request)
+        file_name = getattr(file_obj, FileUploadField.NAME, None)
+        file_extension = self._get_file_extension(file_name) if file_name else None
+        try:
+            base64_string = encode_file_to_base64(file_obj)
+        finally:
+            # Close the file opened from file_path, but not a file object passed by the caller.
+            if file_obj is not getattr(request.file, FileUploadField.FILE, None):
+                file_obj.close()
+        return file_name, file_extension, base64_string
+
+    def _get_deidentify_file_call(self, files_api, request: DeidentifyFileRequest, file_extension, base64_string):
+        if file_extension == FileExtension.TXT:
+            req_file = FileDataDeidentifyText(base_64=base64_string, data_format=FileExtension.TXT)
+            api_call = files_api.deidentify_text
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
+            }
+
+        elif file_extension in [FileExtension.MP3, FileExtension.WAV]:
+            req_file = FileDataDeidentifyAudio(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_audio
+            bleep = request.bleep
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
+                DeidentifyFileRequestField.OUTPUT_TRANSCRIPTION: getattr(request, DeidentifyFileRequestField.OUTPUT_TRANSCRIPTION, None),
+                DeidentifyFileRequestField.OUTPUT_PROCESSED_AUDIO: getattr(request, DeidentifyFileRequestField.OUTPUT_PROCESSED_AUDIO, None),
+                DeidentifyField.BLEEP_GAIN: bleep.gain if bleep is not None else None,
+                DeidentifyField.BLEEP_FREQUENCY: bleep.frequency if bleep is not None else None,
+                DeidentifyField.BLEEP_START_PADDING: bleep.start_padding if bleep is not None else None,
+                DeidentifyField.BLEEP_STOP_PADDING: bleep.stop_padding if bleep is not None else None,
+            }
+
+        elif file_extension == FileExtension.PDF:
+            req_file = FileDataDeidentifyPdf(base_64=base64_string)
+            api_call = files_api.deidentify_pdf
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyFileRequestField.MAX_RESOLUTION: getattr(request, DeidentifyFileRequestField.MAX_RESOLUTION, None),
+                DeidentifyFileRequestField.DENSITY: getattr(request, DeidentifyFileRequestField.PIXEL_DENSITY, None),
+            }
+
+        elif file_extension in [FileExtension.JPEG, FileExtension.JPG, FileExtension.PNG, FileExtension.BMP, FileExtension.TIF, FileExtension.TIFF]:
+            req_file = FileDataDeidentifyImage(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_image
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyFileRequestField.MASKING_METHOD: getattr(request, DeidentifyFileRequestField.MASKING_METHOD, None),
+                DeidentifyFileRequestField.OUTPUT_OCR_TEXT: getattr(request, DeidentifyFileRequestField.OUTPUT_OCR_TEXT, None),
+                DeidentifyFileRequestField.OUTPUT_PROCESSED_IMAGE: getattr(request, DeidentifyFileRequestField.OUTPUT_PROCESSED_IMAGE, None),
+            }
+
+        elif file_extension in [FileExtension.PPT, FileExtension.PPTX]:
+            req_file = FileDataDeidentifyPresentation(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_presentation
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+            }
+
+        elif file_extension in [FileExtension.CSV, FileExtension.XLS, FileExtension.XLSX]:
+            req_file = FileDataDeidentifySpreadsheet(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_spreadsheet
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+            }
+
+        elif file_extension in [FileExtension.DOC, FileExtension.DOCX]:
+            req_file = FileDataDeidentifyDocument(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_document
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+            }
+
+        elif file_extension in [FileExtension.JSON, FileExtension.XML]:
+            req_file = FileDataDeidentifyStructuredText(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_structured_text
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
+            }
+
+        else:
+            req_file = FileData(base_64=base64_string, data_format=file_extension)
+            api_call = files_api.deidentify_file
+            api_kwargs = {
+                OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
+                DeidentifyField.FILE: req_file,
+                DeidentifyField.ENTITY_TYPES: request.entities,
+                DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
+                DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
+                DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
+                DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
+            }
+
+        return api_call, api_kwargs
+
+    def _build_deidentify_file_response(self, processed_response, request: DeidentifyFileRequest, file_name, run_id):
+        if request.output_directory and processed_response.status == DetectStatus.SUCCESS and file_name:
+            name_without_ext, _ = os.path.splitext(file_name)
+            self.__save_deidentify_file_response_output(processed_response, request.output_directory, file_name, name_without_ext)
+
+        return self.__parse_deidentify_file_response(processed_response, run_id)
+
+    def _get_failed_deidentify_file_response(self, request_index, error, run_id=None):
+        return DeidentifyFileResponse(run_id=run_id, status=DetectStatus.FAILED,
+                                      errors=get_chunk_errors(error, request_index, 1), request_index=request_index)
+
+    def _get_deidentify_files_result(self, scheduler, run_id, result):
+        """Return the response for run_id given the result of polling it, the data of a get_run
+        response or a SkyflowError, or None if the run is in progress and still waited for.
+        """
+        if not isinstance(result, SkyflowError):
+            if result.status == DetectStatus.SUCCESS or result.status == DetectStatus.FAILED:
+                processed_response = result
+            elif scheduler.is_expired(run_id):
+                processed_response = DeidentifyFileResponse(run_id=run_id, status=DetectStatus.IN_PROGRESS)
+            else:
+                return None
+        request_index, request, file_name = scheduler.pop(run_id)
+        if isinstance(result, SkyflowError):
+            return self._get_failed_deidentify_file_response(request_index, result, run_id)
+        try:
+            response = self._build_deidentify_file_response(processed_response, request, file_name, run_id)
+        except Exception as e:
+            return self._get_failed_deidentify_file_response(request_index, get_skyflow_error(e, self.__vault_client.get_logger()), run_id)
+        response.request_index = request_index
+        return response
+
+    def _parse_get_detect_run_response(self, data, run_id):
+        if data.status == DetectStatus.IN_PROGRESS:
+            return DeidentifyFileResponse(run_id=run_id, status=DetectStatus.IN_PROGRESS)
+        return self.__parse_deidentify_file_response(data, run_id, data.status)
 
     def deidentify_file(self, request: DeidentifyFileRequest):
         log_info(SkyflowMessages.Info.DETECT_FILE_TRIGGERED.value, self.__vault_client.get_logger())
         validate_deidentify_file_request(self.__vault_client.get_logger(), request)
         self.__initialize()
         files_api = self.__vault_client.get_detect_file_api().with_raw_response
-        file_obj = self.__get_file_from_request(request)
-        file_name = getattr(file_obj, FileUploadField.NAME, None)
-        file_extension = self._get_file_extension(file_name) if file_name else None
-        file_content = file_obj.read()
-        base64_string = base64.b64encode(file_content).decode(EncodingType.UTF_8)
+        file_name, file_extension, base64_string = self._read_file(request)
 
         try:
-            if file_extension == FileExtension.TXT:
-                req_file = FileDataDeidentifyText(base_64=base64_string, data_format=FileExtension.TXT)
-                api_call = files_api.deidentify_text
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.MP3, FileExtension.WAV]:
-                req_file = FileDataDeidentifyAudio(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_audio
-                bleep = request.bleep
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
-                    DeidentifyFileRequestField.OUTPUT_TRANSCRIPTION: getattr(request, DeidentifyFileRequestField.OUTPUT_TRANSCRIPTION, None),
-                    DeidentifyFileRequestField.OUTPUT_PROCESSED_AUDIO: getattr(request, DeidentifyFileRequestField.OUTPUT_PROCESSED_AUDIO, None),
-                    DeidentifyField.BLEEP_GAIN: bleep.gain if bleep is not None else None,
-                    DeidentifyField.BLEEP_FREQUENCY: bleep.frequency if bleep is not None else None,
-                    DeidentifyField.BLEEP_START_PADDING: bleep.start_padding if bleep is not None else None,
-                    DeidentifyField.BLEEP_STOP_PADDING: bleep.stop_padding if bleep is not None else None,
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension == FileExtension.PDF:
-                req_file = FileDataDeidentifyPdf(base_64=base64_string)
-                api_call = files_api.deidentify_pdf
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyFileRequestField.MAX_RESOLUTION: getattr(request, DeidentifyFileRequestField.MAX_RESOLUTION, None),
-                    DeidentifyFileRequestField.DENSITY: getattr(request, DeidentifyFileRequestField.PIXEL_DENSITY, None),
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.JPEG, FileExtension.JPG, FileExtension.PNG, FileExtension.BMP, FileExtension.TIF, FileExtension.TIFF]:
-                req_file = FileDataDeidentifyImage(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_image
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyFileRequestField.MASKING_METHOD: getattr(request, DeidentifyFileRequestField.MASKING_METHOD, None),
-                    DeidentifyFileRequestField.OUTPUT_OCR_TEXT: getattr(request, DeidentifyFileRequestField.OUTPUT_OCR_TEXT, None),
-                    DeidentifyFileRequestField.OUTPUT_PROCESSED_IMAGE: getattr(request, DeidentifyFileRequestField.OUTPUT_PROCESSED_IMAGE, None),
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.PPT, FileExtension.PPTX]:
-                req_file = FileDataDeidentifyPresentation(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_presentation
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.CSV, FileExtension.XLS, FileExtension.XLSX]:
-                req_file = FileDataDeidentifySpreadsheet(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_spreadsheet
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.DOC, FileExtension.DOCX]:
-                req_file = FileDataDeidentifyDocument(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_document
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            elif file_extension in [FileExtension.JSON, FileExtension.XML]:
-                req_file = FileDataDeidentifyStructuredText(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_structured_text
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
-
-            else:
-                req_file = FileData(base_64=base64_string, data_format=file_extension)
-                api_call = files_api.deidentify_file
-                api_kwargs = {
-                    OptionField.VAULT_ID: self.__vault_client.get_vault_id(),
-                    DeidentifyField.FILE: req_file,
-                    DeidentifyField.ENTITY_TYPES: request.entities,
-                    DeidentifyField.TOKEN_TYPE: self.__get_token_format(request),
-                    DeidentifyField.ALLOW_REGEX: request.allow_regex_list,
-                    DeidentifyField.RESTRICT_REGEX: request.restrict_regex_list,
-                    DeidentifyField.TRANSFORMATIONS: self.__get_transformations(request),
-                    DeidentifyField.REQUEST_OPTIONS: {'additional_headers': self.__get_headers()}
-                }
+            api_call, api_kwargs = self._get_deidentify_file_call(files_api, request, file_extension, base64_string)
 
             log_info(SkyflowMessages.Info.DETECT_FILE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
             api_response = api_call(**api_kwargs)
@@ -440,11 +491,7 @@ class Detect:
             run_id = getattr(api_response.data, DeidentifyField.RUN_ID, None)
 
             processed_response = self.__poll_for_processed_file(run_id, request.wait_time)
-            if request.output_directory and processed_response.status == DetectStatus.SUCCESS and file_name:
-                name_without_ext, _ = os.path.splitext(file_name)
-                self.__save_deidentify_file_response_output(processed_response, request.output_directory, file_name, name_without_ext)
-
-            parsed_response = self.__parse_deidentify_file_response(processed_response, run_id)
+            parsed_response = self._build_deidentify_file_response(processed_response, request, file_name, run_id)
             log_info(SkyflowMessages.Info.DETECT_FILE_SUCCESS.value, self.__vault_client.get_logger())
             return parsed_response
 
@@ -453,6 +500,130 @@ class Detect:
                           self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __submit_deidentify_file(self, files_api, request: DeidentifyFileRequest):
+        try:
+            validate_deidentify_file_request(self.__vault_client.get_logger(), request)
+            file_name, file_extension, base64_string = self._read_file(request)
+            api_call, api_kwargs = self._get_deidentify_file_call(files_api, request, file_extension, base64_string)
+            api_response = api_call(**api_kwargs)
+            return file_name, getattr(api_response.data, DeidentifyField.RUN_ID, None)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def __get_run(self, files_api, run_id):
+        try:
+            return files_api.get_run(run_id, vault_id=self.__vault_client.get_vault_id()).data
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def __get_submitted_run(self, run_id):
+        try:
+            # Runs can be polled for longer than a bearer token lasts; this refreshes it when due.
+            self.__initialize()
+        except Exception as e:
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+        return self.__get_run(self.__vault_client.get_detect_file_api().with_raw_response, run_id)
+
+    def _track_detect_run(self, run_id, request: DeidentifyFileRequest, file_name):
+        run = DetectRun(run_id)
+        self.__run_poller.add(run, request, file_name)
+        log_info(SkyflowMessages.Info.DETECT_FILE_SUBMITTED.value, self.__vault_client.get_logger())
+        return run
+
+    def submit_deidentify_file(self, request: DeidentifyFileRequest) -> DetectRun:
+        """Submit the file of request and return a DetectRun handle as soon as its run starts,
+        without waiting for it.
+
+        The run is polled in the background, together with the other submitted runs, until it
+        completes; request.wait_time is not used, so pass a timeout to result instead. Another
+        process can collect the run with get_detect_run and the handle's run_id.
+        """
+        log_info(SkyflowMessages.Info.DETECT_FILE_TRIGGERED.value, self.__vault_client.get_logger())
+        validate_deidentify_file_request(self.__vault_client.get_logger(), request)
+        self.__initialize()
+        files_api = self.__vault_client.get_detect_file_api().with_raw_response
+        file_name, file_extension, base64_string = self._read_file(request)
+
+        try:
+            api_call, api_kwargs = self._get_deidentify_file_call(files_api, request, file_extension, base64_string)
+
+            log_info(SkyflowMessages.Info.DETECT_FILE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+            api_response = api_call(**api_kwargs)
+            run_id = getattr(api_response.data, DeidentifyField.RUN_ID, None)
+
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETECT_FILE_REQUEST_REJECTED.value,
+                          self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+        return self._track_detect_run(run_id, request, file_name)
+
+    def deidentify_files(self, requests, max_in_flight=BulkOperation.MAX_IN_FLIGHT):
+        """Deidentify the files of requests, which may be any iterable of DeidentifyFileRequest,
+        and yield a DeidentifyFileResponse for each file as soon as its run completes.
+
+        Up to max_in_flight files are read and submitted at a time. The runs they start are polled
+        together by one DetectRunScheduler, with a shared backoff, so a batch takes about as long as
+        its slowest run rather than the sum of them. Each response carries the request_index of its
+        request. A file that could not be submitted or polled yields a FAILED response with the
+        error in errors, and a run still in progress after its request's wait_time yields an
+        IN_PROGRESS response, which get_detect_run can check later.
+        """
+        log_info(SkyflowMessages.Info.DETECT_FILES_TRIGGERED.value.format(max_in_flight), self.__vault_client.get_logger())
+        validate_deidentify_files_options(self.__vault_client.get_logger(), requests, max_in_flight)
+        return self.__deidentify_files(requests, max_in_flight)
+
+    def __deidentify_files(self, requests, max_in_flight):
+        requests = enumerate(requests)
+        scheduler = DetectRunScheduler()
+        submitting = {}
+        statuses = []
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            while True:
+                while len(submitting) < max_in_flight:
+                    entry = next(requests, None)
+                    if entry is None:
+                        break
+                    # Large batches outlive a bearer token; this refreshes it when due.
+                    self.__initialize()
+                    files_api = self.__vault_client.get_detect_file_api().with_raw_response
+                    submitting[executor.submit(self.__submit_deidentify_file, files_api, entry[1])] = entry
+                if not submitting and not scheduler:
+                    break
+
+                # Wait for a submission to finish, but no longer than until the next round of polls.
+                if submitting:
+                    done, _ = wait(submitting, timeout=scheduler.get_delay(), return_when=FIRST_COMPLETED)
+                else:
+                    done = ()
+                    time.sleep(scheduler.get_delay())
+                for future in done:
+                    request_index, request = submitting.pop(future)
+                    result = future.result()
+                    if isinstance(result, SkyflowError):
+                        statuses.append(DetectStatus.FAILED)
+                        yield self._get_failed_deidentify_file_response(request_index, result)
+                    else:
+                        file_name, run_id = result
+                        scheduler.add(run_id, (request_index, request, file_name),
+                                      DetectConstants.WAIT_TIME if request.wait_time is None else request.wait_time)
+
+                run_ids = scheduler.get_due_run_ids()
+                if run_ids:
+                    self.__initialize()
+                    files_api = self.__vault_client.get_detect_file_api().with_raw_response
+                    for run_id in run_ids:
+                        response = self._get_deidentify_files_result(scheduler, run_id, self.__get_run(files_api, run_id))
+                        if response is not None:
+                            statuses.append(response.status)
+                            yield response
+                    scheduler.end_round()
+        log_info(SkyflowMessages.Info.DETECT_FILES_SUCCESS.value.format(
+            statuses.count(DetectStatus.SUCCESS), statuses.count(DetectStatus.IN_PROGRESS), statuses.count(DetectStatus.FAILED)),
+            self.__vault_client.get_logger())
+
     def get_detect_run(self, request: GetDetectRunRequest):
         log_info(SkyflowMessages.Info.GET_DETECT_RUN_TRIGGERED.value,self.__vault_client.get_logger())
         log_info(SkyflowMessages.Info.VALIDATING_GET_DETECT_RUN_INPUT.value, self.__vault_client.get_logger())
@@ -464,13 +635,9 @@ class Detect:
         try:
             response = files_api.get_run(
                 run_id,
-                vault_id=self.__vault_client.get_vault_id(),
-                request_options={'additional_headers': self.__get_headers()}
+                vault_id=self.__vault_client.get_vault_id()
             )
-            if response.data.status == DetectStatus.IN_PROGRESS:
-                parsed_response = DeidentifyFileResponse(run_id=run_id, status=DetectStatus.IN_PROGRESS)
-            else:
-                parsed_response = self.__parse_deidentify_file_response(response.data, run_id, response.data.status)
+            parsed_response = self._parse_get_detect_run_response(response.data, run_id)
             log_info(SkyflowMessages.Info.GET_DETECT_RUN_SUCCESS.value,self.__vault_client.get_logger())
             return parsed_response
         except Exception as e:
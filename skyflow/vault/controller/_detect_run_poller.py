@@ -0,0 +1,69 @@
+import threading
+from skyflow.error import SkyflowError
+from skyflow.utils._utils import get_skyflow_error
+from skyflow.utils.constants import DetectStatus
+from ._detect_run_scheduler import DetectRunScheduler
+
+
+class DetectRunPoller:
+    """Polls the runs of DetectRun handles from one daemon thread, in rounds with the shared
+    backoff of a DetectRunScheduler, and resolves each handle once its run completes.
+
+    get_run returns the data of a get_run response for a run_id, or a SkyflowError, and
+    build_response(data, request, file_name, run_id) returns the result of a completed run.
+    The thread is started when a run is added and exits once no run is left to poll.
+    """
+    def __init__(self, get_run, build_response):
+        self.__get_run = get_run
+        self.__build_response = build_response
+        self.__scheduler = DetectRunScheduler()
+        self.__lock = threading.Lock()
+        self.__added = threading.Event()
+        self.__thread = None
+
+    def add(self, run, request, file_name):
+        with self.__lock:
+            self.__scheduler.add(run.run_id, (run, request, file_name))
+            self.__added.set()
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__poll, daemon=True)
+                self.__thread.start()
+
+    def __poll(self):
+        while True:
+            with self.__lock:
+                delay = self.__scheduler.get_delay()
+                if delay is None:
+                    self.__thread = None
+                    return
+                self.__added.clear()
+                run_ids = self.__scheduler.get_due_run_ids()
+            if not run_ids:
+                # A run added meanwhile is due right away, so it cuts the wait short.
+                self.__added.wait(delay)
+                continue
+
+            results = [(run_id, self.__get_run(run_id)) for run_id in run_ids]
+            with self.__lock:
+                completed = [(self.__scheduler.pop(run_id), run_id, result) for run_id, result in results
+                             if self.__is_completed(run_id, result)]
+                self.__scheduler.end_round()
+            # Handles are resolved outside the lock, since that runs their callbacks.
+            for (run, request, file_name), run_id, result in completed:
+                self.__resolve(run, request, file_name, run_id, result)
+
+    def __is_completed(self, run_id, result):
+        run = self.__scheduler.get(run_id)[0]
+        return run.cancelled() or isinstance(result, SkyflowError) \
+            or result.status == DetectStatus.SUCCESS or result.status == DetectStatus.FAILED
+
+    def __resolve(self, run, request, file_name, run_id, result):
+        if not run.set_running_or_notify_cancel():
+            return
+        if isinstance(result, SkyflowError):
+            run.set_exception(result)
+            return
+        try:
+            run.set_result(self.__build_response(result, request, file_name, run_id))
+        except Exception as e:
+            run.set_exception(get_skyflow_error(e))
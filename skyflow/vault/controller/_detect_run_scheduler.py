@@ -0,0 +1,58 @@
+import time
+from skyflow.utils.constants import Detect as DetectConstants
+
+
+class DetectRunScheduler:
+    """Tracks detect runs, so that they are polled together.
+
+    All runs share one backoff: after each round of polls, the wait before the next round
+    doubles from 1 second up to Detect.WAIT_TIME, and it starts over at 1 second when a run
+    is added. A round is never put off past the time a run stops being waited for, its
+    wait_time after it was added; a run added without a wait_time is waited for until popped.
+    """
+    def __init__(self):
+        self.__runs = {}
+        self.__delay = 1
+        self.__next_poll_time = None
+
+    def __len__(self):
+        return len(self.__runs)
+
+    def add(self, run_id, value, wait_time=None):
+        """Track run_id, and the value that get and pop return for it."""
+        now = time.monotonic()
+        self.__runs[run_id] = (value, now + wait_time if wait_time is not None else None)
+        # A new run is polled in the next round, which starts right away.
+        self.__delay = 1
+        self.__next_poll_time = now
+
+    def get(self, run_id):
+        return self.__runs[run_id][0]
+
+    def pop(self, run_id):
+        return self.__runs.pop(run_id)[0]
+
+    def is_expired(self, run_id):
+        deadline = self.__runs[run_id][1]
+        return deadline is not None and time.monotonic() >= deadline
+
+    def get_delay(self):
+        """Return the seconds until the next round of polls, or None if no run is tracked."""
+        if not self.__runs:
+            return None
+        return max(0, self.__next_poll_time - time.monotonic())
+
+    def get_due_run_ids(self):
+        """Return the run_ids to poll in this round, which is empty until the round is due."""
+        if self.get_delay() != 0:
+            return []
+        return list(self.__runs)
+
+    def end_round(self):
+        now = time.monotonic()
+        delay = self.__delay
+        deadlines = [deadline for _, deadline in self.__runs.values() if deadline is not None]
+        if deadlines:
+            delay = min(delay, max(0, min(deadlines) - now))
+        self.__next_poll_time = now + delay
+        self.__delay = min(self.__delay * 2, DetectConstants.WAIT_TIME)
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from skyflow.error import SkyflowError
+from skyflow.utils import SkyflowMessages
+
+
+class _DetokenizeBatch:
+    def __init__(self, closed):
+        self.items = []
+        self.size = 0
+        self.closed = closed
+
+    def add(self, tokens_list, future):
+        self.items.append((tokens_list, future))
+        self.size += len(tokens_list)
+
+    def get_tokens_list(self):
+        return [token for tokens_list, _ in self.items for token in tokens_list]
+
+    def resolve(self, request_id, records):
+        records = self.__match_records(records)
+        if records is None:
+            self.reject(SkyflowError(SkyflowMessages.Error.DETOKENIZE_BATCH_MISMATCH.value,
+                                     SkyflowMessages.ErrorCodes.SERVER_ERROR.value, request_id=request_id))
+            return
+        start = 0
+        for tokens_list, future in self.items:
+            end = start + len(tokens_list)
+            if not future.done():
+                future.set_result((request_id, records[start:end]))
+            start = end
+
+    def __match_records(self, records):
+        """Return records in the order their tokens were sent, or None if they can't be matched."""
+        sent = self.get_tokens_list()
+        if len(records) != len(sent):
+            return None
+        if all(record.token == request.token for record, request in zip(records, sent)):
+            return list(records)
+        # The response need not keep request order, so each token takes the next record
+        # returned for it. A token sent with more than one redaction can only be told apart
+        # by position, so a batch holding one is never matched by token.
+        redactions = {}
+        for request in sent:
+            redactions.setdefault(request.token, set()).add(request.redaction)
+        if any(len(token_redactions) > 1 for token_redactions in redactions.values()):
+            return None
+        token_records = {}
+        for record in records:
+            token_records.setdefault(record.token, []).append(record)
+        matched_records = []
+        for request in sent:
+            if not token_records.get(request.token):
+                return None
+            matched_records.append(token_records[request.token].pop(0))
+        return matched_records
+
+    def reject(self, error):
+        for _, future in self.items:
+            if not future.done():
+                future.set_exception(error)
+
+
+def _get_batch_timeout_error(wait_time):
+    return SkyflowError(SkyflowMessages.Error.DETOKENIZE_BATCH_TIMED_OUT.value.format(wait_time),
+                        SkyflowMessages.ErrorCodes.SERVER_ERROR.value)
+
+
+class DetokenizeBatcher:
+    """Coalesces concurrent detokenize calls into one record_service_detokenize call.
+
+    The first caller of a batch waits up to max_wait_time seconds, or until the batch
+    holds max_batch_size tokens, and then sends the tokens of every caller that joined
+    it with send_batch. Each caller gets back the request id and its own records, or the
+    error that send_batch raised. A caller waits for its batch up to max_wait_time plus the
+    timeout it passes, so that a leader that hangs doesn't hold the others forever.
+    """
+    def __init__(self, send_batch, max_batch_size, max_wait_time):
+        self.__send_batch = send_batch
+        self.__max_batch_size = max_batch_size
+        self.__max_wait_time = max_wait_time
+        self.__batch = None
+        self.__lock = threading.Lock()
+
+    def __join_batch(self, tokens_list, future):
+        with self.__lock:
+            batch = self.__batch
+            if batch is not None and batch.size + len(tokens_list) > self.__max_batch_size:
+                self.__close_batch(batch)
+                batch = None
+            is_leader = batch is None
+            if is_leader:
+                batch = self.__batch = _DetokenizeBatch(threading.Event())
+            batch.add(tokens_list, future)
+            if batch.size >= self.__max_batch_size:
+                self.__close_batch(batch)
+            return batch, is_leader
+
+    def __close_batch(self, batch):
+        if self.__batch is batch:
+            self.__batch = None
+        batch.closed.set()
+
+    def __flush(self, batch):
+        batch.closed.wait(self.__max_wait_time)
+        with self.__lock:
+            self.__close_batch(batch)
+        try:
+            request_id, records = self.__send_batch(batch.get_tokens_list(), len(batch.items))
+        except Exception as e:
+            batch.reject(e)
+        else:
+            batch.resolve(request_id, records)
+
+    def detokenize(self, tokens_list, timeout):
+        future = Future()
+        batch, is_leader = self.__join_batch(tokens_list, future)
+        if is_leader:
+            self.__flush(batch)
+        wait_time = self.__max_wait_time + timeout
+        try:
+            return future.result(wait_time)
+        except FutureTimeoutError:
+            if future.done():
+                raise
+            raise _get_batch_timeout_error(wait_time)
+
+
+class AsyncDetokenizeBatcher:
+    """Awaitable counterpart of DetokenizeBatcher for callers sharing one event loop.
+
+    Batches are flushed from a task of their own, so a cancelled caller does not hold
+    back the others that joined its batch.
+    """
+    def __init__(self, send_batch, max_batch_size, max_wait_time):
+        self.__send_batch = send_batch
+        self.__max_batch_size = max_batch_size
+        self.__max_wait_time = max_wait_time
+        self.__batch = None
+        self.__flush_tasks = set()
+
+    def __close_batch(self, batch):
+        if self.__batch is batch:
+            self.__batch = None
+        batch.closed.set()
+
+    async def __flush(self, batch):
+        try:
+            await asyncio.wait_for(batch.closed.wait(), self.__max_wait_time)
+        except asyncio.TimeoutError:
+            pass
+        self.__close_batch(batch)
+        try:
+            request_id, records = await self.__send_batch(batch.get_tokens_list(), len(batch.items))
+        except Exception as e:
+            batch.reject(e)
+        else:
+            batch.resolve(request_id, records)
+
+    async def detokenize(self, tokens_list, timeout):
+        future = asyncio.get_running_loop().create_future()
+        batch = self.__batch
+        if batch is not None and batch.size + len(tokens_list) > self.__max_batch_size:
+            self.__close_batch(batch)
+            batch = None
+        if batch is None:
+            batch = self.__batch = _DetokenizeBatch(asyncio.Event())
+            flush_task = asyncio.ensure_future(self.__flush(batch))
+            self.__flush_tasks.add(flush_task)
+            flush_task.add_done_callback(self.__flush_tasks.discard)
+        batch.add(tokens_list, future)
+        if batch.size >= self.__max_batch_size:
+            self.__close_batch(batch)
+        wait_time = self.__max_wait_time + timeout
+        try:
+            return await asyncio.wait_for(future, wait_time)
+        except asyncio.TimeoutError:
+            # wait_for cancels the future when it times out; otherwise this is the batch's error.
+            if not future.cancelled():
+                raise
+            raise _get_batch_timeout_error(wait_time)
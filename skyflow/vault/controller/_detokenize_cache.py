@@ -0,0 +1,51 @@
+from skyflow.utils.constants import RequestParameter, ResponseField
+from skyflow.utils.enums import RedactionType
+from skyflow.vault.tokens import DetokenizeResponse
+from ._ttl_lru_cache import TtlLruCache
+
+
+class DetokenizeCache(TtlLruCache):
+    """Bounded in-memory cache of detokenized fields, keyed by vault ID, token and
+    redaction type.
+
+    Only successfully detokenized fields are cached, and nothing is ever written to disk.
+    """
+    @staticmethod
+    def __get_key(vault_id, item):
+        redaction = item.get(RequestParameter.REDACTION_TYPE) or item.get(RequestParameter.REDACTION, RedactionType.DEFAULT)
+        return vault_id, item.get(ResponseField.TOKEN), getattr(redaction, 'value', redaction)
+
+    def get_fields(self, vault_id, data):
+        """Return the cached field for each item of a detokenize request's data, or None."""
+        fields = [self.get(self.__get_key(vault_id, item)) for item in data]
+        return [dict(field) if field is not None else None for field in fields]
+
+    def get_uncached_data(self, vault_id, data):
+        """Return the cached field or None for each item of data, and the items that missed."""
+        cached_fields = self.get_fields(vault_id, data)
+        return cached_fields, [item for item, field in zip(data, cached_fields) if field is None]
+
+    def merge(self, vault_id, data, cached_fields, response):
+        """Store the fields of response, which answers the items of data that were not cached,
+        and return a DetokenizeResponse for all of data in request order.
+        """
+        # The response need not keep request order, so each uncached item takes the next
+        # answer for its token, which is a detokenized field or None for an error.
+        answers = {}
+        for field in response.detokenized_fields or []:
+            answers.setdefault(field.get(ResponseField.TOKEN), []).append(field)
+        for error in response.errors or []:
+            answers.setdefault(error.get(ResponseField.TOKEN), []).append(None)
+        merged_fields = []
+        for item, cached_field in zip(data, cached_fields):
+            if cached_field is not None:
+                merged_fields.append(cached_field)
+                continue
+            token_answers = answers.get(item.get(ResponseField.TOKEN))
+            if not token_answers:
+                continue
+            field = token_answers.pop(0) if len(token_answers) > 1 else token_answers[0]
+            if field is not None:
+                self.set(self.__get_key(vault_id, item), dict(field))
+                merged_fields.append(field)
+        return DetokenizeResponse(detokenized_fields=merged_fields, errors=response.errors)
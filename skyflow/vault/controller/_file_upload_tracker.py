@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+
+from skyflow.error import SkyflowError
+from skyflow.utils import get_chunk_errors
+from skyflow.utils.constants import FileProcessing, ResponseField
+from skyflow.vault.data import FileUploadBatchResponse
+
+
+class FileUploadTracker:
+    """Collects the results of a FileUploadBatch, reports each one to the batch's
+    on_progress callback, and appends each uploaded file to the batch's checkpoint file.
+
+    A checkpoint file holds one JSON object per line, so a batch that crashed mid-write
+    loses at most its last line, and files listed in it are skipped when the batch is rerun.
+    Files are listed by their destination, name and content, so a file that changed since
+    it was uploaded is uploaded again. Files within one run are never skipped.
+    """
+    def __init__(self, batch):
+        self.__on_progress = batch.on_progress
+        self.__checkpoint_path = batch.checkpoint_path
+        self.__uploaded_ids = self.__load_checkpoint() if self.__checkpoint_path else {}
+        self.__uploaded_files = []
+        self.__errors = []
+        self.skipped = 0
+
+    def __load_checkpoint(self):
+        uploaded_ids = {}
+        if not os.path.exists(self.__checkpoint_path):
+            return uploaded_ids
+        with open(self.__checkpoint_path) as checkpoint:
+            for line in checkpoint:
+                try:
+                    entry = json.loads(line)
+                    uploaded_ids[entry[ResponseField.KEY]] = entry[ResponseField.SKYFLOW_ID]
+                except (ValueError, KeyError, TypeError):
+                    continue
+        return uploaded_ids
+
+    def get_key(self, request):
+        """Identify request across runs by its destination, file name and content, or return
+        None when the batch has no checkpoint file or the content can't be read. The content of
+        a file_path is identified by its mtime and size, and that of base64 or a file_object by
+        its sha256 digest. A file_object is read to its end and then put back where it was.
+        """
+        if not self.__checkpoint_path:
+            return None
+        try:
+            if request.file_path:
+                source = os.path.abspath(request.file_path)
+                file_stat = os.stat(source)
+                content = [file_stat.st_mtime_ns, file_stat.st_size]
+            elif request.base64 is not None:
+                source = request.file_name
+                content = hashlib.sha256(request.base64.encode()).hexdigest()
+            else:
+                source = request.file_name or getattr(request.file_object, 'name', None)
+                content = self.__get_file_object_digest(request.file_object)
+        except (OSError, AttributeError, ValueError, TypeError):
+            return None
+        if not isinstance(source, str):
+            source = None
+        return json.dumps([request.table, request.column_name, request.skyflow_id, source, content])
+
+    @staticmethod
+    def __get_file_object_digest(file_object):
+        position = file_object.tell()
+        digest = hashlib.sha256()
+        chunk = file_object.read(FileProcessing.STREAM_CHUNK_SIZE)
+        while chunk:
+            digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+            chunk = file_object.read(FileProcessing.STREAM_CHUNK_SIZE)
+        file_object.seek(position)
+        return digest.hexdigest()
+
+    def get_uploaded_skyflow_id(self, key):
+        return self.__uploaded_ids.get(key) if key is not None else None
+
+    def skip(self, request_index, skyflow_id):
+        self.skipped += 1
+        self.__add({ResponseField.SKYFLOW_ID: skyflow_id, ResponseField.REQUEST_INDEX: request_index})
+
+    def add_result(self, request_index, key, result):
+        if isinstance(result, SkyflowError):
+            self.__errors.extend(get_chunk_errors(result, request_index, 1))
+            self.__report(self.__errors[-1])
+            return
+        if key is not None:
+            with open(self.__checkpoint_path, 'a') as checkpoint:
+                checkpoint.write(json.dumps({ResponseField.KEY: key, ResponseField.SKYFLOW_ID: result}) + '\n')
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+        self.__add({ResponseField.SKYFLOW_ID: result, ResponseField.REQUEST_INDEX: request_index})
+
+    def __add(self, uploaded_file):
+        self.__uploaded_files.append(uploaded_file)
+        self.__report(uploaded_file)
+
+    def __report(self, result):
+        if self.__on_progress is not None:
+            self.__on_progress(len(self.__uploaded_files) + len(self.__errors), result)
+
+    def get_response(self):
+        return FileUploadBatchResponse(uploaded_files=self.__uploaded_files,
+                                       errors=self.__errors if len(self.__errors) > 0 else None)
@@ -0,0 +1,58 @@
+from skyflow.utils import get_tokenize_value_key, get_distinct_tokenize_values, merge_tokenize_response
+from skyflow.utils.constants import RequestParameter
+from skyflow.vault.tokens import TokenizeResponse
+from ._ttl_lru_cache import TtlLruCache
+
+
+class TokenizeCache(TtlLruCache):
+    """Bounded in-memory cache of tokenized fields, keyed by vault ID, column group and value.
+
+    Only values of the given column groups are cached. List only column groups that use
+    deterministic tokenization, for which a value always maps to the same token.
+    """
+    def __init__(self, column_groups, max_size, ttl):
+        super().__init__(max_size, ttl)
+        self.__column_groups = frozenset(column_groups)
+
+    def __get_key(self, vault_id, item):
+        if item[RequestParameter.COLUMN_GROUP] not in self.__column_groups:
+            return None
+        key = get_tokenize_value_key(item)
+        return (vault_id,) + key if key is not None else None
+
+    def get_fields(self, vault_id, values):
+        """Return the cached field for each item of a tokenize request's values, or None."""
+        fields = []
+        for item in values:
+            key = self.__get_key(vault_id, item)
+            fields.append(self.get(key) if key is not None else None)
+        return fields
+
+    def set_fields(self, vault_id, values, tokenized_fields):
+        for item, field in zip(values, tokenized_fields):
+            key = self.__get_key(vault_id, item)
+            if key is not None:
+                self.set(key, dict(field))
+
+
+class TokenizePlan:
+    """Splits the values of a tokenize request into the fields found in cache, which may be
+    None, and distinct_values, the distinct values left to send; get_response builds the
+    response for all of values once distinct_values are tokenized.
+    """
+    def __init__(self, vault_id, values, cache=None):
+        self.__vault_id = vault_id
+        self.__values = values
+        self.__cache = cache
+        self.__cached_fields = cache.get_fields(vault_id, values) if cache is not None else [None] * len(values)
+        uncached_values = [item for item, field in zip(values, self.__cached_fields) if field is None]
+        self.distinct_values, self.__positions = get_distinct_tokenize_values(uncached_values)
+
+    def get_response(self, tokenize_response=None):
+        if tokenize_response is None:
+            tokenize_response = TokenizeResponse(tokenized_fields=[])
+        elif self.__cache is not None:
+            self.__cache.set_fields(self.__vault_id, self.distinct_values, tokenize_response.tokenized_fields)
+        if len(self.distinct_values) < len(self.__values):
+            tokenize_response = merge_tokenize_response(tokenize_response, self.__positions, self.__cached_fields)
+        return tokenize_response
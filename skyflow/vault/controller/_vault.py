@@ -1,115 +1,51 @@
-import base64
-import json
-import os
-from typing import Optional
-from skyflow.generated.rest import V1FieldRecords, V1BatchRecord, V1TokenizeRecordRequest, \
-    V1DetokenizeRecordRequest
-from skyflow.generated.rest.core.file import File
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from skyflow.utils import SkyflowMessages, parse_insert_response, \
     handle_exception, parse_update_record_response, parse_delete_response, parse_detokenize_response, \
-    parse_tokenize_response, parse_query_response, parse_get_response, encode_column_values, get_metrics
-from skyflow.utils.constants import SKY_META_DATA_HEADER, ResponseField, RequestParameter, FileUploadField
-from skyflow.utils.enums import RequestMethod
-from skyflow.utils.enums.redaction_type import RedactionType
-from skyflow.utils.logger import log_info, log_error_log
-from skyflow.utils.validations import validate_insert_request, validate_delete_request, validate_query_request, \
-    validate_get_request, validate_update_request, validate_detokenize_request, validate_tokenize_request, validate_file_upload_request
-from skyflow.vault.data import InsertRequest, UpdateRequest, DeleteRequest, GetRequest, QueryRequest, FileUploadRequest, FileUploadResponse
-from skyflow.vault.tokens import DetokenizeRequest, TokenizeRequest
+    parse_tokenize_response, parse_query_response, parse_query_rows, split_query_limit, is_query_ordered, get_query_page, parse_get_response, construct_insert_records, \
+    construct_update_record, construct_detokenize_records, construct_tokenize_records, open_file_for_file_upload, \
+    get_insert_chunk_requests, get_skyflow_error, merge_insert_responses, parse_detokenize_batch_records, construct_get_records_params, construct_get_page_params, get_page_ranges, get_chunks, get_get_many_fields, merge_get_responses, merge_delete_responses, is_retryable_error, \
+    construct_update_batch_records, parse_update_batch_response, merge_update_responses
+from skyflow.utils.constants import ResponseField, RequestOperation, HttpClient, HttpHeader, DetokenizeBatch, ResultCache, Pagination
+from skyflow.utils.logger import log_info, log_warn, log_error_log
+from skyflow.utils.validations import validate_insert_request, validate_bulk_options, validate_insert_stream_request, validate_delete_request, validate_query_request, \
+    validate_get_request, validate_get_many_request, validate_iter_records_options, validate_iter_query_options, validate_update_request, validate_update_many_request, validate_detokenize_request, validate_detokenize_batch_options, validate_cache_options, validate_tokenize_request, validate_tokenize_cache_options, validate_file_upload_request, validate_file_upload_batch
+from skyflow.vault.data import InsertRequest, BulkInsertRequest, UpdateRequest, UpdateManyRequest, DeleteRequest, BulkDeleteRequest, GetRequest, BulkGetRequest, QueryRequest, FileUploadRequest, FileUploadResponse, FileUploadBatch
+from skyflow.vault.tokens import DetokenizeRequest, DetokenizeResponse, TokenizeRequest
+from ._detokenize_batcher import DetokenizeBatcher
+from ._detokenize_cache import DetokenizeCache
+from ._tokenize_cache import TokenizeCache, TokenizePlan
+from ._file_upload_tracker import FileUploadTracker
+from ._async_vault import AsyncVault
 
 class Vault:
     def __init__(self, vault_client):
         self.__vault_client = vault_client
+        self.__detokenize_batcher = None
+        self.__detokenize_cache = None
+        self.__tokenize_cache = None
+        self.__async_vault = None
+
+    @property
+    def aio(self) -> AsyncVault:
+        if self.__async_vault is None:
+            self.__async_vault = AsyncVault(self.__vault_client)
+        return self.__async_vault
 
     def __initialize(self):
         self.__vault_client.initialize_client_configuration()
 
-    def __build_bulk_field_records(self, values, tokens=None):
-        if tokens is None:
-            return [V1FieldRecords(fields=record) for record in values]
-        else:
-            bulk_record_list = []
-            for i, value in enumerate(values):
-                token = tokens[i] if tokens is not None and i < len(tokens) else None
-                bulk_record = V1FieldRecords(
-                    fields=value,
-                    tokens=token
-                )
-                bulk_record_list.append(bulk_record)
-            return bulk_record_list
-
-    def __build_batch_field_records(self, values, tokens, table_name, return_tokens, upsert):
-        batch_record_list = []
-        for i, value in enumerate(values):
-            token = tokens[i] if tokens is not None and i < len(tokens) else None
-            batch_record = V1BatchRecord(
-                fields=value,
-                table_name=table_name,
-                method=RequestMethod.POST.value,
-                tokenization=return_tokens,
-                upsert=upsert,
-                tokens=token
-            )
-            batch_record_list.append(batch_record)
-        return batch_record_list
-
-    def __build_insert_body(self, request: InsertRequest):
-        if request.continue_on_error:
-            records_list = self.__build_batch_field_records(
-                request.values,
-                request.tokens,
-                request.table,
-                request.return_tokens,
-                request.upsert
-            )
-
-            return records_list
-        else:
-            records_list = self.__build_bulk_field_records(request.values, request.tokens)
-            return records_list
-        
-    def __get_file_for_file_upload(self, request: FileUploadRequest) -> Optional[File]:
-        if request.file_path:
-            if not request.file_name:
-                request.file_name = os.path.basename(request.file_path)
-
-            with open(request.file_path, "rb") as f:
-                file_bytes = f.read()
-            return (request.file_name, file_bytes)
-
-        elif request.base64 and request.file_name:
-            decoded_bytes = base64.b64decode(request.base64)
-            return (request.file_name, decoded_bytes)
-
-        elif request.file_object is not None:
-            if hasattr(request.file_object, FileUploadField.NAME) and request.file_object.name:
-                file_name = os.path.basename(request.file_object.name)
-                return (file_name, request.file_object)
-
-        return None
-    
-    def __get_headers(self):
-        return {SKY_META_DATA_HEADER: json.dumps(get_metrics())}
-
     def insert(self, request: InsertRequest):
         log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
         validate_insert_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.INSERT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
         records_api = self.__vault_client.get_records_api().with_raw_response
-        insert_body = self.__build_insert_body(request)
 
         try:
             log_info(SkyflowMessages.Info.INSERT_TRIGGERED.value, self.__vault_client.get_logger())
-            if request.continue_on_error:
-                api_response = records_api.record_service_batch_operation(self.__vault_client.get_vault_id(),
-                                                                          records=insert_body, continue_on_error=request.continue_on_error, byot=request.token_mode.value, request_options={'additional_headers': self.__get_headers()})
-
-            else:
-                api_response = records_api.record_service_insert_record(self.__vault_client.get_vault_id(),
-                                                                        request.table, records=insert_body,tokenization= request.return_tokens, upsert=request.upsert, homogeneous=request.homogeneous, byot=request.token_mode.value, request_options={'additional_headers': self.__get_headers()})
-
-            insert_response = parse_insert_response(api_response, request.continue_on_error)
+            insert_response = self.__insert_records(records_api, request)
             log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
             return insert_response
 
@@ -117,13 +53,89 @@ class Vault:
             log_error_log(SkyflowMessages.ErrorLogs.INSERT_RECORDS_REJECTED.value, self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __insert_records(self, records_api, request):
+        insert_body = construct_insert_records(request)
+        if request.continue_on_error:
+            api_response = records_api.record_service_batch_operation(self.__vault_client.get_vault_id(),
+                                                                      records=insert_body, continue_on_error=request.continue_on_error, byot=request.token_mode.value)
+
+        else:
+            api_response = records_api.record_service_insert_record(self.__vault_client.get_vault_id(),
+                                                                    request.table, records=insert_body,tokenization= request.return_tokens, upsert=request.upsert, homogeneous=request.homogeneous, byot=request.token_mode.value)
+        return parse_insert_response(api_response, request.continue_on_error)
+
+    def __insert_chunk(self, records_api, chunk_request):
+        try:
+            return self.__insert_records(records_api, chunk_request)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.INSERT_RECORDS_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def insert_many(self, request: BulkInsertRequest):
+        """Insert request.values in chunks of at most request.chunk_size records (and
+        request.max_chunk_bytes bytes), with up to request.max_in_flight chunks in flight.
+
+        Each inserted field and error carries the request_index of its record in request.values.
+        A chunk that fails as a whole adds one error per record it held instead of failing the call.
+        """
+        log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
+        validate_insert_request(self.__vault_client.get_logger(), request)
+        validate_bulk_options(self.__vault_client.get_logger(), request, RequestOperation.INSERT)
+        log_info(SkyflowMessages.Info.INSERT_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        self.__initialize()
+        records_api = self.__vault_client.get_records_api().with_raw_response
+
+        chunks = list(get_insert_chunk_requests(request))
+        log_info(SkyflowMessages.Info.INSERT_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        with ThreadPoolExecutor(max_workers=min(request.max_in_flight, len(chunks))) as executor:
+            futures = [(chunk_start, len(chunk_request.values), executor.submit(self.__insert_chunk, records_api, chunk_request))
+                       for chunk_start, chunk_request in chunks]
+            insert_response = merge_insert_responses(
+                (chunk_start, chunk_length, future.result()) for chunk_start, chunk_length, future in futures)
+        log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
+        return insert_response
+
+    def insert_stream(self, request: BulkInsertRequest):
+        """Insert records read lazily from request.values, which may be any iterable, such as a
+        generator over a CSV file.
+
+        Only the chunk being read and at most request.max_in_flight chunks being sent are held in
+        memory; reading waits while that many chunks are in flight. Yields one InsertResponse per
+        chunk as it finishes, with request_index values counted from the start of the stream.
+        """
+        log_info(SkyflowMessages.Info.VALIDATE_INSERT_REQUEST.value, self.__vault_client.get_logger())
+        validate_insert_stream_request(self.__vault_client.get_logger(), request)
+        return self.__insert_stream(request)
+
+    def __insert_stream(self, request):
+        records_api = None
+        pending = {}
+        with ThreadPoolExecutor(max_workers=request.max_in_flight) as executor:
+            for chunk_start, chunk_request in get_insert_chunk_requests(request):
+                validate_insert_request(self.__vault_client.get_logger(), chunk_request)
+                # Long streams outlive a bearer token; this refreshes it when due.
+                self.__initialize()
+                records_api = records_api or self.__vault_client.get_records_api().with_raw_response
+                future = executor.submit(self.__insert_chunk, records_api, chunk_request)
+                pending[future] = (chunk_start, len(chunk_request.values))
+                # Chunks that finished meanwhile are yielded before the next chunk is read.
+                done = [future for future in pending if future.done()]
+                if not done and len(pending) >= request.max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield merge_insert_responses([(*pending.pop(future), future.result())])
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield merge_insert_responses([(*pending.pop(future), future.result())])
+        log_info(SkyflowMessages.Info.INSERT_SUCCESS.value, self.__vault_client.get_logger())
+
     def update(self, request: UpdateRequest):
         log_info(SkyflowMessages.Info.VALIDATE_UPDATE_REQUEST.value, self.__vault_client.get_logger())
         validate_update_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.UPDATE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
-        field = {key: value for key, value in request.data.items() if key != ResponseField.SKYFLOW_ID}
-        record = V1FieldRecords(fields=field, tokens = request.tokens)
+        record = construct_update_record(request)
 
         records_api = self.__vault_client.get_records_api()
         try:
@@ -134,8 +146,7 @@ class Vault:
                 id=request.data.get(ResponseField.SKYFLOW_ID),
                 record=record,
                 tokenization=request.return_tokens,
-                byot=request.token_mode.value,
-                request_options={'additional_headers': self.__get_headers()}
+                byot=request.token_mode.value
             )
             log_info(SkyflowMessages.Info.UPDATE_SUCCESS.value, self.__vault_client.get_logger())
             update_response = parse_update_record_response(api_response)
@@ -144,6 +155,43 @@ class Vault:
             log_error_log(SkyflowMessages.ErrorLogs.UPDATE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __update_chunk(self, records_api, request, chunk_start, chunk):
+        try:
+            api_response = records_api.record_service_batch_operation(
+                self.__vault_client.get_vault_id(),
+                records=construct_update_batch_records(request, chunk_start, chunk),
+                continue_on_error=True,
+                byot=request.token_mode.value
+            )
+            return parse_update_batch_response(api_response)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.UPDATE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def update_many(self, request: UpdateManyRequest):
+        """Update the records in request.data, each identified by its skyflow_id, in batch
+        calls of at most request.chunk_size records, with up to request.max_in_flight calls in flight.
+
+        Each updated field and error carries the request_index of its record in request.data.
+        A record that fails does not fail the others, and a chunk that fails as a whole adds
+        one error per record it held.
+        """
+        log_info(SkyflowMessages.Info.VALIDATE_UPDATE_REQUEST.value, self.__vault_client.get_logger())
+        validate_update_many_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.UPDATE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        self.__initialize()
+        records_api = self.__vault_client.get_records_api().with_raw_response
+
+        chunks = list(get_chunks(request.data, request.chunk_size))
+        log_info(SkyflowMessages.Info.UPDATE_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        with ThreadPoolExecutor(max_workers=min(request.max_in_flight, len(chunks))) as executor:
+            futures = [(chunk_start, len(chunk), executor.submit(self.__update_chunk, records_api, request, chunk_start, chunk))
+                       for chunk_start, chunk in chunks]
+            update_response = merge_update_responses(
+                (chunk_start, chunk_length, future.result()) for chunk_start, chunk_length, future in futures)
+        log_info(SkyflowMessages.Info.UPDATE_SUCCESS.value, self.__vault_client.get_logger())
+        return update_response
+
     def delete(self, request: DeleteRequest):
         log_info(SkyflowMessages.Info.VALIDATING_DELETE_REQUEST.value, self.__vault_client.get_logger())
         validate_delete_request(self.__vault_client.get_logger(), request)
@@ -152,49 +200,190 @@ class Vault:
         records_api = self.__vault_client.get_records_api()
         try:
             log_info(SkyflowMessages.Info.DELETE_TRIGGERED.value, self.__vault_client.get_logger())
-            api_response = records_api.record_service_bulk_delete_record(
-                self.__vault_client.get_vault_id(),
-                request.table,
-                skyflow_ids=request.ids,
-                request_options={'additional_headers': self.__get_headers()}
-            )
+            delete_response = self.__delete_records(records_api, request.table, request.ids)
             log_info(SkyflowMessages.Info.DELETE_SUCCESS.value, self.__vault_client.get_logger())
-            delete_response = parse_delete_response(api_response)
             return delete_response
         except Exception as e:
             log_error_log(SkyflowMessages.ErrorLogs.DELETE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __delete_records(self, records_api, table, ids):
+        api_response = records_api.record_service_bulk_delete_record(
+            self.__vault_client.get_vault_id(),
+            table,
+            skyflow_ids=ids
+        )
+        return parse_delete_response(api_response)
+
+    def __delete_chunk(self, records_api, request, ids):
+        attempt = 0
+        while True:
+            try:
+                return self.__delete_records(records_api, request.table, ids)
+            except Exception as e:
+                if attempt >= request.max_retries or not is_retryable_error(e):
+                    log_error_log(SkyflowMessages.ErrorLogs.DELETE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+                    return get_skyflow_error(e, self.__vault_client.get_logger())
+            wait_time = HttpClient.RETRY_BACKOFF_FACTOR * (2 ** attempt)
+            log_info(SkyflowMessages.Info.DELETE_CHUNK_RETRIED.value.format(wait_time), self.__vault_client.get_logger())
+            time.sleep(wait_time)
+            attempt += 1
+
+    def delete_many(self, request: BulkDeleteRequest):
+        """Delete request.ids in chunks of at most request.chunk_size IDs, with up to
+        request.max_in_flight chunks in flight.
+
+        Chunks failing with a connection error, a timeout or a 429/502/503/504 response are
+        retried up to request.max_retries times with exponential backoff. A chunk that still
+        fails adds one error per ID it held, and the other chunks still complete.
+        """
+        log_info(SkyflowMessages.Info.VALIDATING_DELETE_REQUEST.value, self.__vault_client.get_logger())
+        validate_delete_request(self.__vault_client.get_logger(), request)
+        validate_bulk_options(self.__vault_client.get_logger(), request, RequestOperation.DELETE)
+        log_info(SkyflowMessages.Info.DELETE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        self.__initialize()
+        records_api = self.__vault_client.get_records_api()
+
+        chunks = list(get_chunks(request.ids, request.chunk_size))
+        log_info(SkyflowMessages.Info.DELETE_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        with ThreadPoolExecutor(max_workers=min(request.max_in_flight, len(chunks))) as executor:
+            futures = [(chunk_start, chunk_ids, executor.submit(self.__delete_chunk, records_api, request, chunk_ids))
+                       for chunk_start, chunk_ids in chunks]
+            delete_response = merge_delete_responses(
+                (chunk_start, chunk_ids, future.result()) for chunk_start, chunk_ids, future in futures)
+        log_info(SkyflowMessages.Info.DELETE_SUCCESS.value, self.__vault_client.get_logger())
+        return delete_response
+
     def get(self, request: GetRequest):
         log_info(SkyflowMessages.Info.VALIDATE_GET_REQUEST.value, self.__vault_client.get_logger())
         validate_get_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.GET_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
         records_api = self.__vault_client.get_records_api()
-
         try:
             log_info(SkyflowMessages.Info.GET_TRIGGERED.value, self.__vault_client.get_logger())
+            get_response = self.__get_records(records_api, request, request.ids, request.fields)
+            log_info(SkyflowMessages.Info.GET_SUCCESS.value, self.__vault_client.get_logger())
+            return get_response
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    def __get_records(self, records_api, request, ids, fields):
+        api_response = records_api.record_service_bulk_get_record(
+            self.__vault_client.get_vault_id(),
+            **construct_get_records_params(request, ids, fields)
+        )
+        return parse_get_response(api_response)
+
+    def __get_chunk(self, records_api, request, ids, fields):
+        try:
+            return self.__get_records(records_api, request, ids, fields)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def get_many(self, request: BulkGetRequest):
+        """Get request.ids in chunks of at most request.chunk_size IDs, which keeps each URL
+        short, with up to request.max_in_flight chunks in flight. Records are returned in the
+        order of request.ids. A chunk that fails adds one error per ID it held, and the other
+        chunks still complete.
+        """
+        log_info(SkyflowMessages.Info.VALIDATE_GET_REQUEST.value, self.__vault_client.get_logger())
+        validate_get_many_request(self.__vault_client.get_logger(), request)
+        log_info(SkyflowMessages.Info.GET_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
+        self.__initialize()
+        records_api = self.__vault_client.get_records_api()
+        fields = get_get_many_fields(request.fields)
+
+        chunks = list(get_chunks(request.ids, request.chunk_size))
+        log_info(SkyflowMessages.Info.GET_CHUNKS_TRIGGERED.value.format(len(chunks)), self.__vault_client.get_logger())
+        with ThreadPoolExecutor(max_workers=min(request.max_in_flight, len(chunks))) as executor:
+            futures = [(chunk_start, chunk_ids, executor.submit(self.__get_chunk, records_api, request, chunk_ids, fields))
+                       for chunk_start, chunk_ids in chunks]
+            get_response = merge_get_responses(
+                ((chunk_start, chunk_ids, future.result()) for chunk_start, chunk_ids, future in futures), request.fields)
+        log_info(SkyflowMessages.Info.GET_SUCCESS.value, self.__vault_client.get_logger())
+        return get_response
+
+    def __get_records_page(self, records_api, table, fields, redaction_type, offset, limit):
+        try:
             api_response = records_api.record_service_bulk_get_record(
                 self.__vault_client.get_vault_id(),
-                object_name=request.table,
-                skyflow_ids=request.ids,
-                redaction = request.redaction_type.value if request.redaction_type is not None else None,
-                tokenization=request.return_tokens,
-                fields=request.fields,
-                offset=request.offset,
-                limit=request.limit,
-                download_url=request.download_url,
-                column_name=request.column_name,
-                column_values=request.column_values,
-                request_options={'additional_headers': self.__get_headers()}
+                **construct_get_page_params(table, fields, redaction_type, offset, limit)
             )
-            log_info(SkyflowMessages.Info.GET_SUCCESS.value, self.__vault_client.get_logger())
-            get_response = parse_get_response(api_response)
-            return get_response
+            return parse_get_response(api_response).data
         except Exception as e:
             log_error_log(SkyflowMessages.ErrorLogs.GET_REQUEST_REJECTED.value, self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def iter_records(self, table, fields = None, redaction_type = None, page_size = Pagination.PAGE_SIZE, max_in_flight = Pagination.MAX_IN_FLIGHT):
+        """Yield every record of table as a dict, reading it page_size records at a time.
+
+        Up to max_in_flight pages are fetched ahead of the caller, so the next page is usually
+        ready by the time the current one is consumed, and at most that many pages are held.
+        """
+        validate_iter_records_options(self.__vault_client.get_logger(), table, fields, redaction_type, page_size, max_in_flight)
+        log_info(SkyflowMessages.Info.ITER_RECORDS_TRIGGERED.value.format(table, page_size), self.__vault_client.get_logger())
+        return self.__iter_pages(self.__vault_client.get_records_api,
+                                 lambda records_api, offset, limit: self.__get_records_page(records_api, table, fields, redaction_type, offset, limit),
+                                 get_page_ranges(page_size), max_in_flight)
+
+    def __iter_pages(self, get_api, get_page, page_ranges, max_in_flight):
+        """Yield the items of the page at each (offset, limit) of page_ranges, fetched with
+        get_page(api, offset, limit), until a page comes back short.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_in_flight)
+        pages = deque()
+        next_range = next(page_ranges, None)
+        try:
+            while True:
+                if len(pages) < max_in_flight and next_range is not None:
+                    # The token can expire during a long read, so it is refreshed for each batch.
+                    self.__initialize()
+                    api = get_api()
+                while len(pages) < max_in_flight and next_range is not None:
+                    offset, limit = next_range
+                    pages.append((limit, executor.submit(get_page, api, offset, limit)))
+                    next_range = next(page_ranges, None)
+                if not pages:
+                    return
+                limit, page_future = pages.popleft()
+                page = page_future.result()
+                yield from page
+                if len(page) < limit:
+                    return
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __get_query_page(self, query_api, query):
+        try:
+            api_response = query_api.query_service_execute_query(
+                self.__vault_client.get_vault_id(),
+                query=query
+            )
+            return parse_query_rows(api_response)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.QUERY_REQUEST_REJECTED.value, self.__vault_client.get_logger())
+            handle_exception(e, self.__vault_client.get_logger())
+
+    def iter_query(self, query, page_size = Pagination.PAGE_SIZE, max_in_flight = Pagination.MAX_IN_FLIGHT):
+        """Yield every row that the SELECT query returns as a QueryRow, reading it page_size
+        rows at a time with LIMIT and OFFSET.
+
+        A trailing LIMIT or OFFSET in query bounds the rows read. Up to max_in_flight pages are
+        fetched ahead of the caller, and at most that many pages are held. Since pages are read
+        by OFFSET, query needs an ORDER BY on a unique column for its rows to be read exactly once.
+        """
+        validate_iter_query_options(self.__vault_client.get_logger(), query, page_size, max_in_flight)
+        base_query, query_limit, query_offset = split_query_limit(query, self.__vault_client.get_logger())
+        if not is_query_ordered(base_query):
+            log_warn(SkyflowMessages.Warning.ITER_QUERY_WITHOUT_ORDER_BY.value, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.ITER_QUERY_TRIGGERED.value.format(page_size), self.__vault_client.get_logger())
+        return self.__iter_pages(self.__vault_client.get_query_api,
+                                 lambda query_api, offset, limit: self.__get_query_page(query_api, get_query_page(base_query, offset, limit)),
+                                 get_page_ranges(page_size, query_limit, query_offset), max_in_flight)
+
     def query(self, request: QueryRequest):
         log_info(SkyflowMessages.Info.VALIDATING_QUERY_REQUEST.value, self.__vault_client.get_logger())
         validate_query_request(self.__vault_client.get_logger(), request)
@@ -205,8 +394,7 @@ class Vault:
             log_info(SkyflowMessages.Info.QUERY_TRIGGERED.value, self.__vault_client.get_logger())
             api_response = query_api.query_service_execute_query(
                 self.__vault_client.get_vault_id(),
-                query=request.query,
-                request_options={'additional_headers': self.__get_headers()}
+                query=request.query
             )
             log_info(SkyflowMessages.Info.QUERY_SUCCESS.value, self.__vault_client.get_logger())
             query_response = parse_query_response(api_response)
@@ -215,26 +403,66 @@ class Vault:
             log_error_log(SkyflowMessages.ErrorLogs.QUERY_REQUEST_REJECTED.value, self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def enable_detokenize_batching(self, max_batch_size = DetokenizeBatch.MAX_BATCH_SIZE, max_wait_time = DetokenizeBatch.MAX_WAIT_TIME):
+        """Coalesce concurrent detokenize calls on this vault into batched API calls.
+
+        A batch is sent once it holds max_batch_size tokens or max_wait_time seconds after
+        its first call. Each call still returns only its own detokenized_fields and errors;
+        a call without continue_on_error raises when any of its own tokens fail.
+        """
+        validate_detokenize_batch_options(self.__vault_client.get_logger(), max_batch_size, max_wait_time)
+        self.__detokenize_batcher = DetokenizeBatcher(self.__send_detokenize_batch, max_batch_size, max_wait_time)
+
+    def disable_detokenize_batching(self):
+        self.__detokenize_batcher = None
+
+    def enable_detokenize_cache(self, max_size = ResultCache.MAX_SIZE, ttl = ResultCache.TTL):
+        """Answer detokenize calls on this vault from an in-memory cache where possible.
+
+        Detokenized values are kept for ttl seconds, up to max_size of them with the least
+        recently used evicted first, and only the tokens that miss the cache are sent.
+        """
+        validate_cache_options(self.__vault_client.get_logger(), RequestOperation.DETOKENIZE, max_size, ttl)
+        self.__detokenize_cache = DetokenizeCache(max_size, ttl)
+
+    def disable_detokenize_cache(self):
+        self.__detokenize_cache = None
+
+    @property
+    def detokenize_cache(self):
+        return self.__detokenize_cache
+
     def detokenize(self, request: DetokenizeRequest):
         log_info(SkyflowMessages.Info.VALIDATE_DETOKENIZE_REQUEST.value, self.__vault_client.get_logger())
         validate_detokenize_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.DETOKENIZE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
-        tokens_list = [
-            V1DetokenizeRecordRequest(
-                token=item.get(ResponseField.TOKEN),
-                redaction=item.get(RequestParameter.REDACTION_TYPE) or item.get(RequestParameter.REDACTION, RedactionType.DEFAULT)
-            )
-            for item in request.data
-        ]
+        if self.__detokenize_cache is not None:
+            return self.__detokenize_cached(request)
+        return self.__detokenize(request)
+
+    def __detokenize_cached(self, request):
+        cache = self.__detokenize_cache
+        vault_id = self.__vault_client.get_vault_id()
+        cached_fields, uncached_data = cache.get_uncached_data(vault_id, request.data)
+        log_info(SkyflowMessages.Info.DETOKENIZE_CACHE_HITS.value.format(len(request.data) - len(uncached_data), len(request.data)), self.__vault_client.get_logger())
+        if uncached_data:
+            response = self.__detokenize(DetokenizeRequest(data=uncached_data, continue_on_error=request.continue_on_error))
+        else:
+            response = DetokenizeResponse(detokenized_fields=[], errors=None)
+        return cache.merge(vault_id, request.data, cached_fields, response)
+
+    def __detokenize(self, request):
+        tokens_list = construct_detokenize_records(request)
+        if self.__detokenize_batcher is not None:
+            return self.__detokenize_batched(request, tokens_list)
         tokens_api = self.__vault_client.get_tokens_api().with_raw_response
         try:
             log_info(SkyflowMessages.Info.DETOKENIZE_TRIGGERED.value, self.__vault_client.get_logger())
             api_response = tokens_api.record_service_detokenize(
                 self.__vault_client.get_vault_id(),
                 detokenization_parameters=tokens_list,
-                continue_on_error = request.continue_on_error,
-                request_options={'additional_headers': self.__get_headers()}
+                continue_on_error = request.continue_on_error
             )
             log_info(SkyflowMessages.Info.DETOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
             detokenize_response = parse_detokenize_response(api_response)
@@ -243,31 +471,133 @@ class Vault:
             log_error_log(SkyflowMessages.ErrorLogs.DETOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __send_detokenize_batch(self, tokens_list, request_count):
+        # Sent with continue_on_error so that one caller's bad token does not fail the others.
+        log_info(SkyflowMessages.Info.DETOKENIZE_BATCH_TRIGGERED.value.format(len(tokens_list), request_count), self.__vault_client.get_logger())
+        tokens_api = self.__vault_client.get_tokens_api().with_raw_response
+        api_response = tokens_api.record_service_detokenize(
+            self.__vault_client.get_vault_id(),
+            detokenization_parameters=tokens_list,
+            continue_on_error=True
+        )
+        return api_response.headers.get(HttpHeader.X_REQUEST_ID), api_response.data.records
+
+    def __detokenize_batched(self, request, tokens_list):
+        try:
+            request_id, records = self.__detokenize_batcher.detokenize(tokens_list, self.__vault_client.get_timeout())
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.DETOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            raise get_skyflow_error(e, self.__vault_client.get_logger())
+        detokenize_response = parse_detokenize_batch_records(records, request_id, request.continue_on_error, self.__vault_client.get_logger())
+        log_info(SkyflowMessages.Info.DETOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
+        return detokenize_response
+
+    def enable_tokenize_cache(self, column_groups, max_size = ResultCache.MAX_SIZE, ttl = ResultCache.TTL):
+        """Answer tokenize calls for values of column_groups from an in-memory cache where possible.
+
+        List only column groups with deterministic tokenization. Tokens are kept for ttl
+        seconds, up to max_size of them with the least recently used evicted first.
+        """
+        validate_tokenize_cache_options(self.__vault_client.get_logger(), column_groups, max_size, ttl)
+        self.__tokenize_cache = TokenizeCache(column_groups, max_size, ttl)
+
+    def disable_tokenize_cache(self):
+        self.__tokenize_cache = None
+
+    @property
+    def tokenize_cache(self):
+        return self.__tokenize_cache
+
     def tokenize(self, request: TokenizeRequest):
+        """Tokenize request.values, sending each distinct (value, column_group) pair once.
+
+        Tokens are fanned back out so that tokenized_fields still has one entry per value.
+        """
         log_info(SkyflowMessages.Info.VALIDATING_TOKENIZE_REQUEST.value, self.__vault_client.get_logger())
         validate_tokenize_request(self.__vault_client.get_logger(), request)
         log_info(SkyflowMessages.Info.TOKENIZE_REQUEST_RESOLVED.value, self.__vault_client.get_logger())
         self.__initialize()
 
-        records_list = [
-            V1TokenizeRecordRequest(value=item[RequestParameter.VALUE], column_group=item[RequestParameter.COLUMN_GROUP])
-            for item in request.values
-        ]
+        vault_id = self.__vault_client.get_vault_id()
+        plan = TokenizePlan(vault_id, request.values, self.__tokenize_cache)
+        log_info(SkyflowMessages.Info.TOKENIZE_VALUES_RESOLVED.value.format(len(plan.distinct_values), len(request.values)), self.__vault_client.get_logger())
+        if not plan.distinct_values:
+            return plan.get_response()
+
+        records_list = construct_tokenize_records(TokenizeRequest(values=plan.distinct_values))
         tokens_api = self.__vault_client.get_tokens_api()
         try:
             log_info(SkyflowMessages.Info.TOKENIZE_TRIGGERED.value, self.__vault_client.get_logger())
             api_response = tokens_api.record_service_tokenize(
-                self.__vault_client.get_vault_id(),
-                tokenization_parameters=records_list,
-                request_options={'additional_headers': self.__get_headers()}
+                vault_id,
+                tokenization_parameters=records_list
             )
-            tokenize_response = parse_tokenize_response(api_response)
+            tokenize_response = plan.get_response(parse_tokenize_response(api_response))
             log_info(SkyflowMessages.Info.TOKENIZE_SUCCESS.value, self.__vault_client.get_logger())
             return tokenize_response
         except Exception as e:
             log_error_log(SkyflowMessages.ErrorLogs.TOKENIZE_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
             handle_exception(e, self.__vault_client.get_logger())
 
+    def __upload_file(self, file_upload_api, request):
+        with open_file_for_file_upload(request) as file:
+            api_response = file_upload_api.upload_file_v_2(
+                self.__vault_client.get_vault_id(),
+                table_name=request.table,
+                column_name=request.column_name,
+                file=file,
+                skyflow_id=request.skyflow_id,
+                return_file_metadata= False
+            )
+        return api_response.data.skyflow_id
+
+    def __upload_batch_file(self, file_upload_api, request):
+        try:
+            validate_file_upload_request(self.__vault_client.get_logger(), request)
+            return self.__upload_file(file_upload_api, request)
+        except Exception as e:
+            log_error_log(SkyflowMessages.ErrorLogs.FILE_UPLOAD_REQUEST_REJECTED.value, logger = self.__vault_client.get_logger())
+            return get_skyflow_error(e, self.__vault_client.get_logger())
+
+    def upload_files(self, batch: FileUploadBatch):
+        """Upload the files of batch.requests, which may be any iterable of FileUploadRequest,
+        with up to batch.max_in_flight uploads in flight; reading waits while that many are.
+
+        Returns a FileUploadBatchResponse whose uploaded_files and errors carry the request_index
+        of their request. A failed file does not stop the others. batch.on_progress, if set, is
+        called with the number of files done so far and each file's entry as it finishes. With
+        batch.checkpoint_path, each uploaded file is recorded there, and files already recorded
+        are skipped, so a batch that crashed can be rerun without uploading them again.
+        """
+        log_info(SkyflowMessages.Info.FILE_UPLOAD_BATCH_TRIGGERED.value.format(batch.max_in_flight), self.__vault_client.get_logger())
+        validate_file_upload_batch(self.__vault_client.get_logger(), batch)
+        tracker = FileUploadTracker(batch)
+        pending = {}
+        with ThreadPoolExecutor(max_workers=batch.max_in_flight) as executor:
+            for request_index, request in enumerate(batch.requests):
+                key = tracker.get_key(request)
+                uploaded_skyflow_id = tracker.get_uploaded_skyflow_id(key)
+                if uploaded_skyflow_id is not None:
+                    tracker.skip(request_index, uploaded_skyflow_id)
+                    continue
+                # Large batches outlive a bearer token; this refreshes it when due.
+                self.__initialize()
+                file_upload_api = self.__vault_client.get_records_api().with_raw_response
+                future = executor.submit(self.__upload_batch_file, file_upload_api, request)
+                pending[future] = (request_index, key)
+                if len(pending) >= batch.max_in_flight:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        tracker.add_result(*pending.pop(future), future.result())
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    tracker.add_result(*pending.pop(future), future.result())
+        upload_response = tracker.get_response()
+        log_info(SkyflowMessages.Info.FILE_UPLOAD_BATCH_SUCCESS.value.format(
+            len(upload_response.uploaded_files) - tracker.skipped, tracker.skipped, len(upload_response.errors or [])), self.__vault_client.get_logger())
+        return upload_response
+
     def upload_file(self, request: FileUploadRequest):
         log_info(SkyflowMessages.Info.FILE_UPLOAD_TRIGGERED.value, self.__vault_client.get_logger())
         log_info(SkyflowMessages.Info.VALIDATING_FILE_UPLOAD_REQUEST.value, self.__vault_client.get_logger())
@@ -275,19 +605,11 @@ class Vault:
         self.__initialize()
         file_upload_api = self.__vault_client.get_records_api().with_raw_response
         try:
-            api_response = file_upload_api.upload_file_v_2(
-                self.__vault_client.get_vault_id(),
-                table_name=request.table,
-                column_name=request.column_name,
-                file=self.__get_file_for_file_upload(request),
-                skyflow_id=request.skyflow_id,
-                return_file_metadata= False,
-                request_options={'additional_headers': self.__get_headers()}
-            )
+            skyflow_id = self.__upload_file(file_upload_api, request)
             log_info(SkyflowMessages.Info.FILE_UPLOAD_REQUEST_RESOLVED.value, self.__vault_client.get_logger())            
             log_info(SkyflowMessages.Info.FILE_UPLOAD_SUCCESS.value, self.__vault_client.get_logger())
             upload_response = FileUploadResponse(
-                skyflow_id=api_response.data.skyflow_id,
+                skyflow_id=skyflow_id,
                 errors=None
             )
             return upload_response
@@ -1,13 +1,21 @@
 from ._insert_response import InsertResponse
 from ._insert_request import InsertRequest
+from ._bulk_insert_request import BulkInsertRequest
 from ._get_request import GetRequest
+from ._bulk_get_request import BulkGetRequest
 from ._get_response import GetResponse
 from ._delete_request import DeleteRequest
+from ._bulk_delete_request import BulkDeleteRequest
 from ._delete_response import DeleteResponse
 from ._update_request import UpdateRequest
 from ._update_response import UpdateResponse
+from ._update_many_request import UpdateManyRequest
+from ._update_many_response import UpdateManyResponse
 from ._upload_file_request import UploadFileRequest
 from ._query_request import QueryRequest
 from ._query_response import QueryResponse
+from ._query_row import QueryRow
 from ._file_upload_request import FileUploadRequest
-from ._file_upload_response import FileUploadResponse
\ No newline at end of file
+from ._file_upload_response import FileUploadResponse
+from ._file_upload_batch import FileUploadBatch
+from ._file_upload_batch_response import FileUploadBatchResponse
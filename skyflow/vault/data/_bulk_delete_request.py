@@ -0,0 +1,14 @@
+from skyflow.utils.constants import BulkOperation
+from ._delete_request import DeleteRequest
+
+class BulkDeleteRequest(DeleteRequest):
+    def __init__(self,
+                 table,
+                 ids,
+                 chunk_size = BulkOperation.CHUNK_SIZE,
+                 max_in_flight = BulkOperation.MAX_IN_FLIGHT,
+                 max_retries = BulkOperation.MAX_RETRIES):
+        super().__init__(table, ids)
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
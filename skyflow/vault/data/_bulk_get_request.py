@@ -0,0 +1,17 @@
+from skyflow.utils.constants import BulkOperation
+from ._get_request import GetRequest
+
+class BulkGetRequest(GetRequest):
+    def __init__(self,
+                 table,
+                 ids,
+                 redaction_type = None,
+                 return_tokens = False,
+                 fields = None,
+                 download_url = None,
+                 chunk_size = BulkOperation.CHUNK_SIZE,
+                 max_in_flight = BulkOperation.MAX_IN_FLIGHT):
+        super().__init__(table, ids=ids, redaction_type=redaction_type, return_tokens=return_tokens,
+                         fields=fields, download_url=download_url)
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
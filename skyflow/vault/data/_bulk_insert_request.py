@@ -0,0 +1,22 @@
+from skyflow.utils.constants import BulkOperation
+from skyflow.utils.enums import TokenMode
+from ._insert_request import InsertRequest
+
+class BulkInsertRequest(InsertRequest):
+    def __init__(self,
+                 table,
+                 values,
+                 tokens = None,
+                 upsert = None,
+                 homogeneous = False,
+                 token_mode = TokenMode.DISABLE,
+                 return_tokens = True,
+                 continue_on_error = False,
+                 chunk_size = BulkOperation.CHUNK_SIZE,
+                 max_chunk_bytes = BulkOperation.MAX_CHUNK_BYTES,
+                 max_in_flight = BulkOperation.MAX_IN_FLIGHT):
+        super().__init__(table, values, tokens=tokens, upsert=upsert, homogeneous=homogeneous, token_mode=token_mode,
+                         return_tokens=return_tokens, continue_on_error=continue_on_error)
+        self.chunk_size = chunk_size
+        self.max_chunk_bytes = max_chunk_bytes
+        self.max_in_flight = max_in_flight
@@ -0,0 +1,12 @@
+from skyflow.utils.constants import BulkOperation
+
+class FileUploadBatch:
+    def __init__(self,
+                 requests,
+                 max_in_flight = BulkOperation.MAX_IN_FLIGHT,
+                 checkpoint_path = None,
+                 on_progress = None):
+        self.requests = requests
+        self.max_in_flight = max_in_flight
+        self.checkpoint_path = checkpoint_path
+        self.on_progress = on_progress
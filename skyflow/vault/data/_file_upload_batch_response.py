@@ -0,0 +1,10 @@
+class FileUploadBatchResponse:
+    def __init__(self, uploaded_files = None, errors = None):
+        self.uploaded_files = uploaded_files
+        self.errors = errors
+
+    def __repr__(self):
+        return f"FileUploadBatchResponse(uploaded_files={self.uploaded_files}, errors={self.errors})"
+
+    def __str__(self):
+        return self.__repr__()
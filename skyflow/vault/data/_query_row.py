@@ -0,0 +1,28 @@
+from collections.abc import Mapping
+
+class QueryRow(Mapping):
+    """Read-only view of one row returned by a query, backed by the row's fields as
+    returned by the API rather than a copy of them.
+    """
+    __slots__ = ('_fields',)
+
+    def __init__(self, fields):
+        self._fields = fields
+
+    def __getitem__(self, key):
+        return self._fields[key]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def to_dict(self):
+        return dict(self._fields)
+
+    def __repr__(self):
+        return f"QueryRow({self._fields})"
+
+    def __str__(self):
+        return self.__repr__()
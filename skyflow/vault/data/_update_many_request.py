@@ -0,0 +1,19 @@
+from skyflow.utils.constants import BulkOperation
+from skyflow.utils.enums import TokenMode
+
+class UpdateManyRequest:
+    def __init__(self,
+                 table,
+                 data,
+                 tokens = None,
+                 return_tokens = False,
+                 token_mode = TokenMode.DISABLE,
+                 chunk_size = BulkOperation.CHUNK_SIZE,
+                 max_in_flight = BulkOperation.MAX_IN_FLIGHT):
+        self.table = table
+        self.data = data
+        self.tokens = tokens
+        self.return_tokens = return_tokens
+        self.token_mode = token_mode
+        self.chunk_size = chunk_size
+        self.max_in_flight = max_in_flight
@@ -0,0 +1,10 @@
+class UpdateManyResponse:
+    def __init__(self, updated_fields = None, errors = None):
+        self.updated_fields = updated_fields
+        self.errors = errors
+
+    def __repr__(self):
+        return f"UpdateManyResponse(updated_fields={self.updated_fields}, errors={self.errors})"
+
+    def __str__(self):
+        return self.__repr__()
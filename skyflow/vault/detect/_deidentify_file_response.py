@@ -19,6 +19,7 @@ class DeidentifyFileResponse:
         run_id: Optional[str] = None,
         status: Optional[str] = None,
         errors: Optional[list] = None,
+        request_index: Optional[int] = None,
     ):
         self.file_base64 = file_base64
         self.file = File(file) if file else None
@@ -34,6 +35,8 @@ class DeidentifyFileResponse:
         self.run_id = run_id
         self.status = status
         self.errors = errors
+        # Position of the request in a deidentify_files batch; None for deidentify_file.
+        self.request_index = request_index
 
     def __repr__(self):
         return (
@@ -43,7 +46,8 @@ class DeidentifyFileResponse:
             f"char_count={self.char_count!r}, size_in_kb={self.size_in_kb!r}, "
             f"duration_in_seconds={self.duration_in_seconds!r}, page_count={self.page_count!r}, "
             f"slide_count={self.slide_count!r}, entities={self.entities!r}, "
-            f"run_id={self.run_id!r}, status={self.status!r}, errors={self.errors!r})"
+            f"run_id={self.run_id!r}, status={self.status!r}, errors={self.errors!r}, "
+            f"request_index={self.request_index!r})"
         )
 
     def __str__(self):
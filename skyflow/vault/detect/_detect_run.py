@@ -0,0 +1,30 @@
+from concurrent.futures import Future
+from skyflow.utils.constants import DetectStatus
+
+class DetectRun(Future):
+    """Handle of a run started by submit_deidentify_file.
+
+    A concurrent.futures.Future of the run's DeidentifyFileResponse, so it works with
+    concurrent.futures.wait and as_completed, and with asyncio.wrap_future. The Detect that
+    submitted it polls the run in the background until it completes, and result raises the
+    SkyflowError of a failed poll. Cancelling the handle only stops the polling.
+    """
+    def __init__(self, run_id: str):
+        super().__init__()
+        self.run_id = run_id
+
+    def status(self):
+        """Return the status of the run as of its last poll, without waiting for it."""
+        if not self.done():
+            return DetectStatus.IN_PROGRESS
+        if self.cancelled():
+            return DetectStatus.UNKNOWN
+        if self.exception() is not None:
+            return DetectStatus.FAILED
+        return self.result().status
+
+    def __repr__(self):
+        return f"DetectRun(run_id={self.run_id!r}, status={self.status()!r})"
+
+    def __str__(self):
+        return self.__repr__()
@@ -0,0 +1,71 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import jwt
+
+from skyflow.error import SkyflowError
+from skyflow.service_account import _utils as service_account_utils
+from skyflow.service_account import SignedTokenGenerator
+from skyflow.utils import SkyflowMessages
+
+creds_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "credentials.json")
+with open(creds_path, "r") as file:
+    credentials = json.load(file)
+
+
+def decode(signed_token):
+    return jwt.decode(signed_token[len("signed_token_"):], options={"verify_signature": False})
+
+
+class TestSignedTokenGenerator(unittest.TestCase):
+    def test_generate_streams_tokens_in_order(self):
+        generator = SignedTokenGenerator(credentials, {"time_to_live": 90, "ctx": "user_1"})
+        results = generator.generate(iter(["t1", "t2", "t3"]), chunk_size=2)
+
+        self.assertNotIsInstance(results, list)
+        results = list(results)
+        self.assertEqual([data_token for data_token, _ in results], ["t1", "t2", "t3"])
+        claims = decode(results[0][1])
+        self.assertEqual(claims["tok"], "t1")
+        self.assertEqual(claims["ctx"], "user_1")
+        self.assertEqual(claims["exp"] - claims["iat"], 90)
+
+    def test_private_key_is_loaded_once(self):
+        with patch("skyflow.service_account._utils.load_pem_private_key",
+                   wraps=service_account_utils.load_pem_private_key) as mock_load:
+            generator = SignedTokenGenerator({**credentials, "privateKey": credentials["privateKey"] + "\n"})
+            list(generator.generate(["t1", "t2", "t3"]))
+        self.assertEqual(mock_load.call_count, 1)
+
+    def test_generate_with_process_pool(self):
+        generator = SignedTokenGenerator.from_file(creds_path)
+        data_tokens = [f"t{index}" for index in range(25)]
+
+        results = list(generator.generate(data_tokens, processes=2, chunk_size=4))
+
+        self.assertEqual([data_token for data_token, _ in results], data_tokens)
+        self.assertEqual(decode(results[-1][1])["tok"], "t24")
+
+    def test_sign_single_token(self):
+        generator = SignedTokenGenerator.from_creds(json.dumps(credentials))
+        data_token, signed_token = generator.sign("t1")
+        self.assertEqual(data_token, "t1")
+        self.assertTrue(signed_token.startswith("signed_token_"))
+
+    def test_invalid_token_uri_raises(self):
+        with self.assertRaises(SkyflowError) as context:
+            SignedTokenGenerator({**credentials, "tokenURI": "not_a_url"})
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_TOKEN_URI.value)
+
+    def test_invalid_private_key_raises_on_sign(self):
+        generator = SignedTokenGenerator({**credentials, "privateKey": "private_key"})
+        with self.assertRaises(SkyflowError) as context:
+            list(generator.generate(["t1"]))
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_CREDENTIALS.value)
+
+    def test_from_creds_with_invalid_string_raises(self):
+        with self.assertRaises(SkyflowError) as context:
+            SignedTokenGenerator.from_creds("invalid_json")
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_CREDENTIALS_STRING.value)
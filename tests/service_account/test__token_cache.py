@@ -0,0 +1,169 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+import jwt
+
+from skyflow.service_account import InMemoryTokenCacheBackend, FileTokenCacheBackend, set_token_cache_backend
+from skyflow.service_account._token_cache import get_cached_bearer_token, get_token_cache_key, \
+    get_credentials_file_identity, TokenCacheBackend
+
+JWT_SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+
+def make_jwt(issued_at, expires_at, sub="client"):
+    return jwt.encode({"iat": issued_at, "exp": expires_at, "sub": sub}, JWT_SECRET, algorithm="HS256")
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.backend = InMemoryTokenCacheBackend()
+        set_token_cache_backend(self.backend)
+
+    def tearDown(self):
+        set_token_cache_backend(InMemoryTokenCacheBackend())
+
+    def test_cache_key_depends_on_roles_ctx_and_token_uri(self):
+        options = {"role_ids": ["r1"], "ctx": "ctx", "token_uri": "https://a.example.com"}
+        key = get_token_cache_key("/creds.json", options)
+        self.assertEqual(key, get_token_cache_key("/creds.json", dict(options)))
+        self.assertNotEqual(key, get_token_cache_key("/other.json", options))
+        self.assertNotEqual(key, get_token_cache_key("/creds.json", {**options, "role_ids": ["r2"]}))
+        self.assertNotEqual(key, get_token_cache_key("/creds.json", {**options, "ctx": "other"}))
+        self.assertNotEqual(key, get_token_cache_key("/creds.json", {**options, "token_uri": "https://b.example.com"}))
+
+    def test_cache_key_does_not_contain_credentials(self):
+        self.assertNotIn("privateKey", get_token_cache_key('{"privateKey": "secret"}', None))
+
+    def test_fresh_token_is_reused(self):
+        now = time.time()
+        generate = Mock(return_value=make_jwt(now, now + 1000))
+        self.assertEqual(get_cached_bearer_token("key", generate), get_cached_bearer_token("key", generate))
+        generate.assert_called_once()
+
+    def test_token_due_for_refresh_is_regenerated(self):
+        now = time.time()
+        generate = Mock(side_effect=[make_jwt(now - 900, now + 100), make_jwt(now, now + 1000, sub="fresh")])
+        first = get_cached_bearer_token("key", generate)
+        second = get_cached_bearer_token("key", generate)
+        self.assertNotEqual(first, second)
+        self.assertEqual(generate.call_count, 2)
+
+    def test_token_without_expiry_is_not_cached(self):
+        generate = Mock(return_value="opaque_token")
+        get_cached_bearer_token("key", generate)
+        get_cached_bearer_token("key", generate)
+        self.assertEqual(generate.call_count, 2)
+
+    def test_concurrent_callers_generate_once(self):
+        now = time.time()
+        barrier = threading.Barrier(8)
+        calls = []
+
+        def generate():
+            calls.append(1)
+            time.sleep(0.05)
+            return make_jwt(now, now + 1000)
+
+        def call():
+            barrier.wait()
+            get_cached_bearer_token("key", generate)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+
+    def test_file_backend_shares_tokens_between_instances(self):
+        now = time.time()
+        token = make_jwt(now, now + 1000)
+        with tempfile.TemporaryDirectory() as directory:
+            set_token_cache_backend(FileTokenCacheBackend(directory))
+            self.assertEqual(get_cached_bearer_token("key", lambda: token), token)
+
+            set_token_cache_backend(FileTokenCacheBackend(directory))
+            generate = Mock()
+            self.assertEqual(get_cached_bearer_token("key", generate), token)
+            generate.assert_not_called()
+
+    def test_file_backend_ignores_unreadable_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            backend = FileTokenCacheBackend(directory)
+            with open(f"{directory}/key.json", "w") as entry_file:
+                entry_file.write("not json")
+            self.assertIsNone(backend.get("key"))
+
+    def test_credentials_file_identity_changes_when_file_is_rewritten(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "creds.json")
+            with open(path, "w") as credentials_file:
+                credentials_file.write("{}")
+            identity = get_credentials_file_identity(path)
+            self.assertEqual(identity, get_credentials_file_identity(os.path.relpath(path)))
+
+            with open(path, "w") as credentials_file:
+                credentials_file.write('{"clientID": "other"}')
+            self.assertNotEqual(get_token_cache_key(identity, None),
+                                get_token_cache_key(get_credentials_file_identity(path), None))
+
+    def test_credentials_file_identity_of_missing_file_is_its_path(self):
+        self.assertEqual(get_credentials_file_identity("missing.json"), os.path.abspath("missing.json"))
+
+    @patch("skyflow.service_account._token_cache.BearerToken.CACHE_MAX_SIZE", 2)
+    def test_in_memory_backend_evicts_expired_then_oldest_entries(self):
+        now = time.time()
+        backend = InMemoryTokenCacheBackend()
+        backend.set("expired", {"token": "a", "refresh_at": now - 10, "expires_at": now - 1})
+        backend.set("oldest", {"token": "b", "refresh_at": now + 10, "expires_at": now + 100})
+        backend.set("new", {"token": "c", "refresh_at": now + 10, "expires_at": now + 100})
+        self.assertIsNone(backend.get("expired"))
+        self.assertIsNotNone(backend.get("oldest"))
+
+        backend.set("newest", {"token": "d", "refresh_at": now + 10, "expires_at": now + 100})
+        self.assertIsNone(backend.get("oldest"))
+        self.assertIsNotNone(backend.get("new"))
+        self.assertIsNotNone(backend.get("newest"))
+
+    @patch("skyflow.service_account._token_cache.BearerToken.CACHE_MAX_SIZE", 2)
+    def test_in_memory_backend_prunes_locks_nobody_holds(self):
+        backend = InMemoryTokenCacheBackend()
+        held = backend.lock("held")
+        idle = backend.lock("idle")
+        with held:
+            backend.lock("new")
+            self.assertIs(backend.lock("held"), held)
+            self.assertIsNot(backend.lock("idle"), idle)
+
+    def test_token_cache_backend_requires_get_set_and_lock(self):
+        class PartialBackend(TokenCacheBackend):
+            def get(self, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            TokenCacheBackend()
+        with self.assertRaises(TypeError):
+            PartialBackend()
+
+    @patch("skyflow.service_account._token_cache.BearerToken.CACHE_MAX_SIZE", 2)
+    def test_file_backend_evicts_expired_then_oldest_entries(self):
+        now = time.time()
+        fresh = {"token": "t", "refresh_at": now + 10, "expires_at": now + 100}
+        with tempfile.TemporaryDirectory() as directory:
+            backend = FileTokenCacheBackend(directory)
+            backend.set("expired", {"token": "t", "refresh_at": now - 10, "expires_at": now - 1})
+            backend.set("oldest", fresh)
+            os.utime(os.path.join(directory, "oldest.json"), (now - 60, now - 60))
+            backend.set("new", fresh)
+            self.assertIsNone(backend.get("expired"))
+            self.assertIsNotNone(backend.get("oldest"))
+
+            backend.set("newest", fresh)
+            self.assertIsNone(backend.get("oldest"))
+            self.assertIsNotNone(backend.get("new"))
+            self.assertEqual(sorted(name for name in os.listdir(directory) if name.endswith(".json")),
+                             ["new.json", "newest.json"])
@@ -4,6 +4,7 @@ import jwt
 import json
 from unittest.mock import patch
 import os
+import tempfile
 from skyflow.error import SkyflowError
 from skyflow.service_account import is_expired, generate_bearer_token, generate_bearer_token_from_creds
 from skyflow.utils import SkyflowMessages
@@ -16,7 +17,10 @@ from skyflow.service_account._utils import (
     _validate_and_resolve_ctx,
     _normalize_credentials,
     get_signed_tokens,
+    _read_credentials_file,
+    _load_private_key,
 )
+from skyflow.service_account.client.auth_client import AuthClient
 
 creds_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "credentials.json")
 with open(creds_path, "r") as file:
@@ -75,6 +79,20 @@ class TestServiceAccountUtils(unittest.TestCase):
         token = jwt.encode({"exp": time.time() + 1000}, key="test", algorithm="HS256")
         self.assertTrue(is_expired(token))
 
+    def test_is_expired_decodes_each_token_once(self):
+        token = jwt.encode({"exp": time.time() + 1000, "sub": "memoized"}, key="test", algorithm="HS256")
+        with patch("skyflow.service_account._utils.jwt.decode", wraps=jwt.decode) as mock_decode:
+            self.assertFalse(is_expired(token))
+            self.assertFalse(is_expired(token))
+        mock_decode.assert_called_once()
+
+    def test_is_expired_memoized_token_still_expires(self):
+        expiry = time.time() + 1000
+        token = jwt.encode({"exp": expiry, "sub": "memoized-expiry"}, key="test", algorithm="HS256")
+        self.assertFalse(is_expired(token))
+        with patch("skyflow.service_account._utils.time.time", return_value=expiry + 1):
+            self.assertTrue(is_expired(token))
+
     # ── generate_bearer_token ─────────────────────────────────────────────────
 
     @patch("builtins.open", side_effect=FileNotFoundError)
@@ -603,4 +621,45 @@ class TestServiceAccountUtils(unittest.TestCase):
         self.assertEqual(
             context.exception.message,
             SkyflowMessages.Error.FILE_INVALID_JSON.value.format(invalid_path),
-        )
\ No newline at end of file
+        )
+    # ── credentials and auth client reuse ─────────────────────────────────────
+
+    def test_credentials_file_is_parsed_once_until_it_changes(self):
+        creds = {"privateKey": "private_key", "clientID": "client_id", "keyID": "key_id", "tokenURI": "https://valid-url.com"}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "creds.json")
+            with open(path, "w") as creds_file:
+                json.dump(creds, creds_file)
+            with patch("skyflow.service_account._utils.json.load", wraps=json.load) as mock_load:
+                self.assertEqual(_read_credentials_file(path), creds)
+                self.assertEqual(_read_credentials_file(path), creds)
+                self.assertEqual(mock_load.call_count, 1)
+
+                with open(path, "w") as creds_file:
+                    json.dump({**creds, "keyID": "rotated_key_id"}, creds_file)
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+                self.assertEqual(_read_credentials_file(path)["keyID"], "rotated_key_id")
+                self.assertEqual(mock_load.call_count, 2)
+
+    def test_private_key_is_loaded_once(self):
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
+        pem = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        ).decode("utf-8")
+        loaded_key = _load_private_key(pem)
+        self.assertIs(_load_private_key(pem), loaded_key)
+        token = get_signed_jwt({}, "client_id", "key_id", "https://valid-url.com", loaded_key, None)
+        self.assertEqual(jwt.get_unverified_header(token)["alg"], "RS256")
+
+    def test_invalid_private_key_is_passed_through(self):
+        self.assertEqual(_load_private_key("private_key"), "private_key")
+
+    def test_auth_client_reuses_api_client_per_url(self):
+        first = AuthClient("https://auth-pool-one.example.com")
+        second = AuthClient("https://auth-pool-one.example.com")
+        other = AuthClient("https://auth-pool-two.example.com")
+        self.assertIs(first.get_auth_api(), second.get_auth_api())
+        self.assertIsNot(first.get_auth_api(), other.get_auth_api())
@@ -0,0 +1,65 @@
+import base64
+import io
+import os
+import unittest
+
+import httpx
+
+from skyflow.utils._base64_stream import Base64Reader, encode_file_to_base64, iter_base64_chunks
+
+
+class TestBase64Reader(unittest.TestCase):
+    def setUp(self):
+        self.data = bytes(range(256)) * 40
+        self.encoded = base64.b64encode(self.data).decode()
+
+    def test_iter_base64_chunks_decodes_in_bounded_chunks(self):
+        for chunk_size in [1, 3, 7, 1000]:
+            chunks = list(iter_base64_chunks(self.encoded, chunk_size))
+            self.assertEqual(b"".join(chunks), self.data)
+            self.assertLessEqual(max(len(chunk) for chunk in chunks), max(chunk_size // 3, 1) * 3)
+
+    def test_iter_base64_chunks_ignores_non_alphabet_characters(self):
+        wrapped = "\n".join(self.encoded[start:start + 76] for start in range(0, len(self.encoded), 76))
+        self.assertEqual(b"".join(iter_base64_chunks(wrapped, 100)), self.data)
+        self.assertEqual(b"".join(iter_base64_chunks(wrapped.encode(), 100)), self.data)
+
+    def test_iter_base64_chunks_rejects_invalid_input(self):
+        for invalid in ["not-valid-base64!!!", "dGVzdA=é="]:
+            with self.assertRaises(ValueError):
+                list(iter_base64_chunks(invalid))
+
+    def test_encode_file_to_base64_matches_whole_file_encoding(self):
+        for chunk_size in [1, 4, 300, 100000]:
+            self.assertEqual(encode_file_to_base64(io.BytesIO(self.data), chunk_size), self.encoded)
+        self.assertEqual(encode_file_to_base64(io.BytesIO(b"")), "")
+
+    def test_encode_file_to_base64_handles_short_reads(self):
+        class ShortReader(io.BytesIO):
+            def read(self, size=-1):
+                return super().read(min(size, 5))
+
+        self.assertEqual(encode_file_to_base64(ShortReader(self.data), 300), self.encoded)
+
+    def test_reader_reads_rewinds_and_reports_length(self):
+        reader = Base64Reader(self.encoded, chunk_size=300)
+
+        self.assertEqual(reader.read(10), self.data[:10])
+        self.assertEqual(reader.seek(0, os.SEEK_END), len(self.data))
+        self.assertEqual(reader.read(), b"")
+        self.assertEqual(reader.seek(0), 0)
+        self.assertEqual(reader.read(), self.data)
+        with self.assertRaises(io.UnsupportedOperation):
+            reader.seek(5)
+
+    def test_reader_streams_into_multipart_body_with_content_length(self):
+        request = httpx.Request("POST", "https://example.com", files={"file": ("a.bin", Base64Reader(self.encoded, chunk_size=300))})
+        expected = httpx.Request("POST", "https://example.com", files={"file": ("a.bin", self.data)},
+                                 headers={"Content-Type": request.headers["Content-Type"]})
+
+        self.assertEqual(request.headers["Content-Length"], expected.headers["Content-Length"])
+        self.assertEqual(b"".join(request.stream), b"".join(expected.stream))
+
+
+if __name__ == '__main__':
+    unittest.main()
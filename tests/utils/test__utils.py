@@ -33,7 +33,7 @@ from skyflow.utils import (
     parse_reidentify_text_response,
     convert_detected_entity_to_entity_info,
 )
-from skyflow.utils._utils import parse_path_params, to_lowercase_keys, get_metrics, handle_json_error, r_urlencode
+from skyflow.utils._utils import parse_path_params, to_lowercase_keys, get_metrics, get_metrics_headers, get_chunks, get_distinct_tokenize_values, merge_tokenize_response, split_query_limit, is_query_ordered, get_query_page, get_page_ranges, handle_json_error, r_urlencode
 from skyflow.utils.enums import EnvUrls, Env, ContentType
 from skyflow.vault.connection import InvokeConnectionResponse
 from skyflow.vault.data import InsertResponse, DeleteResponse, GetResponse, QueryResponse
@@ -176,6 +176,70 @@ class TestUtils(unittest.TestCase):
         self.assertIn("sdk_client_os_details", metrics)
         self.assertIn("sdk_runtime_details", metrics)
 
+    def test_get_chunks_bounds_count_and_bytes(self):
+        self.assertEqual(list(get_chunks(iter(range(5)), 2)), [(0, [0, 1]), (2, [2, 3]), (4, [4])])
+        values = [{"v": "x" * 10}, {"v": "y" * 10}, {"v": "z" * 100}]
+        self.assertEqual([start for start, _ in get_chunks(values, 10, max_chunk_bytes=40)], [0, 2])
+
+    def test_get_distinct_tokenize_values(self):
+        values = [{"value": "a", "column_group": "g1"}, {"value": "a", "column_group": "g2"},
+                  {"value": "a", "column_group": "g1"}, {"value": 1, "column_group": "g1"},
+                  {"value": True, "column_group": "g1"}, {"value": ["x"], "column_group": "g1"},
+                  {"value": ["x"], "column_group": "g1"}]
+
+        distinct_values, positions = get_distinct_tokenize_values(values)
+
+        self.assertEqual(distinct_values, [values[0], values[1], values[3], values[4], values[5], values[6]])
+        self.assertEqual(positions, [0, 1, 0, 2, 3, 4, 5])
+
+    def test_split_query_limit(self):
+        self.assertEqual(split_query_limit("SELECT * FROM t"), ("SELECT * FROM t", None, 0))
+        self.assertEqual(split_query_limit("SELECT * FROM t limit 10 OFFSET 5; "), ("SELECT * FROM t", 10, 5))
+        self.assertEqual(split_query_limit("SELECT * FROM t OFFSET 5"), ("SELECT * FROM t", None, 5))
+        self.assertEqual(split_query_limit("SELECT * FROM (SELECT * FROM t LIMIT 3) s"), ("SELECT * FROM (SELECT * FROM t LIMIT 3) s", None, 0))
+        self.assertEqual(split_query_limit("SELECT * FROM t OFFSET 5 LIMIT 10"), ("SELECT * FROM t", 10, 5))
+        self.assertEqual(split_query_limit("SELECT * FROM t LIMIT 5, 10;"), ("SELECT * FROM t", 10, 5))
+        self.assertEqual(split_query_limit("SELECT * FROM t WHERE name = 'limit 5'"), ("SELECT * FROM t WHERE name = 'limit 5'", None, 0))
+        self.assertEqual(get_query_page("SELECT * FROM t", 50, 25), "SELECT * FROM t LIMIT 25 OFFSET 50")
+
+    def test_split_query_limit_rejects_unreadable_clauses(self):
+        for query in ["SELECT * FROM t LIMIT 5 LIMIT 10", "SELECT * FROM t OFFSET 1 LIMIT 5, 10",
+                      "SELECT * FROM t LIMIT ALL", "SELECT * FROM t LIMIT 5 OFFSET 1 OFFSET 2"]:
+            with self.assertRaises(SkyflowError) as context:
+                split_query_limit(query)
+            self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_QUERY_LIMIT.value)
+
+    def test_get_page_ranges(self):
+        self.assertEqual(list(get_page_ranges(25, 60, 10)), [(10, 25), (35, 25), (60, 10)])
+        self.assertEqual(list(get_page_ranges(25, 0)), [])
+        pages = get_page_ranges(10)
+        self.assertEqual([next(pages) for _ in range(3)], [(0, 10), (10, 10), (20, 10)])
+
+    def test_is_query_ordered(self):
+        self.assertTrue(is_query_ordered("SELECT * FROM t ORDER  BY skyflow_id"))
+        self.assertFalse(is_query_ordered("SELECT * FROM t"))
+        self.assertFalse(is_query_ordered("SELECT * FROM (SELECT * FROM t ORDER BY name) s"))
+
+    def test_merge_tokenize_response_fans_out_fields(self):
+        response = TokenizeResponse(tokenized_fields=[{"token": "t1"}, {"token": "t2"}])
+
+        merged = merge_tokenize_response(response, [0, 1, 0], [None, {"token": "cached"}, None, None])
+
+        self.assertEqual(merged.tokenized_fields, [{"token": "t1"}, {"token": "cached"}, {"token": "t2"}, {"token": "t1"}])
+        self.assertIsNot(merged.tokenized_fields[0], merged.tokenized_fields[3])
+
+    def test_get_metrics_headers_serializes_once(self):
+        with patch("skyflow.utils._utils.json.dumps", wraps=json.dumps) as mock_dumps:
+            import skyflow.utils._utils as utils_module
+
+            utils_module._CACHED_METRICS_HEADERS.clear()
+            headers = get_metrics_headers()
+            with self.assertRaises(TypeError):
+                headers["X-Custom"] = "1"
+            self.assertEqual(get_metrics_headers(), {"sky-metadata": headers["sky-metadata"]})
+        mock_dumps.assert_called_once()
+        self.assertEqual(json.loads(headers["sky-metadata"]), get_metrics())
+
     def test_get_metrics_platform_node_exception(self):
         import skyflow.utils._utils as utils_module
 
@@ -195,6 +195,41 @@ class TestValidations(unittest.TestCase):
         self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_VAULT_ID.value)
 
 
+    def test_validate_vault_config_with_http_client_options(self):
+        config = {
+            "vault_id": "vault123",
+            "cluster_id": "cluster123",
+            "max_connections": 50,
+            "max_keepalive_connections": 50,
+            "keepalive_expiry": 30,
+            "timeout": 10.5,
+            "http2": False
+        }
+        self.assertTrue(validate_vault_config(self.logger, config))
+
+    def test_validate_vault_config_invalid_http_client_options(self):
+        invalid_options = [
+            ("max_connections", 0, SkyflowMessages.Error.INVALID_CONNECTION_LIMIT.value.format("max_connections", "vault", "vault123")),
+            ("max_keepalive_connections", True, SkyflowMessages.Error.INVALID_CONNECTION_LIMIT.value.format("max_keepalive_connections", "vault", "vault123")),
+            ("keepalive_expiry", "30", SkyflowMessages.Error.INVALID_HTTP_TIMEOUT.value.format("keepalive_expiry", "vault", "vault123")),
+            ("timeout", -1, SkyflowMessages.Error.INVALID_HTTP_TIMEOUT.value.format("timeout", "vault", "vault123")),
+            ("http2", "yes", SkyflowMessages.Error.INVALID_HTTP2.value.format("vault", "vault123")),
+        ]
+        for key, value, message in invalid_options:
+            with self.subTest(key=key):
+                config = {"vault_id": "vault123", "cluster_id": "cluster123", key: value}
+                with self.assertRaises(SkyflowError) as context:
+                    validate_vault_config(self.logger, config)
+                self.assertEqual(context.exception.message, message)
+
+    @patch("skyflow.utils.validations._validations.importlib.util.find_spec", return_value=None)
+    def test_validate_vault_config_http2_without_h2(self, mock_find_spec):
+        config = {"vault_id": "vault123", "cluster_id": "cluster123", "http2": True}
+        with self.assertRaises(SkyflowError) as context:
+            validate_vault_config(self.logger, config)
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.HTTP2_NOT_INSTALLED.value.format("vault", "vault123"))
+        mock_find_spec.assert_called_once_with("h2")
+
     def test_validate_update_vault_config_valid(self):
         from skyflow.utils.enums import Env
         config = {
@@ -241,6 +276,20 @@ class TestValidations(unittest.TestCase):
         }
         self.assertTrue(validate_connection_config(self.logger, config))
 
+    def test_validate_connection_config_invalid_max_retries(self):
+        config = {
+            "connection_id": "conn123",
+            "connection_url": "https://example.com",
+            "credentials": {
+                "api_key": "sky-abc12-1234567890abcdef1234567890abcdef"
+            },
+            "max_retries": -1
+        }
+        with self.assertRaises(SkyflowError) as context:
+            validate_connection_config(self.logger, config)
+        self.assertEqual(context.exception.message,
+                         SkyflowMessages.Error.INVALID_MAX_RETRIES.value.format("connection", "conn123"))
+
     def test_validate_connection_config_missing_url(self):
         config = {
             "connection_id": "conn123",
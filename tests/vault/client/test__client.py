@@ -1,8 +1,14 @@
+import asyncio
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 
+import jwt
+
 from skyflow.error import SkyflowError
-from skyflow.utils import SkyflowMessages
+from skyflow.utils import SkyflowMessages, get_metrics_headers
+from skyflow.service_account import InMemoryTokenCacheBackend, set_token_cache_backend
 from skyflow.vault.client.client import VaultClient
 
 CONFIG = {
@@ -18,10 +24,16 @@ CREDENTIALS_WITH_API_KEY = {"api_key": "dummy_api_key"}
 CREDENTIALS_WITH_TOKEN = {"token": "dummy_static_token"}
 CREDENTIALS_WITH_PATH = {"path": "/some/path/credentials.json"}
 CREDENTIALS_WITH_STRING = {"credentials_string": '{"clientID": "x"}'}
+JWT_SECRET = "test-secret-key-that-is-long-enough-for-hs256"
+
+
+def make_jwt(issued_at, expires_at, sub="client"):
+    return jwt.encode({"iat": issued_at, "exp": expires_at, "sub": sub}, JWT_SECRET, algorithm="HS256")
 
 
 class TestVaultClient(unittest.TestCase):
     def setUp(self):
+        set_token_cache_backend(InMemoryTokenCacheBackend())
         self.vault_client = VaultClient(CONFIG)
 
     # ------------------------------------------------------------------ #
@@ -42,6 +54,10 @@ class TestVaultClient(unittest.TestCase):
     def test_get_vault_id(self):
         self.assertEqual(self.vault_client.get_vault_id(), CONFIG["vault_id"])
 
+    def test_get_timeout(self):
+        self.assertEqual(self.vault_client.get_timeout(), CONFIG.get("timeout", 60.0))
+        self.assertEqual(VaultClient({**CONFIG, "timeout": 5}).get_timeout(), 5)
+
     def test_get_config(self):
         self.assertEqual(self.vault_client.get_config(), CONFIG)
 
@@ -195,6 +211,37 @@ class TestVaultClient(unittest.TestCase):
         # httpx client was NOT recreated
         mock_init_api_client.assert_not_called()
 
+    # ------------------------------------------------------------------ #
+    # initialize_client_configuration_async                               #
+    # ------------------------------------------------------------------ #
+
+    @patch("skyflow.vault.client.client.asyncio.to_thread")
+    @patch("skyflow.vault.client.client.is_expired", return_value=False)
+    def test_initialize_client_configuration_async_reuses_valid_token_in_place(self, mock_is_expired, mock_to_thread):
+        self.vault_client._VaultClient__api_client = MagicMock()
+        self.vault_client._VaultClient__is_static_token = False
+        self.vault_client._VaultClient__bearer_token = "cached_sa_token"
+        self.vault_client._VaultClient__credentials = CREDENTIALS_WITH_PATH
+
+        asyncio.run(self.vault_client.initialize_client_configuration_async())
+
+        mock_to_thread.assert_not_called()
+
+    @patch("skyflow.vault.client.client.generate_bearer_token", return_value=("new_sa_token", None))
+    @patch("skyflow.vault.client.client.is_expired", return_value=True)
+    def test_initialize_client_configuration_async_mints_token_off_the_loop(self, mock_is_expired, mock_generate_bearer_token):
+        self.vault_client._VaultClient__api_client = MagicMock()
+        self.vault_client._VaultClient__is_static_token = False
+        self.vault_client._VaultClient__bearer_token = "expired_sa_token"
+        self.vault_client._VaultClient__credentials = CREDENTIALS_WITH_PATH
+        threads = []
+        mock_generate_bearer_token.side_effect = lambda *args: threads.append(threading.current_thread()) or ("new_sa_token", None)
+
+        asyncio.run(self.vault_client.initialize_client_configuration_async())
+
+        self.assertEqual(self.vault_client._VaultClient__bearer_token, "new_sa_token")
+        self.assertIsNot(threads[0], threading.main_thread())
+
     # ------------------------------------------------------------------ #
     # initialize_client_configuration — config update forces reinit        #
     # ------------------------------------------------------------------ #
@@ -224,6 +271,20 @@ class TestVaultClient(unittest.TestCase):
     # initialize_api_client — lambda token provider                       #
     # ------------------------------------------------------------------ #
 
+    def test_api_clients_send_metrics_header_set_once(self):
+        """The sky-metadata header is set on the generated clients when they are built, so
+        requests need no per-call headers."""
+        self.vault_client._VaultClient__vault_url = "https://test-vault-url.com"
+        self.vault_client.initialize_api_client("https://test-vault-url.com", "initial_token")
+
+        async def get_async_headers():
+            return self.vault_client.get_async_api_client()._client_wrapper.get_headers()
+
+        for headers in (self.vault_client._VaultClient__api_client._client_wrapper.get_headers(),
+                        asyncio.run(get_async_headers())):
+            self.assertEqual(headers["sky-metadata"], get_metrics_headers()["sky-metadata"])
+            self.assertEqual(headers["Authorization"], "Bearer initial_token")
+
     @patch("skyflow.vault.client.client.Skyflow")
     def test_initialize_api_client_passes_callable_token(self, mock_skyflow):
         """initialize_api_client must pass a callable (lambda) as token, not a string."""
@@ -251,6 +312,96 @@ class TestVaultClient(unittest.TestCase):
         _, kwargs = mock_skyflow.call_args
         self.assertEqual(kwargs["token"](), "initial_token")
 
+    @patch("skyflow.vault.client.client.AsyncSkyflow")
+    @patch("skyflow.vault.client.client.Skyflow")
+    def test_async_api_client_is_lazy_and_shared(self, mock_skyflow, mock_async_skyflow):
+        """The async client is created on first use, reuses the token provider and is shared afterwards."""
+        self.vault_client._VaultClient__vault_url = "https://test-vault-url.com"
+        self.vault_client.initialize_api_client("https://test-vault-url.com", "initial_token")
+        mock_async_skyflow.assert_not_called()
+
+        records_api = self.vault_client.get_async_records_api()
+        self.vault_client.get_async_tokens_api()
+        self.vault_client.get_async_query_api()
+        self.assertIs(self.vault_client.get_async_detect_text_api(), mock_async_skyflow.return_value.strings)
+        self.assertIs(self.vault_client.get_async_detect_file_api(), mock_async_skyflow.return_value.files)
+
+        mock_async_skyflow.assert_called_once()
+        _, kwargs = mock_async_skyflow.call_args
+        self.assertEqual(kwargs["base_url"], "https://test-vault-url.com")
+        self.assertIs(kwargs["token"], mock_skyflow.call_args[1]["token"])
+        self.assertIs(records_api, mock_async_skyflow.return_value.records)
+
+    @patch("skyflow.vault.client.client.AsyncSkyflow")
+    @patch("skyflow.vault.client.client.Skyflow")
+    def test_async_clients_are_kept_per_event_loop(self, mock_skyflow, mock_async_skyflow):
+        """Each asyncio.run gets its own httpx.AsyncClient and AsyncSkyflow, since an
+        httpx.AsyncClient can't be used once the loop it was first used on is closed."""
+        mock_async_skyflow.side_effect = lambda **kwargs: MagicMock()
+        self.vault_client.initialize_api_client("https://test-vault-url.com", "initial_token")
+
+        async def get_clients():
+            clients = (self.vault_client.get_async_http_client(), self.vault_client.get_async_api_client())
+            self.assertIs(self.vault_client.get_async_http_client(), clients[0])
+            self.assertIs(self.vault_client.get_async_api_client(), clients[1])
+            return clients
+
+        first_http_client, first_api_client = asyncio.run(get_clients())
+        second_http_client, second_api_client = asyncio.run(get_clients())
+
+        self.assertIsNot(second_http_client, first_http_client)
+        self.assertIsNot(second_api_client, first_api_client)
+        self.assertEqual(len(self.vault_client._VaultClient__async_http_clients), 1)
+        self.assertEqual(len(self.vault_client._VaultClient__async_api_clients), 1)
+
+    @patch("skyflow.vault.client.client.Skyflow")
+    def test_http_client_survives_reinitialization(self, mock_skyflow):
+        """The pooled httpx.Client is built once from the config and reused across re-initializations."""
+        vault_client = VaultClient({**CONFIG, "max_connections": 10, "max_keepalive_connections": 5,
+                                    "keepalive_expiry": 30, "timeout": 5})
+        vault_client.initialize_api_client("https://test-vault-url.com", "initial_token")
+        vault_client.initialize_api_client("https://test-vault-url.com", "rotated_token")
+
+        first_client = mock_skyflow.call_args_list[0][1]["httpx_client"]
+        self.assertIs(mock_skyflow.call_args_list[1][1]["httpx_client"], first_client)
+        pool = first_client._transport._pool
+        self.assertEqual(pool._max_connections, 10)
+        self.assertEqual(pool._max_keepalive_connections, 5)
+        self.assertEqual(pool._keepalive_expiry, 30)
+        self.assertEqual(first_client.timeout.read, 5)
+
+    @patch("skyflow.vault.client.client.threading.Timer")
+    def test_update_config_with_pool_options_rebuilds_http_client(self, mock_timer):
+        """Changing a pool option swaps in a new httpx.Client and closes the old one once the
+        old timeout has passed; other updates keep it."""
+        vault_client = VaultClient({**CONFIG, "timeout": 5})
+        first_client = vault_client.get_http_client()
+        vault_client.update_config({"env": "test_env"})
+        self.assertIs(vault_client.get_http_client(), first_client)
+
+        vault_client.update_config({"max_connections": 5})
+        self.assertFalse(first_client.is_closed)
+        self.assertIsNot(vault_client.get_http_client(), first_client)
+        mock_timer.assert_called_once_with(5, first_client.close)
+        mock_timer.return_value.start.assert_called_once()
+
+    def test_update_config_closes_old_async_client_from_the_event_loop(self):
+        vault_client = VaultClient({**CONFIG, "timeout": 0})
+        vault_client._VaultClient__api_client = MagicMock()
+        vault_client._VaultClient__is_static_token = True
+
+        async def run():
+            first_client = vault_client.get_async_http_client()
+            vault_client.update_config({"max_connections": 5})
+            self.assertFalse(first_client.is_closed)
+            vault_client._VaultClient__is_config_updated = False
+            await vault_client.initialize_client_configuration_async()
+            await asyncio.sleep(0.01)
+            self.assertTrue(first_client.is_closed)
+            self.assertIsNot(vault_client.get_async_http_client(), first_client)
+
+        asyncio.run(run())
+
     # ------------------------------------------------------------------ #
     # get_bearer_token                                                     #
     # ------------------------------------------------------------------ #
@@ -297,6 +448,140 @@ class TestVaultClient(unittest.TestCase):
         mock_generate.assert_not_called()
         self.assertEqual(result, "valid_token")
 
+    # ------------------------------------------------------------------ #
+    # proactive bearer token refresh                                       #
+    # ------------------------------------------------------------------ #
+
+    def test_token_is_refreshed_in_background_after_80_percent_of_lifetime(self):
+        now = time.time()
+        aging_token = make_jwt(now - 850, now + 150)
+        fresh_token = make_jwt(now, now + 1000, sub="fresh")
+        release = threading.Event()
+        calls = []
+
+        def slow_generate(*args):
+            calls.append(args)
+            release.wait(5)
+            return fresh_token, None
+
+        with patch("skyflow.vault.client.client.generate_bearer_token", side_effect=[(aging_token, None)]):
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+
+        with patch("skyflow.vault.client.client.generate_bearer_token", side_effect=slow_generate):
+            # Concurrent callers get the still-valid token immediately and start a single refresh.
+            results = [self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH) for _ in range(5)]
+            self.assertEqual(results, [aging_token] * 5)
+            release.set()
+            for _ in range(100):
+                if self.vault_client._VaultClient__bearer_token == fresh_token:
+                    break
+                time.sleep(0.01)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH), fresh_token)
+
+    def test_token_is_not_refreshed_before_80_percent_of_lifetime(self):
+        now = time.time()
+        token = make_jwt(now - 100, now + 900)
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=(token, None)) as mock_generate:
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+        mock_generate.assert_called_once()
+        self.assertFalse(self.vault_client._VaultClient__is_token_refreshing)
+
+    def test_minted_token_expiry_is_checked_without_decoding(self):
+        now = time.time()
+        token = make_jwt(now - 10, now + 990)
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=(token, None)):
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+
+        with patch("skyflow.vault.client.client.is_expired") as mock_is_expired, \
+                patch("skyflow.vault.client.client.jwt.decode") as mock_decode:
+            self.assertEqual(self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH), token)
+            with patch("skyflow.vault.client.client.time.monotonic", return_value=time.monotonic() + 1000):
+                self.assertTrue(self.vault_client._VaultClient__is_bearer_token_expired())
+        mock_is_expired.assert_not_called()
+        mock_decode.assert_not_called()
+
+    def test_failed_background_refresh_keeps_current_token_and_backs_off(self):
+        now = time.time()
+        aging_token = make_jwt(now - 900, now + 100)
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=(aging_token, None)):
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+
+        with patch("skyflow.vault.client.client.generate_bearer_token", side_effect=Exception("auth down")):
+            self.vault_client._VaultClient__refresh_bearer_token(CREDENTIALS_WITH_PATH, 0)
+
+        self.assertEqual(self.vault_client._VaultClient__bearer_token, aging_token)
+        self.assertFalse(self.vault_client._VaultClient__is_token_refreshing)
+        self.assertGreater(self.vault_client._VaultClient__token_refresh_at, time.monotonic() + 40)
+
+    def test_background_refresh_result_is_dropped_after_config_update(self):
+        now = time.time()
+        aging_token = make_jwt(now - 900, now + 100)
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=(aging_token, None)):
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+        config_version = self.vault_client._VaultClient__config_version
+        self.vault_client._VaultClient__config_version += 1
+
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=("stale", None)):
+            self.vault_client._VaultClient__refresh_bearer_token(CREDENTIALS_WITH_PATH, config_version)
+
+        self.assertEqual(self.vault_client._VaultClient__bearer_token, aging_token)
+
+    def test_expired_token_is_generated_once_for_concurrent_callers(self):
+        now = time.time()
+        token = make_jwt(now, now + 1000)
+        barrier = threading.Barrier(8)
+
+        def slow_generate(*args):
+            time.sleep(0.05)
+            return token, None
+
+        def call():
+            barrier.wait()
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+
+        with patch("skyflow.vault.client.client.generate_bearer_token", side_effect=slow_generate) as mock_generate:
+            threads = [threading.Thread(target=call) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_generate.assert_called_once()
+        self.assertEqual(self.vault_client._VaultClient__bearer_token, token)
+
+    def test_token_is_shared_between_clients_with_same_credentials(self):
+        now = time.time()
+        token = make_jwt(now, now + 1000)
+        other_client = VaultClient({**CONFIG, "vault_id": "other_vault_id"})
+        with patch("skyflow.vault.client.client.generate_bearer_token", return_value=(token, None)) as mock_generate:
+            self.assertEqual(self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH), token)
+            self.assertEqual(other_client.get_bearer_token(CREDENTIALS_WITH_PATH), token)
+        mock_generate.assert_called_once()
+
+    def test_token_is_not_shared_between_clients_with_different_roles(self):
+        now = time.time()
+        other_client = VaultClient({**CONFIG, "roles": ["role_id_3"]})
+        with patch("skyflow.vault.client.client.generate_bearer_token",
+                   side_effect=[(make_jwt(now, now + 1000, sub="a"), None),
+                                (make_jwt(now, now + 1000, sub="b"), None)]) as mock_generate:
+            first = self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+            second = other_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertNotEqual(first, second)
+
+    def test_token_cache_can_be_disabled(self):
+        set_token_cache_backend(None)
+        now = time.time()
+        other_client = VaultClient(CONFIG)
+        with patch("skyflow.vault.client.client.generate_bearer_token",
+                   return_value=(make_jwt(now, now + 1000), None)) as mock_generate:
+            self.vault_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+            other_client.get_bearer_token(CREDENTIALS_WITH_PATH)
+        self.assertEqual(mock_generate.call_count, 2)
+
     # ------------------------------------------------------------------ #
     # update_config                                                        #
     # ------------------------------------------------------------------ #
@@ -0,0 +1,107 @@
+import json
+import unittest
+from unittest.mock import Mock, AsyncMock, patch
+import httpx
+from skyflow.error import SkyflowError
+from skyflow.utils import SkyflowMessages
+from skyflow.utils.enums import RequestMethod
+from skyflow.vault.connection import InvokeConnectionRequest
+from skyflow.vault.controller import Connection, AsyncConnection
+
+VALID_BEARER_TOKEN = "test_bearer_token"
+CONNECTION_CONFIG = {
+    "credentials": {"api_key": "test_api_key"},
+    "connection_url": "https://connection.example.com/v1"
+}
+
+
+class TestAsyncConnection(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.vault_client = Mock()
+        self.vault_client.get_config.return_value = CONNECTION_CONFIG
+        self.vault_client.get_bearer_token.return_value = VALID_BEARER_TOKEN
+        self.vault_client.get_logger.return_value = Mock()
+        self.vault_client.get_common_skyflow_credentials.return_value = None
+        self.sent_requests = []
+        self.responses = []
+        self.vault_client.get_async_http_client.return_value = httpx.AsyncClient(
+            transport=httpx.MockTransport(self.handle_request))
+        self.connection = Connection(self.vault_client)
+
+    def handle_request(self, request):
+        self.sent_requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def test_aio_is_cached_on_connection(self):
+        self.assertIsInstance(self.connection.aio, AsyncConnection)
+        self.assertIs(self.connection.aio, self.connection.aio)
+
+    @patch("skyflow.vault.controller._connections.get_credentials")
+    async def test_invoke_success(self, mock_get_credentials):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        self.responses.append(httpx.Response(200, json={"response": "success"}, headers={"x-request-id": "rid"}))
+        request = InvokeConnectionRequest(method=RequestMethod.POST, body={"card": "4111"},
+                                          headers={"Content-Type": "application/json"}, query_params={"q": "1"})
+
+        response = await self.connection.aio.invoke(request)
+
+        self.assertEqual(response.data, {"response": "success"})
+        self.assertEqual(response.metadata, {"request_id": "rid"})
+        sent = self.sent_requests[0]
+        self.assertEqual(sent.method, "POST")
+        self.assertEqual(str(sent.url), "https://connection.example.com/v1?q=1")
+        self.assertEqual(sent.headers["x-skyflow-authorization"], VALID_BEARER_TOKEN)
+        self.assertIn("sky-metadata", sent.headers)
+        self.assertEqual(json.loads(sent.content), {"card": "4111"})
+
+    @patch("skyflow.vault.controller._connections.get_credentials")
+    async def test_invoke_error_response_raises_skyflow_error(self, mock_get_credentials):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        self.responses.append(httpx.Response(400, json={"error": {"message": "Invalid Request"}},
+                                             headers={"x-request-id": "rid"}))
+
+        with self.assertRaises(SkyflowError) as context:
+            await self.connection.aio.invoke(InvokeConnectionRequest(method=RequestMethod.GET))
+
+        self.assertEqual(context.exception.message, "Invalid Request")
+        self.assertEqual(context.exception.request_id, "rid")
+
+    @patch("skyflow.vault.controller._async_connection.asyncio.sleep", new_callable=AsyncMock)
+    @patch("skyflow.vault.controller._connections.get_credentials")
+    async def test_invoke_retries_connect_errors(self, mock_get_credentials, mock_sleep):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        self.vault_client.get_config.return_value = {**CONNECTION_CONFIG, "max_retries": 2}
+        self.responses.extend([httpx.ConnectError("refused"), httpx.ConnectTimeout("timed out"), httpx.Response(200, json={})])
+
+        await self.connection.aio.invoke(InvokeConnectionRequest(method=RequestMethod.POST, body={"a": "b"}))
+
+        self.assertEqual(len(self.sent_requests), 3)
+        self.assertEqual(mock_sleep.await_count, 2)
+
+    @patch("skyflow.vault.controller._async_connection.asyncio.sleep", new_callable=AsyncMock)
+    @patch("skyflow.vault.controller._connections.get_credentials")
+    async def test_invoke_retries_gateway_errors_only_for_idempotent_methods(self, mock_get_credentials, mock_sleep):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        self.vault_client.get_config.return_value = {**CONNECTION_CONFIG, "max_retries": 1}
+        self.responses.extend([httpx.Response(503), httpx.Response(200, json={})])
+        await self.connection.aio.invoke(InvokeConnectionRequest(method=RequestMethod.GET))
+        self.assertEqual(len(self.sent_requests), 2)
+
+        self.responses.append(httpx.Response(503))
+        with self.assertRaises(SkyflowError):
+            await self.connection.aio.invoke(InvokeConnectionRequest(method=RequestMethod.POST, body={"a": "b"}))
+        self.assertEqual(len(self.sent_requests), 3)
+
+    @patch("skyflow.vault.controller._connections.get_credentials")
+    async def test_invoke_connect_error_without_retries_raises(self, mock_get_credentials):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        self.responses.append(httpx.ConnectError("refused"))
+
+        with self.assertRaises(SkyflowError) as context:
+            await self.connection.aio.invoke(InvokeConnectionRequest(method=RequestMethod.GET))
+
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVOKE_CONNECTION_FAILED.value)
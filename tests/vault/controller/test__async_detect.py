@@ -0,0 +1,228 @@
+import asyncio
+import io
+import threading
+import unittest
+from unittest.mock import Mock, AsyncMock, patch
+from skyflow.error import SkyflowError
+from skyflow.utils.constants import DetectStatus
+from skyflow.vault.controller import Detect, AsyncDetect
+from skyflow.vault.detect import DeidentifyTextRequest, ReidentifyTextRequest, DeidentifyFileRequest, \
+    DeidentifyFileResponse, GetDetectRunRequest, FileInput, DetectRun
+
+VAULT_ID = "test_vault_id"
+
+
+def make_file_request(name="test.txt", content=b"test content", wait_time=None):
+    file_obj = io.BytesIO(content)
+    file_obj.name = name
+    req = DeidentifyFileRequest(file=FileInput(file=file_obj))
+    req.wait_time = wait_time
+    return req
+
+
+async def read_inline(func, *args):
+    # Reads files on the event loop, so that submissions complete in a fixed order.
+    return func(*args)
+
+
+def make_run(status):
+    return Mock(data=Mock(status=status, run_id=None, output=[], word_character_count=None, size=None,
+                          duration=None, pages=None, slides=None))
+
+
+class TestAsyncDetect(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.vault_client = Mock()
+        self.vault_client.initialize_client_configuration_async = AsyncMock()
+        self.vault_client.get_vault_id.return_value = VAULT_ID
+        self.vault_client.get_logger.return_value = Mock()
+        self.strings_api = self.vault_client.get_async_detect_text_api.return_value
+        self.files_api = self.vault_client.get_async_detect_file_api.return_value.with_raw_response
+        self.detect = Detect(self.vault_client)
+        self.async_detect = self.detect.aio
+
+    def test_aio_is_cached_on_detect(self):
+        self.assertIsInstance(self.async_detect, AsyncDetect)
+        self.assertIs(self.detect.aio, self.async_detect)
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_text_request")
+    @patch("skyflow.vault.controller._async_detect.parse_deidentify_text_response")
+    async def test_deidentify_text(self, mock_parse_response, mock_validate):
+        request = DeidentifyTextRequest(text="My name is John")
+        self.strings_api.deidentify_string = AsyncMock(return_value=Mock())
+
+        result = await self.async_detect.deidentify_text(request)
+
+        self.vault_client.initialize_client_configuration_async.assert_awaited_once()
+        _, kwargs = self.strings_api.deidentify_string.call_args
+        self.assertEqual(kwargs["vault_id"], VAULT_ID)
+        self.assertEqual(kwargs["text"], "My name is John")
+        self.assertIs(result, mock_parse_response.return_value)
+
+    @patch("skyflow.vault.controller._async_detect.validate_reidentify_text_request")
+    @patch("skyflow.vault.controller._async_detect.parse_reidentify_text_response")
+    async def test_reidentify_text(self, mock_parse_response, mock_validate):
+        request = ReidentifyTextRequest(text="[NAME_1]")
+        self.strings_api.reidentify_string = AsyncMock(return_value=Mock())
+
+        result = await self.async_detect.reidentify_text(request)
+
+        _, kwargs = self.strings_api.reidentify_string.call_args
+        self.assertEqual(kwargs["text"], "[NAME_1]")
+        self.assertIs(result, mock_parse_response.return_value)
+
+    @patch("skyflow.vault.controller._async_detect.validate_reidentify_text_request")
+    async def test_reidentify_text_handles_api_error(self, mock_validate):
+        self.strings_api.reidentify_string = AsyncMock(side_effect=Exception("boom"))
+
+        with self.assertRaises(SkyflowError):
+            await self.async_detect.reidentify_text(ReidentifyTextRequest(text="[NAME_1]"))
+
+    @patch("skyflow.vault.controller._async_detect.asyncio.sleep", new_callable=AsyncMock)
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_file_polls_until_success(self, mock_validate, mock_sleep):
+        self.files_api.deidentify_text = AsyncMock(return_value=Mock(data=Mock(run_id="run1")))
+        in_progress = Mock(data=Mock(status=DetectStatus.IN_PROGRESS))
+        success = make_run(DetectStatus.SUCCESS)
+        self.files_api.get_run = AsyncMock(side_effect=[in_progress, in_progress, success])
+
+        result = await self.async_detect.deidentify_file(make_file_request())
+
+        _, kwargs = self.files_api.deidentify_text.call_args
+        self.assertEqual(kwargs["file"].base_64, "dGVzdCBjb250ZW50")
+        self.assertEqual(self.files_api.get_run.await_count, 3)
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [2, 4])
+        self.assertIsInstance(result, DeidentifyFileResponse)
+        self.assertEqual(result.run_id, "run1")
+
+    @patch("skyflow.vault.controller._async_detect.asyncio.sleep", new_callable=AsyncMock)
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_file_returns_in_progress_after_wait_time(self, mock_validate, mock_sleep):
+        self.files_api.deidentify_pdf = AsyncMock(return_value=Mock(data=Mock(run_id="run2")))
+        self.files_api.get_run = AsyncMock(return_value=Mock(data=Mock(status=DetectStatus.IN_PROGRESS)))
+
+        result = await self.async_detect.deidentify_file(make_file_request(name="doc.pdf", wait_time=3))
+
+        self.assertEqual([c.args[0] for c in mock_sleep.await_args_list], [2, 1])
+        self.assertEqual(result.status, DetectStatus.IN_PROGRESS)
+        self.assertEqual(result.run_id, "run2")
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_file_runs_concurrently(self, mock_validate):
+        started = []
+
+        async def deidentify_text(**kwargs):
+            started.append(kwargs["file"].base_64)
+            run_id = f"run{len(started)}"
+            await asyncio.sleep(0)
+            return Mock(data=Mock(run_id=run_id))
+
+        self.files_api.deidentify_text = deidentify_text
+        self.files_api.get_run = AsyncMock(return_value=make_run(DetectStatus.SUCCESS))
+
+        results = await asyncio.gather(*(self.async_detect.deidentify_file(make_file_request()) for _ in range(3)))
+
+        self.assertEqual(len(started), 3)
+        self.assertEqual(sorted(r.run_id for r in results), ["run1", "run2", "run3"])
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_file_reads_file_off_the_event_loop(self, mock_validate):
+        read_threads = []
+        read_file = self.detect._read_file
+
+        def record_read_thread(request):
+            read_threads.append(threading.get_ident())
+            return read_file(request)
+
+        self.detect._read_file = record_read_thread
+        self.files_api.deidentify_text = AsyncMock(return_value=Mock(data=Mock(run_id="run1")))
+        self.files_api.get_run = AsyncMock(return_value=make_run(DetectStatus.SUCCESS))
+
+        await self.async_detect.deidentify_file(make_file_request())
+        await self.async_detect.submit_deidentify_file(make_file_request())
+
+        self.assertEqual(len(read_threads), 2)
+        self.assertNotIn(threading.get_ident(), read_threads)
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_file_handles_api_error(self, mock_validate):
+        self.files_api.deidentify_text = AsyncMock(side_effect=Exception("boom"))
+
+        with self.assertRaises(SkyflowError):
+            await self.async_detect.deidentify_file(make_file_request())
+
+    @patch("skyflow.vault.controller._async_detect.validate_get_detect_run_request")
+    async def test_get_detect_run_in_progress(self, mock_validate):
+        self.files_api.get_run = AsyncMock(return_value=Mock(data=Mock(status=DetectStatus.IN_PROGRESS)))
+
+        result = await self.async_detect.get_detect_run(GetDetectRunRequest(run_id="run3"))
+
+        self.assertEqual(self.files_api.get_run.call_args.args[0], "run3")
+        self.assertEqual(result.status, DetectStatus.IN_PROGRESS)
+        self.assertEqual(result.run_id, "run3")
+
+    @patch("skyflow.vault.controller._async_detect.asyncio.to_thread", new=read_inline)
+    @patch("skyflow.vault.controller._detect_run_scheduler.time.monotonic")
+    @patch("skyflow.vault.controller._async_detect.asyncio.sleep", new_callable=AsyncMock)
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_files_polls_runs_together(self, mock_validate, mock_sleep, mock_monotonic):
+        clock = [100]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        run_ids = iter(["run1", "run2"])
+        self.files_api.deidentify_text = AsyncMock(side_effect=lambda **kwargs: Mock(data=Mock(run_id=next(run_ids))))
+        in_progress = Mock(data=Mock(status=DetectStatus.IN_PROGRESS))
+        polls = {"run1": [in_progress, make_run(DetectStatus.SUCCESS)], "run2": [make_run(DetectStatus.SUCCESS)]}
+        self.files_api.get_run = AsyncMock(side_effect=lambda run_id, **kwargs: polls[run_id].pop(0))
+
+        results = [r async for r in self.async_detect.deidentify_files([make_file_request(), make_file_request()])]
+
+        self.assertEqual([(r.run_id, r.status, r.request_index) for r in results],
+                         [("run2", DetectStatus.SUCCESS, 1), ("run1", DetectStatus.SUCCESS, 0)])
+        self.assertEqual(sorted(c.args[0] for c in self.files_api.get_run.call_args_list), ["run1", "run1", "run2"])
+        mock_sleep.assert_awaited_once_with(1)
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_files_yields_failed_response_for_failed_submission(self, mock_validate):
+        self.files_api.deidentify_text = AsyncMock(side_effect=Exception("boom"))
+
+        results = [r async for r in self.async_detect.deidentify_files([make_file_request()])]
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual((results[0].status, results[0].request_index), (DetectStatus.FAILED, 0))
+        self.assertEqual(results[0].errors[0]["request_index"], 0)
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_deidentify_files_returns_in_progress_after_wait_time(self, mock_validate):
+        self.files_api.deidentify_pdf = AsyncMock(return_value=Mock(data=Mock(run_id="run1")))
+        self.files_api.get_run = AsyncMock(return_value=Mock(data=Mock(status=DetectStatus.IN_PROGRESS)))
+
+        results = [r async for r in self.async_detect.deidentify_files([make_file_request(name="doc.pdf", wait_time=0)])]
+
+        self.assertEqual([(r.run_id, r.status) for r in results], [("run1", DetectStatus.IN_PROGRESS)])
+
+    async def test_deidentify_files_invalid_max_in_flight(self):
+        with self.assertRaises(SkyflowError):
+            self.async_detect.deidentify_files([make_file_request()], max_in_flight=0)
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_submit_deidentify_file_returns_awaitable_run_handle(self, mock_validate):
+        self.files_api.deidentify_text = AsyncMock(return_value=Mock(data=Mock(run_id="run1")))
+        sync_files_api = self.vault_client.get_detect_file_api.return_value.with_raw_response
+        sync_files_api.get_run.return_value = make_run(DetectStatus.SUCCESS)
+
+        run = await self.async_detect.submit_deidentify_file(make_file_request())
+        result = await asyncio.wait_for(asyncio.wrap_future(run), 5)
+
+        self.assertIsInstance(run, DetectRun)
+        self.assertEqual(run.run_id, "run1")
+        self.assertEqual((result.run_id, result.status), ("run1", DetectStatus.SUCCESS))
+        self.assertEqual(sync_files_api.get_run.call_args.args[0], "run1")
+
+    @patch("skyflow.vault.controller._async_detect.validate_deidentify_file_request")
+    async def test_submit_deidentify_file_handles_api_error(self, mock_validate):
+        self.files_api.deidentify_text = AsyncMock(side_effect=Exception("boom"))
+
+        with self.assertRaises(SkyflowError):
+            await self.async_detect.submit_deidentify_file(make_file_request())
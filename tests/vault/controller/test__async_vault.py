@@ -0,0 +1,366 @@
+import asyncio
+import unittest
+import httpx
+from unittest.mock import Mock, AsyncMock, patch
+from skyflow.error import SkyflowError
+from skyflow.generated.rest import V1FieldRecords, V1DetokenizeRecordRequest, V1TokenizeRecordRequest
+from skyflow.utils._skyflow_messages import SkyflowMessages
+from skyflow.utils.enums import RedactionType
+from skyflow.vault.controller import Vault, AsyncVault
+from skyflow.vault.data import InsertRequest, BulkInsertRequest, BulkDeleteRequest, BulkGetRequest, InsertResponse, UpdateRequest, UpdateManyRequest, UpdateResponse, DeleteRequest, \
+    DeleteResponse, GetRequest, GetResponse, QueryRequest, QueryResponse, FileUploadRequest, FileUploadBatch
+from skyflow.vault.tokens import DetokenizeRequest, DetokenizeResponse, TokenizeRequest, TokenizeResponse
+
+VAULT_ID = "test_vault_id"
+TABLE_NAME = "test_table"
+
+
+class TestAsyncVault(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.vault_client = Mock()
+        self.vault_client.initialize_client_configuration_async = AsyncMock()
+        self.vault_client.get_vault_id.return_value = VAULT_ID
+        self.vault_client.get_logger.return_value = Mock()
+        self.vault_client.get_timeout.return_value = 60.0
+        self.records_api = self.vault_client.get_async_records_api.return_value
+        self.tokens_api = self.vault_client.get_async_tokens_api.return_value
+        self.query_api = self.vault_client.get_async_query_api.return_value
+        self.vault = AsyncVault(self.vault_client)
+
+    def test_aio_is_cached_on_vault(self):
+        vault = Vault(self.vault_client)
+        self.assertIsInstance(vault.aio, AsyncVault)
+        self.assertIs(vault.aio, vault.aio)
+
+    @patch("skyflow.vault.controller._async_vault.validate_insert_request")
+    @patch("skyflow.vault.controller._async_vault.parse_insert_response")
+    async def test_insert_bulk(self, mock_parse_response, mock_validate):
+        request = InsertRequest(table=TABLE_NAME, values=[{"field": "value"}])
+        expected_response = InsertResponse(inserted_fields=[{"skyflow_id": "id1"}])
+        mock_parse_response.return_value = expected_response
+        mock_api_response = Mock()
+        self.records_api.with_raw_response.record_service_insert_record = AsyncMock(return_value=mock_api_response)
+
+        result = await self.vault.insert(request)
+
+        mock_validate.assert_called_once_with(self.vault_client.get_logger(), request)
+        self.vault_client.initialize_client_configuration_async.assert_awaited_once()
+        _, kwargs = self.records_api.with_raw_response.record_service_insert_record.call_args
+        self.assertEqual(kwargs["records"], [V1FieldRecords(fields={"field": "value"})])
+        mock_parse_response.assert_called_once_with(mock_api_response, False)
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.validate_insert_request")
+    @patch("skyflow.vault.controller._async_vault.parse_insert_response")
+    async def test_insert_with_continue_on_error(self, mock_parse_response, mock_validate):
+        request = InsertRequest(table=TABLE_NAME, values=[{"field": "value"}], continue_on_error=True)
+        self.records_api.with_raw_response.record_service_batch_operation = AsyncMock(return_value=Mock())
+
+        await self.vault.insert(request)
+
+        _, kwargs = self.records_api.with_raw_response.record_service_batch_operation.call_args
+        self.assertEqual(kwargs["records"][0].table_name, TABLE_NAME)
+        self.assertEqual(kwargs["records"][0].method, "POST")
+        self.assertTrue(kwargs["continue_on_error"])
+
+    @patch("skyflow.vault.controller._async_vault.validate_insert_request")
+    async def test_insert_handles_api_error(self, mock_validate):
+        request = InsertRequest(table=TABLE_NAME, values=[{"field": "value"}])
+        self.records_api.with_raw_response.record_service_insert_record = AsyncMock(side_effect=Exception("boom"))
+
+        with self.assertRaises(SkyflowError):
+            await self.vault.insert(request)
+
+    async def test_insert_many_runs_chunks_concurrently_and_keeps_request_index(self):
+        in_flight = []
+        peak = []
+
+        async def insert_record(*args, **kwargs):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.pop()
+            records = [Mock(skyflow_id=f"id_{record.fields['field']}", tokens=None) for record in kwargs["records"]]
+            if kwargs["records"][0].fields["field"] == 4:
+                raise Exception("chunk failed")
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(records=records))
+
+        self.records_api.with_raw_response.record_service_insert_record = insert_record
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(6)],
+                                    chunk_size=2, max_in_flight=2)
+
+        result = await self.vault.insert_many(request)
+
+        self.assertEqual(max(peak), 2)
+        self.assertEqual([(f["skyflow_id"], f["request_index"]) for f in result.inserted_fields],
+                         [("id_0", 0), ("id_1", 1), ("id_2", 2), ("id_3", 3)])
+        self.assertEqual([e["request_index"] for e in result.errors], [4, 5])
+
+    async def test_insert_stream_from_async_iterable(self):
+        async def values():
+            for index in range(5):
+                yield {"field": index}
+
+        async def insert_record(*args, **kwargs):
+            records = [Mock(skyflow_id=f"id_{record.fields['field']}", tokens=None) for record in kwargs["records"]]
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(records=records))
+
+        self.records_api.with_raw_response.record_service_insert_record = insert_record
+        request = BulkInsertRequest(table=TABLE_NAME, values=values(), chunk_size=2, max_in_flight=2)
+
+        results = [result async for result in self.vault.insert_stream(request)]
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(sorted((f["skyflow_id"], f["request_index"]) for result in results for f in result.inserted_fields),
+                         [(f"id_{index}", index) for index in range(5)])
+
+    def test_insert_stream_validates_before_iteration(self):
+        with self.assertRaises(SkyflowError):
+            self.vault.insert_stream(BulkInsertRequest(table=TABLE_NAME, values=42))
+
+    @patch("skyflow.vault.controller._async_vault.validate_update_request")
+    @patch("skyflow.vault.controller._async_vault.parse_update_record_response")
+    async def test_update(self, mock_parse_response, mock_validate):
+        request = UpdateRequest(table=TABLE_NAME, data={"skyflow_id": "id1", "field": "new"})
+        expected_response = UpdateResponse(updated_field={"skyflow_id": "id1"})
+        mock_parse_response.return_value = expected_response
+        self.records_api.record_service_update_record = AsyncMock(return_value=Mock())
+
+        result = await self.vault.update(request)
+
+        _, kwargs = self.records_api.record_service_update_record.call_args
+        self.assertEqual(kwargs["id"], "id1")
+        self.assertEqual(kwargs["record"], V1FieldRecords(fields={"field": "new"}))
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.validate_delete_request")
+    @patch("skyflow.vault.controller._async_vault.parse_delete_response")
+    async def test_delete(self, mock_parse_response, mock_validate):
+        request = DeleteRequest(table=TABLE_NAME, ids=["id1", "id2"])
+        expected_response = DeleteResponse(deleted_ids=["id1", "id2"])
+        mock_parse_response.return_value = expected_response
+        self.records_api.record_service_bulk_delete_record = AsyncMock(return_value=Mock())
+
+        result = await self.vault.delete(request)
+
+        self.records_api.record_service_bulk_delete_record.assert_awaited_once()
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.validate_get_request")
+    @patch("skyflow.vault.controller._async_vault.parse_get_response")
+    async def test_get(self, mock_parse_response, mock_validate):
+        request = GetRequest(table=TABLE_NAME, ids=["id1"], redaction_type=RedactionType.PLAIN_TEXT)
+        expected_response = GetResponse(data=[{"skyflow_id": "id1"}])
+        mock_parse_response.return_value = expected_response
+        self.records_api.record_service_bulk_get_record = AsyncMock(return_value=Mock())
+
+        result = await self.vault.get(request)
+
+        _, kwargs = self.records_api.record_service_bulk_get_record.call_args
+        self.assertEqual(kwargs["skyflow_ids"], ["id1"])
+        self.assertEqual(kwargs["redaction"], RedactionType.PLAIN_TEXT.value)
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.asyncio.sleep", new_callable=AsyncMock)
+    async def test_delete_many_retries_retryable_chunks(self, mock_sleep):
+        calls = []
+
+        async def bulk_delete_record(vault_id, table, skyflow_ids, **kwargs):
+            calls.append(list(skyflow_ids))
+            if len(calls) == 1:
+                raise httpx.ConnectError("refused")
+            return Mock(record_id_response=list(skyflow_ids))
+
+        self.records_api.record_service_bulk_delete_record = bulk_delete_record
+
+        result = await self.vault.delete_many(BulkDeleteRequest(table=TABLE_NAME, ids=["id0", "id1", "id2"], chunk_size=2))
+
+        self.assertEqual(len(calls), 3)
+        mock_sleep.assert_awaited_once_with(0.5)
+        self.assertEqual(sorted(result.deleted_ids), ["id0", "id1", "id2"])
+        self.assertIsNone(result.errors)
+
+    async def test_update_many_sends_batch_chunks(self):
+        async def batch_operation(vault_id, records, **kwargs):
+            await asyncio.sleep(0)
+            responses = [{"Status": 200, "Body": {"records": [{"skyflow_id": record.id}]}} for record in records]
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(responses=responses))
+
+        self.records_api.with_raw_response.record_service_batch_operation = batch_operation
+        data = [{"skyflow_id": f"id{index}", "name": "name"} for index in range(3)]
+
+        result = await self.vault.update_many(UpdateManyRequest(table=TABLE_NAME, data=data, chunk_size=2))
+
+        self.assertEqual([(f["skyflow_id"], f["request_index"]) for f in result.updated_fields],
+                         [("id0", 0), ("id1", 1), ("id2", 2)])
+        self.assertIsNone(result.errors)
+
+    async def test_get_many_splits_ids_into_concurrent_chunks(self):
+        async def bulk_get_record(*args, **kwargs):
+            await asyncio.sleep(0)
+            return Mock(records=[Mock(fields={"skyflow_id": skyflow_id}) for skyflow_id in sorted(kwargs["skyflow_ids"])])
+
+        self.records_api.record_service_bulk_get_record = bulk_get_record
+        ids = [f"id{index}" for index in reversed(range(5))]
+
+        result = await self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=ids, chunk_size=2))
+
+        self.assertEqual([record["skyflow_id"] for record in result.data], ids)
+        self.assertIsNone(result.errors)
+
+    async def test_get_many_reports_failed_chunks_per_id(self):
+        async def bulk_get_record(*args, **kwargs):
+            if "id4" in kwargs["skyflow_ids"]:
+                raise Exception("chunk failed")
+            return Mock(records=[Mock(fields={"skyflow_id": skyflow_id}) for skyflow_id in kwargs["skyflow_ids"]])
+
+        self.records_api.record_service_bulk_get_record = bulk_get_record
+
+        result = await self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=[f"id{index}" for index in range(5)], chunk_size=2))
+
+        self.assertEqual([record["skyflow_id"] for record in result.data], ["id0", "id1", "id2", "id3"])
+        self.assertEqual([(error["skyflow_id"], error["request_index"]) for error in result.errors], [("id4", 4)])
+
+    async def test_iter_records_reads_every_page(self):
+        async def bulk_get_record(*args, **kwargs):
+            offset, limit = int(kwargs["offset"]), int(kwargs["limit"])
+            await asyncio.sleep(0)
+            return Mock(records=[Mock(fields={"skyflow_id": f"id{index}"}) for index in range(offset, min(offset + limit, 30))])
+
+        self.records_api.record_service_bulk_get_record = bulk_get_record
+
+        records = [record async for record in self.vault.iter_records(TABLE_NAME, page_size=10, max_in_flight=2)]
+
+        self.assertEqual([record["skyflow_id"] for record in records], [f"id{index}" for index in range(30)])
+
+    async def test_iter_query_reads_every_page(self):
+        async def execute_query(vault_id, query, **kwargs):
+            limit, offset = (int(value) for value in query.split()[-3::2])
+            await asyncio.sleep(0)
+            return Mock(records=[Mock(fields={"skyflow_id": f"id{index}"}) for index in range(offset, min(offset + limit, 30))])
+
+        self.query_api.query_service_execute_query = execute_query
+
+        rows = [row async for row in self.vault.iter_query("SELECT * FROM test_table", page_size=10, max_in_flight=2)]
+
+        self.assertEqual([row["skyflow_id"] for row in rows], [f"id{index}" for index in range(30)])
+
+    async def test_iter_methods_validate_when_called(self):
+        with self.assertRaises(SkyflowError):
+            self.vault.iter_records(TABLE_NAME, page_size=0)
+        with self.assertRaises(SkyflowError):
+            self.vault.iter_query("SELECT * FROM test_table LIMIT 5 LIMIT 10")
+
+    @patch("skyflow.vault.controller._async_vault.validate_query_request")
+    @patch("skyflow.vault.controller._async_vault.parse_query_response")
+    async def test_query(self, mock_parse_response, mock_validate):
+        request = QueryRequest(query="SELECT * FROM test_table")
+        expected_response = QueryResponse()
+        mock_parse_response.return_value = expected_response
+        self.query_api.query_service_execute_query = AsyncMock(return_value=Mock())
+
+        result = await self.vault.query(request)
+
+        self.query_api.query_service_execute_query.assert_awaited_once()
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.validate_detokenize_request")
+    @patch("skyflow.vault.controller._async_vault.parse_detokenize_response")
+    async def test_detokenize(self, mock_parse_response, mock_validate):
+        request = DetokenizeRequest(data=[{"token": "token1", "redaction_type": RedactionType.PLAIN_TEXT}])
+        expected_response = DetokenizeResponse(detokenized_fields=[{"token": "token1", "value": "v"}])
+        mock_parse_response.return_value = expected_response
+        self.tokens_api.with_raw_response.record_service_detokenize = AsyncMock(return_value=Mock())
+
+        result = await self.vault.detokenize(request)
+
+        _, kwargs = self.tokens_api.with_raw_response.record_service_detokenize.call_args
+        self.assertEqual(kwargs["detokenization_parameters"],
+                         [V1DetokenizeRecordRequest(token="token1", redaction=RedactionType.PLAIN_TEXT)])
+        self.assertIs(result, expected_response)
+
+    async def test_detokenize_batching_coalesces_concurrent_calls(self):
+        sent_batches = []
+
+        async def detokenize(*args, **kwargs):
+            sent_batches.append([record.token for record in kwargs["detokenization_parameters"]])
+            records = [Mock(token=record.token, value=f"value_{record.token}", value_type=None,
+                            error="Token not found" if record.token.startswith("bad") else None)
+                       for record in kwargs["detokenization_parameters"]]
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(records=records))
+
+        self.tokens_api.with_raw_response.record_service_detokenize = detokenize
+        self.vault.enable_detokenize_batching(max_batch_size=10, max_wait_time=0.01)
+
+        results = await asyncio.gather(
+            self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}, {"token": "t2"}])),
+            self.vault.detokenize(DetokenizeRequest(data=[{"token": "bad"}], continue_on_error=True)),
+            self.vault.detokenize(DetokenizeRequest(data=[{"token": "t3"}])),
+        )
+
+        self.assertEqual(sent_batches, [["t1", "t2", "bad", "t3"]])
+        self.assertEqual([f["value"] for f in results[0].detokenized_fields], ["value_t1", "value_t2"])
+        self.assertEqual(results[1].detokenized_fields, [])
+        self.assertEqual(results[1].errors[0]["token"], "bad")
+        self.assertEqual([f["value"] for f in results[2].detokenized_fields], ["value_t3"])
+
+    async def test_detokenize_batching_bounds_wait(self):
+        async def detokenize(*args, **kwargs):
+            await asyncio.sleep(5)
+
+        self.tokens_api.with_raw_response.record_service_detokenize = detokenize
+        self.vault_client.get_timeout.return_value = 0.05
+        self.vault.enable_detokenize_batching(max_batch_size=10, max_wait_time=0)
+
+        with self.assertRaises(SkyflowError) as context:
+            await self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}]))
+        self.assertEqual(context.exception.message,
+                         SkyflowMessages.Error.DETOKENIZE_BATCH_TIMED_OUT.value.format(0.05))
+
+    @patch("skyflow.vault.controller._async_vault.validate_tokenize_request")
+    @patch("skyflow.vault.controller._async_vault.parse_tokenize_response")
+    async def test_tokenize(self, mock_parse_response, mock_validate):
+        request = TokenizeRequest(values=[{"value": "4111", "column_group": "cards"}])
+        expected_response = TokenizeResponse(tokenized_fields=[{"token": "t1"}])
+        mock_parse_response.return_value = expected_response
+        self.tokens_api.record_service_tokenize = AsyncMock(return_value=Mock())
+
+        result = await self.vault.tokenize(request)
+
+        _, kwargs = self.tokens_api.record_service_tokenize.call_args
+        self.assertEqual(kwargs["tokenization_parameters"],
+                         [V1TokenizeRecordRequest(value="4111", column_group="cards")])
+        self.assertIs(result, expected_response)
+
+    @patch("skyflow.vault.controller._async_vault.validate_file_upload_request")
+    async def test_upload_files_uploads_each_request(self, mock_validate):
+        async def upload_file_v_2(vault_id, file, **kwargs):
+            await asyncio.sleep(0)
+            return Mock(data=Mock(skyflow_id=f"id-{file[0]}"))
+
+        self.records_api.with_raw_response.upload_file_v_2 = upload_file_v_2
+        requests = [FileUploadRequest(table=TABLE_NAME, column_name="file_col", base64="dGVzdA==", file_name=f"f{index}.txt")
+                    for index in range(3)]
+
+        result = await self.vault.upload_files(FileUploadBatch(requests, max_in_flight=2))
+
+        self.assertEqual(sorted((f["request_index"], f["skyflow_id"]) for f in result.uploaded_files),
+                         [(0, "id-f0.txt"), (1, "id-f1.txt"), (2, "id-f2.txt")])
+        self.assertIsNone(result.errors)
+
+    @patch("skyflow.vault.controller._async_vault.validate_file_upload_request")
+    async def test_upload_file_with_base64(self, mock_validate):
+        request = FileUploadRequest(table=TABLE_NAME, column_name="file_col", skyflow_id="id1",
+                                    base64="dGVzdA==", file_name="test.txt")
+        mock_api_response = Mock()
+        mock_api_response.data.skyflow_id = "id1"
+        self.records_api.with_raw_response.upload_file_v_2 = AsyncMock(return_value=mock_api_response)
+
+        result = await self.vault.upload_file(request)
+
+        _, kwargs = self.records_api.with_raw_response.upload_file_v_2.call_args
+        file_name, file = kwargs["file"]
+        self.assertEqual((file_name, file.read()), ("test.txt", b"test"))
+        self.assertEqual(result.skyflow_id, "id1")
+        self.assertIsNone(result.errors)
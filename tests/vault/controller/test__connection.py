@@ -1,10 +1,12 @@
 import json
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import requests
 from skyflow.error import SkyflowError
 from skyflow.utils import SkyflowMessages, parse_invoke_connection_response
 from skyflow.utils._utils import get_data_from_content_type, construct_invoke_connection_request
+from skyflow.utils.constants import HttpClient
 from skyflow.utils.enums import RequestMethod, ContentType
 from skyflow.utils._version import SDK_VERSION
 from skyflow.vault.connection import InvokeConnectionRequest
@@ -196,8 +198,8 @@ class TestConnection(unittest.TestCase):
 
     @patch('skyflow.vault.controller._connections.get_credentials')
     @patch('requests.Session.send')
-    def test_invoke_session_close_called(self, mock_send, mock_get_credentials):
-        """Test that session.close() is called after send()."""
+    def test_invoke_reuses_session(self, mock_send, mock_get_credentials):
+        """Test that the pooled session is kept open and reused across invocations."""
         mock_get_credentials.return_value = {"api_key": "test_api_key"}
         
         mock_response = Mock()
@@ -212,18 +214,69 @@ class TestConnection(unittest.TestCase):
                 headers=VALID_HEADERS
             )
             
-            response = self.connection.invoke(request)
+            self.connection.invoke(request)
+            self.connection.invoke(request)
             
-            # Verify close was called
-            mock_close.assert_called_once()
+            mock_close.assert_not_called()
+            self.assertEqual(mock_send.call_count, 2)
+            self.assertIs(self.connection._Connection__session, self.connection._Connection__get_session())
+
+    def test_session_uses_pool_and_retry_options(self):
+        self.mock_vault_client.get_config.return_value = {**VAULT_CONFIG, "max_connections": 32, "max_retries": 2}
+
+        session = self.connection._Connection__get_session()
+
+        adapter = session.get_adapter("https://CONNECTION_URL")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter.max_retries.total, 2)
+        self.assertFalse(adapter.max_retries.read)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_session_rebuilt_when_pool_options_change(self):
+        session = self.connection._Connection__get_session()
+        self.assertIs(self.connection._Connection__get_session(), session)
+
+        self.mock_vault_client.get_config.return_value = {**VAULT_CONFIG, "max_retries": 1}
+        with patch('requests.Session.close') as mock_close:
+            new_session = self.connection._Connection__get_session()
+
+        mock_close.assert_called_once()
+        self.assertIsNot(new_session, session)
+
+    def test_concurrent_calls_share_one_session(self):
+        barrier = threading.Barrier(8)
+        sessions = []
+
+        def get_session():
+            barrier.wait()
+            sessions.append(self.connection._Connection__get_session())
+
+        threads = [threading.Thread(target=get_session) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+
+    @patch('skyflow.vault.controller._connections.get_credentials')
+    @patch('requests.Session.send')
+    def test_invoke_uses_default_timeout(self, mock_send, mock_get_credentials):
+        mock_get_credentials.return_value = {"api_key": "test_api_key"}
+        mock_send.return_value = Mock(status_code=SUCCESS_STATUS_CODE, content=SUCCESS_RESPONSE_CONTENT,
+                                      headers={'x-request-id': 'test-request-id'})
+
+        self.connection.invoke(InvokeConnectionRequest(method=RequestMethod.GET, headers=VALID_HEADERS))
+
+        self.assertEqual(mock_send.call_args[1]["timeout"], HttpClient.TIMEOUT)
 
     @patch('skyflow.vault.controller._connections.get_credentials')
-    @patch('skyflow.vault.controller._connections.get_metrics')
+    @patch('skyflow.vault.controller._connections.get_metrics_headers')
     @patch('requests.Session.send')
     def test_invoke_adds_sky_metadata_header(self, mock_send, mock_get_metrics, mock_get_credentials):
         """Test that sky-metadata header is added to request."""
         mock_get_credentials.return_value = {"api_key": "test_api_key"}
-        mock_get_metrics.return_value = {"sdk_version": SDK_VERSION}
+        mock_get_metrics.return_value = {"sky-metadata": json.dumps({"sdk_version": SDK_VERSION})}
         
         mock_response = Mock()
         mock_response.status_code = SUCCESS_STATUS_CODE
@@ -239,8 +292,9 @@ class TestConnection(unittest.TestCase):
 
         response = self.connection.invoke(request)
         
-        # Verify get_metrics was called
+        # Verify get_metrics_headers was called
         mock_get_metrics.assert_called_once()
+        self.assertEqual(mock_send.call_args.args[0].headers["sky-metadata"], json.dumps({"sdk_version": SDK_VERSION}))
         self.assertIsNotNone(response)
 
     def test_parse_invoke_connection_response_error_from_client(self):
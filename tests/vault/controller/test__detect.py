@@ -1,3 +1,5 @@
+import concurrent.futures
+import threading
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 import base64
@@ -9,7 +11,7 @@ from skyflow.utils import SkyflowMessages
 from skyflow.vault.controller import Detect
 from skyflow.vault.detect import DeidentifyTextRequest, ReidentifyTextRequest, \
     TokenFormat, DateTransformation, Transformations, DeidentifyFileRequest, GetDetectRunRequest, \
-    DeidentifyFileResponse, FileInput
+    DeidentifyFileResponse, FileInput, DetectRun
 from skyflow.utils.enums import DetectEntities, TokenType
 import io
 
@@ -129,7 +131,7 @@ class TestDetect(unittest.TestCase):
     def test_deidentify_file_txt_success(self, mock_open, mock_basename, mock_base64, mock_validate):
         file_content = b"test content"
         file_obj = Mock()
-        file_obj.read.return_value = file_content
+        file_obj.read.side_effect = io.BytesIO(file_content).read
         file_obj.name = "/tmp/test.txt"
         mock_basename.return_value = "test.txt"
         mock_base64.b64encode.return_value = b"dGVzdCBjb250ZW50"
@@ -192,7 +194,7 @@ class TestDetect(unittest.TestCase):
     def test_deidentify_file_audio_success(self, mock_base64, mock_validate):
         file_content = b"audio bytes"
         file_obj = Mock()
-        file_obj.read.return_value = file_content
+        file_obj.read.side_effect = io.BytesIO(file_content).read
         file_obj.name = "audio.mp3"
         mock_base64.b64encode.return_value = b"YXVkaW8gYnl0ZXM="
         req = DeidentifyFileRequest(file=FileInput(file=file_obj))
@@ -324,7 +326,7 @@ class TestDetect(unittest.TestCase):
             with self.subTest(file_type=extension):
                 # Setup file mock
                 file_obj = Mock()
-                file_obj.read.return_value = file_content
+                file_obj.read.side_effect = io.BytesIO(file_content).read
                 file_obj.name = file_name
                 mock_basename.return_value = file_name
 
@@ -626,7 +628,7 @@ class TestDetect(unittest.TestCase):
     def test_deidentify_file_using_file_path(self, mock_open, mock_basename, mock_base64, mock_validate):
         # Setup mock file context
         mock_file = MagicMock()
-        mock_file.read.return_value = b"test content from file path"
+        mock_file.read.side_effect = io.BytesIO(b"test content from file path").read
         mock_file.name = "/path/to/test.txt"
         mock_file.__enter__.return_value = mock_file  # Mock context manager
         mock_open.return_value = mock_file
@@ -683,7 +685,7 @@ class TestDetect(unittest.TestCase):
             
             result = self.detect.deidentify_file(req)
 
-            mock_file.read.assert_called_once()
+            mock_file.read.assert_called()
             mock_validate.assert_called_once()
             files_api.deidentify_text.assert_called_once()
             mock_basename.assert_called_with("/path/to/test.txt")
@@ -823,12 +825,39 @@ class TestDetect(unittest.TestCase):
         result = self.detect._Detect__get_file_from_request(req)
         self.assertIsNone(result)
 
+    def test_read_file_encodes_file_path_and_closes_it(self):
+        content = os.urandom(1000)
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+            f.write(content)
+        try:
+            opened = []
+            real_open = open
+            with patch("skyflow.vault.controller._detect.open", create=True,
+                       side_effect=lambda *args: opened.append(real_open(*args)) or opened[-1]):
+                file_name, file_extension, base64_string = self.detect._read_file(
+                    DeidentifyFileRequest(file=FileInput(file_path=f.name)))
+        finally:
+            os.remove(f.name)
+
+        self.assertEqual((file_name, file_extension), (f.name, "pdf"))
+        self.assertEqual(base64_string, base64.b64encode(content).decode())
+        self.assertTrue(opened[0].closed)
+
+    def test_read_file_leaves_file_object_open(self):
+        file_obj = io.BytesIO(b"test content")
+        file_obj.name = "test.txt"
+
+        _, _, base64_string = self.detect._read_file(DeidentifyFileRequest(file=FileInput(file=file_obj)))
+
+        self.assertEqual(base64_string, base64.b64encode(b"test content").decode())
+        self.assertFalse(file_obj.closed)
+
     @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
     @patch("skyflow.vault.controller._detect.base64")
     def test_deidentify_file_api_error_inside_try(self, mock_base64, mock_validate):
         file_content = b"test content"
         file_obj = Mock()
-        file_obj.read.return_value = file_content
+        file_obj.read.side_effect = io.BytesIO(file_content).read
         file_obj.name = "test.txt"
         mock_base64.b64encode.return_value.decode.return_value = "encoded"
         req = DeidentifyFileRequest(file=FileInput(file=file_obj))
@@ -845,3 +874,140 @@ class TestDetect(unittest.TestCase):
         self.vault_client.get_detect_file_api.return_value = files_api
         with self.assertRaises(Exception):
             self.detect.deidentify_file(req)
+
+    def _make_files_request(self, content=b"test content", wait_time=None):
+        file_obj = io.BytesIO(content)
+        file_obj.name = "test.txt"
+        req = DeidentifyFileRequest(file=FileInput(file=file_obj))
+        req.wait_time = wait_time
+        return req
+
+    def _make_run_data(self, status):
+        return Mock(status=status, run_id=None, output=[], word_character_count=None, size=None,
+                    duration=None, pages=None, slides=None)
+
+    @patch("skyflow.vault.controller._detect_run_scheduler.time.monotonic")
+    @patch("skyflow.vault.controller._detect.time.sleep")
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_deidentify_files_yields_runs_as_they_complete(self, mock_validate, mock_sleep, mock_monotonic):
+        clock = [100]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda delay: clock.__setitem__(0, clock[0] + delay)
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        run_ids = iter(["run1", "run2"])
+        files_api.deidentify_text.side_effect = lambda **kwargs: Mock(data=Mock(run_id=next(run_ids)))
+        polls = {"run1": [self._make_run_data("IN_PROGRESS"), self._make_run_data("IN_PROGRESS"), self._make_run_data("SUCCESS")],
+                 "run2": [self._make_run_data("SUCCESS")]}
+        files_api.get_run.side_effect = lambda run_id, **kwargs: Mock(data=polls[run_id].pop(0))
+
+        results = list(self.detect.deidentify_files([self._make_files_request(b"one"), self._make_files_request(b"two")],
+                                                    max_in_flight=1))
+
+        self.assertEqual([(r.run_id, r.status, r.request_index) for r in results],
+                         [("run2", "SUCCESS", 1), ("run1", "SUCCESS", 0)])
+        self.assertEqual(files_api.deidentify_text.call_count, 2)
+        # run1 is polled in every round, together with run2 once it is submitted.
+        self.assertEqual([c.args[0] for c in files_api.get_run.call_args_list], ["run1", "run1", "run2", "run1"])
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_deidentify_files_yields_failed_response_for_failed_submission(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.side_effect = [Exception("upload error"), Mock(data=Mock(run_id="run2"))]
+        files_api.get_run.return_value = Mock(data=self._make_run_data("SUCCESS"))
+
+        results = list(self.detect.deidentify_files([self._make_files_request(), self._make_files_request()],
+                                                    max_in_flight=1))
+
+        self.assertEqual(results[0].status, "FAILED")
+        self.assertIsNone(results[0].run_id)
+        self.assertEqual(results[0].request_index, 0)
+        self.assertEqual(results[0].errors[0]["request_index"], 0)
+        self.assertEqual((results[1].run_id, results[1].status, results[1].request_index), ("run2", "SUCCESS", 1))
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_deidentify_files_yields_failed_response_for_failed_poll(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.return_value = Mock(data=Mock(run_id="run1"))
+        files_api.get_run.side_effect = Exception("poll error")
+
+        results = list(self.detect.deidentify_files([self._make_files_request()]))
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual((results[0].run_id, results[0].status), ("run1", "FAILED"))
+        self.assertEqual(len(results[0].errors), 1)
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_deidentify_files_returns_in_progress_after_wait_time(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.return_value = Mock(data=Mock(run_id="run1"))
+        files_api.get_run.return_value = Mock(data=self._make_run_data("IN_PROGRESS"))
+
+        results = list(self.detect.deidentify_files([self._make_files_request(wait_time=0)]))
+
+        self.assertEqual([(r.run_id, r.status, r.request_index) for r in results], [("run1", "IN_PROGRESS", 0)])
+        files_api.get_run.assert_called_once()
+
+    def test_deidentify_files_invalid_max_in_flight(self):
+        with self.assertRaises(SkyflowError) as context:
+            self.detect.deidentify_files([self._make_files_request()], max_in_flight=0)
+        self.assertEqual(context.exception.message,
+                         SkyflowMessages.Error.INVALID_BULK_OPTION.value.format("max_in_flight", "DETECT_FILE", "max_in_flight"))
+
+    def test_deidentify_files_invalid_requests(self):
+        with self.assertRaises(SkyflowError) as context:
+            self.detect.deidentify_files("test.txt")
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_DEIDENTIFY_FILES_REQUESTS.value)
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_submit_deidentify_file_returns_run_handle(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.return_value = Mock(data=Mock(run_id="run1"))
+        files_api.get_run.return_value = Mock(data=self._make_run_data("SUCCESS"))
+        done = threading.Event()
+
+        run = self.detect.submit_deidentify_file(self._make_files_request())
+        run.add_done_callback(lambda future: done.set())
+        finished, _ = concurrent.futures.wait([run], timeout=5)
+
+        self.assertIsInstance(run, DetectRun)
+        self.assertEqual(run.run_id, "run1")
+        self.assertEqual(finished, {run})
+        self.assertEqual(run.status(), "SUCCESS")
+        self.assertEqual(run.result(timeout=5).run_id, "run1")
+        self.assertTrue(done.wait(5))
+        self.assertEqual(files_api.get_run.call_args.args[0], "run1")
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_submit_deidentify_file_raises_on_failed_submission(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.side_effect = Exception("upload error")
+
+        with self.assertRaises(SkyflowError):
+            self.detect.submit_deidentify_file(self._make_files_request())
+        files_api.get_run.assert_not_called()
+
+    @patch("skyflow.vault.controller._detect.validate_deidentify_file_request")
+    def test_submit_deidentify_file_result_raises_on_failed_poll(self, mock_validate):
+        files_api = Mock()
+        files_api.with_raw_response = files_api
+        self.vault_client.get_detect_file_api.return_value = files_api
+        files_api.deidentify_text.return_value = Mock(data=Mock(run_id="run1"))
+        files_api.get_run.side_effect = Exception("poll error")
+
+        run = self.detect.submit_deidentify_file(self._make_files_request())
+
+        with self.assertRaises(SkyflowError):
+            run.result(timeout=5)
+        self.assertEqual(run.status(), "FAILED")
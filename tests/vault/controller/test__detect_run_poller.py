@@ -0,0 +1,81 @@
+import threading
+import unittest
+from unittest.mock import Mock
+from skyflow.error import SkyflowError
+from skyflow.vault.controller._detect_run_poller import DetectRunPoller
+from skyflow.vault.detect import DetectRun
+
+
+class TestDetectRunPoller(unittest.TestCase):
+
+    def setUp(self):
+        self.polls = {}
+        self.build_response = Mock(side_effect=lambda data, request, file_name, run_id: (run_id, data.status, file_name))
+        self.poller = DetectRunPoller(lambda run_id: self.polls[run_id].pop(0), self.build_response)
+
+    def test_resolves_completed_runs(self):
+        self.polls = {"run1": [Mock(status="SUCCESS")], "run2": [Mock(status="FAILED")]}
+        run1, run2 = DetectRun("run1"), DetectRun("run2")
+        request = Mock()
+
+        self.poller.add(run1, request, "a.txt")
+        self.poller.add(run2, request, "b.txt")
+
+        self.assertEqual(run1.result(timeout=5), ("run1", "SUCCESS", "a.txt"))
+        self.assertEqual(run2.result(timeout=5), ("run2", "FAILED", "b.txt"))
+        self.assertIs(self.build_response.call_args_list[0].args[1], request)
+
+    def test_polls_until_run_completes(self):
+        self.polls = {"run1": [Mock(status="IN_PROGRESS"), Mock(status="SUCCESS")]}
+        run = DetectRun("run1")
+
+        self.poller.add(run, Mock(), "a.txt")
+
+        self.assertEqual(run.result(timeout=5), ("run1", "SUCCESS", "a.txt"))
+        self.assertEqual(self.polls["run1"], [])
+
+    def test_failed_poll_sets_exception(self):
+        error = SkyflowError("poll error", 500)
+        self.polls = {"run1": [error]}
+        run = DetectRun("run1")
+
+        self.poller.add(run, Mock(), "a.txt")
+
+        self.assertIs(run.exception(timeout=5), error)
+        self.build_response.assert_not_called()
+
+    def test_failed_response_build_sets_skyflow_error(self):
+        self.polls = {"run1": [Mock(status="SUCCESS")]}
+        self.build_response.side_effect = Exception("write error")
+        run = DetectRun("run1")
+
+        self.poller.add(run, Mock(), "a.txt")
+
+        self.assertIsInstance(run.exception(timeout=5), SkyflowError)
+
+    def test_done_callback_runs_on_completion(self):
+        self.polls = {"run1": [Mock(status="SUCCESS")]}
+        done = threading.Event()
+        run = DetectRun("run1")
+        run.add_done_callback(lambda future: done.set())
+
+        self.poller.add(run, Mock(), "a.txt")
+
+        self.assertTrue(done.wait(5))
+
+    def test_cancelled_run_is_not_resolved(self):
+        polled = threading.Event()
+
+        def get_run(run_id):
+            polled.set()
+            return Mock(status="SUCCESS")
+
+        poller = DetectRunPoller(get_run, self.build_response)
+        run = DetectRun("run1")
+        run.cancel()
+
+        poller.add(run, Mock(), "a.txt")
+
+        self.assertTrue(polled.wait(5))
+        self.assertTrue(run.cancelled())
+        self.build_response.assert_not_called()
@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch
+from skyflow.vault.controller._detect_run_scheduler import DetectRunScheduler
+
+
+@patch("skyflow.vault.controller._detect_run_scheduler.time.monotonic")
+class TestDetectRunScheduler(unittest.TestCase):
+
+    def setUp(self):
+        self.scheduler = DetectRunScheduler()
+
+    def test_empty_scheduler_has_no_delay(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+
+        self.assertEqual(len(self.scheduler), 0)
+        self.assertIsNone(self.scheduler.get_delay())
+        self.assertEqual(self.scheduler.get_due_run_ids(), [])
+
+    def test_added_run_is_due_right_away(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.scheduler.add("run1", (0, "a.txt"), 64)
+
+        self.assertEqual(self.scheduler.get_delay(), 0)
+        self.assertEqual(self.scheduler.get_due_run_ids(), ["run1"])
+        self.assertEqual(self.scheduler.pop("run1"), (0, "a.txt"))
+        self.assertEqual(len(self.scheduler), 0)
+
+    def test_rounds_share_a_doubling_backoff(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.scheduler.add("run1", (0, "a.txt"), 64)
+        self.scheduler.add("run2", (1, "b.txt"), 64)
+
+        delays = []
+        for _ in range(4):
+            self.assertEqual(self.scheduler.get_due_run_ids(), ["run1", "run2"])
+            self.scheduler.end_round()
+            delays.append(self.scheduler.get_delay())
+            self.assertEqual(self.scheduler.get_due_run_ids(), [])
+            mock_monotonic.return_value += delays[-1]
+
+        self.assertEqual(delays, [1, 2, 4, 8])
+
+    def test_added_run_resets_the_backoff(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.scheduler.add("run1", (0, "a.txt"), 64)
+        self.scheduler.end_round()
+        mock_monotonic.return_value = 101
+        self.scheduler.end_round()
+        self.assertEqual(self.scheduler.get_delay(), 2)
+
+        self.scheduler.add("run2", (1, "b.txt"), 64)
+        self.assertEqual(self.scheduler.get_delay(), 0)
+        self.scheduler.end_round()
+        self.assertEqual(self.scheduler.get_delay(), 1)
+
+    def test_round_is_not_put_off_past_a_run_wait_time(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.scheduler.add("run1", (0, "a.txt"), 3)
+        self.scheduler.end_round()
+        mock_monotonic.return_value = 101
+        self.scheduler.end_round()
+        mock_monotonic.return_value = 102
+
+        self.assertFalse(self.scheduler.is_expired("run1"))
+        self.scheduler.end_round()
+        self.assertEqual(self.scheduler.get_delay(), 1)
+        mock_monotonic.return_value = 103
+        self.assertTrue(self.scheduler.is_expired("run1"))
+
+    def test_run_without_wait_time_never_expires(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.scheduler.add("run1", "value")
+        delays = []
+        for _ in range(8):
+            self.scheduler.end_round()
+            delays.append(self.scheduler.get_delay())
+            mock_monotonic.return_value += delays[-1]
+
+        self.assertFalse(self.scheduler.is_expired("run1"))
+        self.assertEqual(delays, [1, 2, 4, 8, 16, 32, 64, 64])
@@ -0,0 +1,80 @@
+import unittest
+from skyflow.utils.enums import RedactionType
+from skyflow.vault.controller._detokenize_cache import DetokenizeCache
+from skyflow.vault.tokens import DetokenizeResponse
+
+VAULT_ID = "test_vault_id"
+
+
+def make_field(token):
+    return {"token": token, "value": f"value_{token}", "type": "STRING"}
+
+
+class TestDetokenizeCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = DetokenizeCache(max_size=2, ttl=60)
+
+    def store(self, *tokens, redaction_type=RedactionType.PLAIN_TEXT):
+        data = [{"token": token, "redaction_type": redaction_type} for token in tokens]
+        response = DetokenizeResponse(detokenized_fields=[make_field(token) for token in tokens])
+        return self.cache.merge(VAULT_ID, data, [None] * len(data), response)
+
+    def test_get_fields_counts_hits_and_misses(self):
+        self.store("t1")
+
+        fields = self.cache.get_fields(VAULT_ID, [{"token": "t1", "redaction_type": RedactionType.PLAIN_TEXT},
+                                                 {"token": "t2", "redaction_type": RedactionType.PLAIN_TEXT}])
+
+        self.assertEqual(fields, [make_field("t1"), None])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_vault_id_and_redaction_type(self):
+        self.store("t1")
+
+        self.assertEqual(self.cache.get_fields("other_vault", [{"token": "t1", "redaction_type": RedactionType.PLAIN_TEXT}]), [None])
+        self.assertEqual(self.cache.get_fields(VAULT_ID, [{"token": "t1", "redaction_type": RedactionType.MASKED}]), [None])
+        self.assertEqual(self.cache.get_fields(VAULT_ID, [{"token": "t1", "redaction": RedactionType.PLAIN_TEXT}]),
+                         [make_field("t1")])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.store("t1", "t2")
+        self.cache.get_fields(VAULT_ID, [{"token": "t1", "redaction_type": RedactionType.PLAIN_TEXT}])
+        self.store("t3")
+
+        fields = self.cache.get_fields(VAULT_ID, [{"token": token, "redaction_type": RedactionType.PLAIN_TEXT}
+                                                 for token in ["t1", "t2", "t3"]])
+
+        self.assertEqual([field is not None for field in fields], [True, False, True])
+        self.assertEqual(len(self.cache), 2)
+
+    def test_merge_keeps_request_order_and_does_not_cache_errors(self):
+        self.store("t2")
+        data = [{"token": token, "redaction_type": RedactionType.PLAIN_TEXT} for token in ["t1", "t2", "bad", "t3"]]
+        cached_fields = self.cache.get_fields(VAULT_ID, data)
+        errors = [{"token": "bad", "error": "Token not found", "request_id": "rid"}]
+        response = DetokenizeResponse(detokenized_fields=[make_field("t1"), make_field("t3")], errors=errors)
+
+        merged = self.cache.merge(VAULT_ID, data, cached_fields, response)
+
+        self.assertEqual([field["token"] for field in merged.detokenized_fields], ["t1", "t2", "t3"])
+        self.assertEqual(merged.errors, errors)
+        self.assertEqual(self.cache.get_fields(VAULT_ID, [data[2]]), [None])
+
+    def test_merge_matches_reordered_response_by_token(self):
+        data = [{"token": token, "redaction_type": RedactionType.PLAIN_TEXT} for token in ["t1", "bad", "t2", "t3"]]
+        errors = [{"token": "bad", "error": "Token not found", "request_id": "rid"}]
+        response = DetokenizeResponse(detokenized_fields=[make_field("t3"), make_field("t2"), make_field("t1")], errors=errors)
+        self.cache = DetokenizeCache(max_size=4, ttl=60)
+
+        merged = self.cache.merge(VAULT_ID, data, [None] * len(data), response)
+
+        self.assertEqual([field["token"] for field in merged.detokenized_fields], ["t1", "t2", "t3"])
+        self.assertEqual(self.cache.get_fields(VAULT_ID, data), [make_field("t1"), None, make_field("t2"), make_field("t3")])
+
+    def test_cached_fields_are_copies(self):
+        merged = self.store("t1")
+        merged.detokenized_fields[0]["value"] = "changed"
+
+        self.assertEqual(self.cache.get_fields(VAULT_ID, [{"token": "t1", "redaction_type": RedactionType.PLAIN_TEXT}]),
+                         [make_field("t1")])
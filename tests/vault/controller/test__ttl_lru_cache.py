@@ -0,0 +1,41 @@
+import unittest
+from unittest.mock import patch
+from skyflow.vault.controller._ttl_lru_cache import TtlLruCache
+
+
+class TestTtlLruCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = TtlLruCache(max_size=2, ttl=60)
+
+    def test_get_counts_hits_and_misses(self):
+        self.cache.set("a", 1)
+
+        self.assertEqual(self.cache.get("a"), 1)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    @patch("skyflow.vault.controller._ttl_lru_cache.time.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.cache.set("a", 1)
+
+        mock_monotonic.return_value = 159
+        self.assertEqual(self.cache.get("a"), 1)
+        mock_monotonic.return_value = 160
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.get("a")
+        self.cache.set("c", 3)
+
+        self.assertEqual([self.cache.get(key) for key in ["a", "b", "c"]], [1, None, 3])
+
+    def test_clear(self):
+        self.cache.set("a", 1)
+        self.cache.clear()
+
+        self.assertEqual(len(self.cache), 0)
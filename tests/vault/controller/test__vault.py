@@ -1,16 +1,23 @@
+import io
+import os
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock, patch, mock_open as mock_open_func, mock_open
+from unittest.mock import ANY, Mock, patch, mock_open as mock_open_func, mock_open
+from skyflow.generated.rest.core.api_error import ApiError
 from skyflow.generated.rest import V1BatchRecord, V1FieldRecords, V1DetokenizeRecordRequest, V1TokenizeRecordRequest
 from skyflow.utils._skyflow_messages import SkyflowMessages
 from skyflow.utils.enums import RedactionType, TokenMode
 from skyflow.vault.controller import Vault
-from skyflow.vault.data import InsertRequest, InsertResponse, UpdateResponse, UpdateRequest, DeleteResponse, \
-    DeleteRequest, GetRequest, GetResponse, QueryRequest, QueryResponse, FileUploadRequest
+from skyflow.vault.data import InsertRequest, BulkInsertRequest, BulkDeleteRequest, BulkGetRequest, InsertResponse, UpdateResponse, UpdateRequest, UpdateManyRequest, DeleteResponse, \
+    DeleteRequest, GetRequest, GetResponse, QueryRequest, QueryResponse, FileUploadRequest, FileUploadBatch
 from skyflow.vault.tokens import DetokenizeRequest, DetokenizeResponse, TokenizeResponse, TokenizeRequest
 from skyflow.error import SkyflowError
 from skyflow.utils.validations import validate_file_upload_request
 VAULT_ID = "test_vault_id"
 TABLE_NAME = "test_table"
+JSON_HEADERS = {"content-type": "application/json", "x-request-id": "rid"}
 
 class TestVault(unittest.TestCase):
 
@@ -19,6 +26,7 @@ class TestVault(unittest.TestCase):
         self.vault_client = Mock()
         self.vault_client.get_vault_id.return_value = VAULT_ID
         self.vault_client.get_logger.return_value = Mock()
+        self.vault_client.get_timeout.return_value = 60.0
 
         # Create a Vault instance with the mock client
         self.vault = Vault(self.vault_client)
@@ -185,6 +193,193 @@ class TestVault(unittest.TestCase):
         self.assertEqual(result.inserted_fields, expected_inserted_fields)
         self.assertEqual(result.errors, None)  # No errors expected
 
+    def make_insert_api_response(self, records_api_call_kwargs):
+        count = len(records_api_call_kwargs["records"])
+        first_value = records_api_call_kwargs["records"][0].fields["field"]
+        records = [Mock(skyflow_id=f"id_{first_value + position}", tokens=None) for position in range(count)]
+        return Mock(headers={"x-request-id": "rid"}, data=Mock(records=records))
+
+    def test_insert_many_splits_values_and_keeps_request_index(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        records_api.record_service_insert_record.side_effect = lambda *args, **kwargs: self.make_insert_api_response(kwargs)
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(7)], chunk_size=3)
+
+        result = self.vault.insert_many(request)
+
+        self.assertEqual(records_api.record_service_insert_record.call_count, 3)
+        chunk_sizes = sorted(len(c.kwargs["records"]) for c in records_api.record_service_insert_record.call_args_list)
+        self.assertEqual(chunk_sizes, [1, 3, 3])
+        self.assertEqual([(f["skyflow_id"], f["request_index"]) for f in result.inserted_fields],
+                         [(f"id_{index}", index) for index in range(7)])
+        self.assertIsNone(result.errors)
+
+    def test_insert_many_bounds_chunks_by_bytes(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        records_api.record_service_insert_record.side_effect = lambda *args, **kwargs: self.make_insert_api_response(kwargs)
+        values = [{"field": index, "blob": "x" * 40} for index in range(4)]
+        request = BulkInsertRequest(table=TABLE_NAME, values=values, chunk_size=25, max_chunk_bytes=140)
+
+        self.vault.insert_many(request)
+
+        self.assertEqual(records_api.record_service_insert_record.call_count, 2)
+
+    def test_insert_many_with_continue_on_error_offsets_request_index(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+
+        def batch_operation(*args, **kwargs):
+            responses = [{"Status": 200, "Body": {"records": [{"skyflow_id": f"id_{record.fields['field']}"}]}}
+                         if record.fields["field"] != 2 else {"Status": 400, "Body": {"error": "bad record"}}
+                         for record in kwargs["records"]]
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(responses=responses))
+
+        records_api.record_service_batch_operation.side_effect = batch_operation
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(4)],
+                                    continue_on_error=True, chunk_size=2)
+
+        result = self.vault.insert_many(request)
+
+        self.assertEqual([f["request_index"] for f in result.inserted_fields], [0, 1, 3])
+        self.assertEqual(result.errors, [{"request_index": 2, "request_id": "rid", "error": "bad record", "http_code": 400}])
+
+    def test_insert_many_reports_failed_chunk_per_record(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+
+        def insert_record(*args, **kwargs):
+            if kwargs["records"][0].fields["field"] == 2:
+                raise Exception("chunk failed")
+            return self.make_insert_api_response(kwargs)
+
+        records_api.record_service_insert_record.side_effect = insert_record
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(4)], chunk_size=2)
+
+        result = self.vault.insert_many(request)
+
+        self.assertEqual([f["request_index"] for f in result.inserted_fields], [0, 1])
+        self.assertEqual([e["request_index"] for e in result.errors], [2, 3])
+        self.assertEqual(result.errors[0]["error"], "chunk failed")
+
+    def test_insert_many_bounds_chunks_in_flight(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        lock = threading.Lock()
+        in_flight = []
+        peak = []
+
+        def insert_record(*args, **kwargs):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.pop()
+            return self.make_insert_api_response(kwargs)
+
+        records_api.record_service_insert_record.side_effect = insert_record
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(10)],
+                                    chunk_size=1, max_in_flight=3)
+
+        result = self.vault.insert_many(request)
+
+        self.assertEqual(len(result.inserted_fields), 10)
+        self.assertLessEqual(max(peak), 3)
+
+    def test_insert_many_splits_tokens_with_values(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        records_api.record_service_insert_record.side_effect = lambda *args, **kwargs: self.make_insert_api_response(kwargs)
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": index} for index in range(3)],
+                                    tokens=[{"field": f"token_{index}"} for index in range(3)],
+                                    token_mode=TokenMode.ENABLE_STRICT, chunk_size=2)
+
+        self.vault.insert_many(request)
+
+        sent_tokens = sorted(record.tokens["field"] for c in records_api.record_service_insert_record.call_args_list
+                             for record in c.kwargs["records"])
+        self.assertEqual(sent_tokens, ["token_0", "token_1", "token_2"])
+
+    def test_insert_stream_reads_lazily_and_yields_per_chunk(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        release = threading.Event()
+        read = []
+
+        def values():
+            for index in range(10):
+                read.append(index)
+                yield {"field": index}
+
+        def insert_record(*args, **kwargs):
+            release.wait(5)
+            return self.make_insert_api_response(kwargs)
+
+        records_api.record_service_insert_record.side_effect = insert_record
+        request = BulkInsertRequest(table=TABLE_NAME, values=values(), chunk_size=2, max_in_flight=2)
+
+        stream = self.vault.insert_stream(request)
+        results = []
+        thread = threading.Thread(target=lambda: results.extend(stream))
+        thread.start()
+        time.sleep(0.1)
+        # Two chunks in flight plus the record that closed the second chunk.
+        self.assertEqual(len(read), 5)
+        release.set()
+        thread.join(5)
+
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(isinstance(result, InsertResponse) for result in results))
+        indexes = sorted(f["request_index"] for result in results for f in result.inserted_fields)
+        self.assertEqual(indexes, list(range(10)))
+        self.vault_client.initialize_client_configuration.assert_called()
+
+    def test_insert_stream_with_token_iterable(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        records_api.record_service_insert_record.side_effect = lambda *args, **kwargs: self.make_insert_api_response(kwargs)
+        request = BulkInsertRequest(table=TABLE_NAME, values=({"field": index} for index in range(3)),
+                                    tokens=({"field": f"token_{index}"} for index in range(3)),
+                                    token_mode=TokenMode.ENABLE_STRICT, chunk_size=2)
+
+        results = list(self.vault.insert_stream(request))
+
+        self.assertEqual(len(results), 2)
+        sent_tokens = sorted(record.tokens["field"] for c in records_api.record_service_insert_record.call_args_list
+                             for record in c.kwargs["records"])
+        self.assertEqual(sent_tokens, ["token_0", "token_1", "token_2"])
+
+    def test_insert_stream_validates_records_per_chunk(self):
+        request = BulkInsertRequest(table=TABLE_NAME, values=iter([{"field": 1}, "not a record"]), chunk_size=1)
+        stream = self.vault.insert_stream(request)
+        with self.assertRaises(SkyflowError) as context:
+            list(stream)
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_TYPE_OF_DATA_IN_INSERT.value)
+
+    def test_insert_stream_rejects_non_iterable_values(self):
+        with self.assertRaises(SkyflowError):
+            self.vault.insert_stream(BulkInsertRequest(table=TABLE_NAME, values=42))
+
+    def test_insert_stream_yields_finished_chunks_before_reading_on(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+        records_api.record_service_insert_record.side_effect = lambda *args, **kwargs: self.make_insert_api_response(kwargs)
+        read = []
+
+        def values():
+            for index in range(4):
+                read.append(index)
+                if index == 1:
+                    # Gives the first chunk time to finish before the second one is read.
+                    time.sleep(0.1)
+                yield {"field": index}
+
+        stream = self.vault.insert_stream(BulkInsertRequest(table=TABLE_NAME, values=values(), chunk_size=1, max_in_flight=8))
+        first_result = next(stream)
+
+        self.assertEqual(first_result.inserted_fields[0]["request_index"], 0)
+        self.assertEqual(read, [0, 1])
+        self.assertEqual(len(list(stream)), 3)
+
+    def test_insert_many_invalid_chunk_size(self):
+        request = BulkInsertRequest(table=TABLE_NAME, values=[{"field": 1}], chunk_size=0)
+        with self.assertRaises(SkyflowError) as context:
+            self.vault.insert_many(request)
+        self.assertEqual(context.exception.message,
+                         SkyflowMessages.Error.INVALID_BULK_OPTION.value.format("chunk_size", "INSERT", "chunk_size"))
+
     @patch("skyflow.vault.controller._vault.validate_update_request")
     @patch("skyflow.vault.controller._vault.parse_update_record_response")
     def test_update_successful(self, mock_parse_response, mock_validate):
@@ -412,6 +607,296 @@ class TestVault(unittest.TestCase):
 
         records_api.record_service_bulk_get_record.assert_called_once()
 
+    @patch("skyflow.vault.controller._vault.time.sleep")
+    def test_delete_many_retries_retryable_chunks_and_reports_failed_ones(self, mock_sleep):
+        attempts = {}
+        lock = threading.Lock()
+
+        def bulk_delete_record(vault_id, table, skyflow_ids, **kwargs):
+            with lock:
+                attempts[skyflow_ids[0]] = attempts.get(skyflow_ids[0], 0) + 1
+                attempt = attempts[skyflow_ids[0]]
+            if skyflow_ids[0] == "id2" and attempt == 1:
+                raise ApiError(status_code=503, headers=JSON_HEADERS, body={"error": {"message": "unavailable"}})
+            if skyflow_ids[0] == "id4":
+                raise ApiError(status_code=400, headers=JSON_HEADERS, body={"error": {"message": "bad ids", "http_code": 400}})
+            return Mock(record_id_response=list(skyflow_ids))
+
+        self.vault_client.get_records_api.return_value.record_service_bulk_delete_record = bulk_delete_record
+        request = BulkDeleteRequest(table=TABLE_NAME, ids=[f"id{index}" for index in range(6)], chunk_size=2,
+                                    max_in_flight=3, max_retries=2)
+
+        result = self.vault.delete_many(request)
+
+        self.assertEqual(attempts, {"id0": 1, "id2": 2, "id4": 1})
+        mock_sleep.assert_called_once_with(0.5)
+        self.assertEqual(result.deleted_ids, ["id0", "id1", "id2", "id3"])
+        self.assertEqual([(error["skyflow_id"], error["request_index"]) for error in result.errors], [("id4", 4), ("id5", 5)])
+        self.assertEqual((result.errors[0]["error"], result.errors[0]["http_code"], result.errors[0]["request_id"]),
+                         ("bad ids", 400, "rid"))
+
+    @patch("skyflow.vault.controller._vault.time.sleep")
+    def test_delete_many_gives_up_after_max_retries(self, mock_sleep):
+        records_api = self.vault_client.get_records_api.return_value
+        records_api.record_service_bulk_delete_record.side_effect = ApiError(status_code=503, headers=JSON_HEADERS, body={"error": {"message": "unavailable", "http_code": 503}})
+
+        result = self.vault.delete_many(BulkDeleteRequest(table=TABLE_NAME, ids=["id0"], max_retries=2))
+
+        self.assertEqual(records_api.record_service_bulk_delete_record.call_count, 3)
+        self.assertEqual([call.args[0] for call in mock_sleep.call_args_list], [0.5, 1.0])
+        self.assertEqual(result.deleted_ids, [])
+        self.assertEqual(len(result.errors), 1)
+
+    def test_delete_many_invalid_options(self):
+        for options in [{"chunk_size": 0}, {"max_in_flight": None}, {"max_retries": -1}, {"max_retries": True}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.delete_many(BulkDeleteRequest(table=TABLE_NAME, ids=["id1"], **options))
+
+    def test_update_many_sends_batch_chunks_and_keeps_request_index(self):
+        records_api = self.vault_client.get_records_api.return_value.with_raw_response
+
+        def batch_operation(vault_id, records, **kwargs):
+            if records[0].id == "id4":
+                raise Exception("chunk failed")
+            responses = [{"Status": 200, "Body": {"records": [{"skyflow_id": record.id, "tokens": {"name": "token"}}]}}
+                         if record.id != "id1" else {"Status": 404, "Body": {"error": "not found"}}
+                         for record in records]
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(responses=responses))
+
+        records_api.record_service_batch_operation.side_effect = batch_operation
+        data = [{"skyflow_id": f"id{index}", "name": f"name{index}"} for index in range(5)]
+        request = UpdateManyRequest(table=TABLE_NAME, data=data, return_tokens=True, chunk_size=2)
+
+        result = self.vault.update_many(request)
+
+        self.assertEqual(records_api.record_service_batch_operation.call_count, 3)
+        first_record = records_api.record_service_batch_operation.call_args_list[0].kwargs["records"][0]
+        self.assertEqual((first_record.method, first_record.id, first_record.fields, first_record.table_name, first_record.tokenization),
+                         ("PUT", "id0", {"name": "name0"}, TABLE_NAME, True))
+        self.assertEqual(sorted((f["skyflow_id"], f["request_index"]) for f in result.updated_fields),
+                         [("id0", 0), ("id2", 2), ("id3", 3)])
+        self.assertEqual(result.updated_fields[0]["name"], "token")
+        self.assertEqual(sorted(error["request_index"] for error in result.errors), [1, 4])
+
+    def test_update_many_invalid_request(self):
+        for options in [{"data": []}, {"data": [{"name": "no id"}]}, {"tokens": [{"name": "token"}, {}]},
+                        {"chunk_size": 0}]:
+            request = {"table": TABLE_NAME, "data": [{"skyflow_id": "id1", "name": "name"}], **options}
+            with self.assertRaises(SkyflowError):
+                self.vault.update_many(UpdateManyRequest(**request))
+
+    def test_get_does_not_split_long_id_lists(self):
+        records_api = self.vault_client.get_records_api.return_value
+        records_api.record_service_bulk_get_record.return_value = Mock(records=[])
+        ids = [f"id{index}" for index in range(30)]
+
+        self.vault.get(GetRequest(table=TABLE_NAME, ids=ids))
+
+        records_api.record_service_bulk_get_record.assert_called_once()
+        self.assertEqual(records_api.record_service_bulk_get_record.call_args.kwargs["skyflow_ids"], ids)
+
+    def test_get_many_splits_ids_into_concurrent_chunks(self):
+        sent_ids = []
+
+        def bulk_get_record(*args, **kwargs):
+            sent_ids.append(list(kwargs["skyflow_ids"]))
+            # The server returns records sorted by skyflow_id rather than in request order.
+            return Mock(records=[Mock(fields={"skyflow_id": skyflow_id}) for skyflow_id in sorted(kwargs["skyflow_ids"])])
+
+        self.vault_client.get_records_api.return_value.record_service_bulk_get_record = bulk_get_record
+        ids = ["id3", "id1", "id2", "id0", "id5", "id4"]
+
+        result = self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=ids, chunk_size=2, max_in_flight=2))
+
+        self.assertEqual(sorted(sent_ids), [["id2", "id0"], ["id3", "id1"], ["id5", "id4"]])
+        self.assertEqual([record["skyflow_id"] for record in result.data], ids)
+        self.assertIsNone(result.errors)
+
+    def test_get_many_orders_records_when_fields_omit_skyflow_id(self):
+        sent_fields = []
+
+        def bulk_get_record(*args, **kwargs):
+            sent_fields.append(kwargs["fields"])
+            return Mock(records=[Mock(fields={"skyflow_id": skyflow_id, "name": f"name_{skyflow_id}"})
+                                 for skyflow_id in sorted(kwargs["skyflow_ids"])])
+
+        self.vault_client.get_records_api.return_value.record_service_bulk_get_record = bulk_get_record
+
+        result = self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=["id2", "id1", "id0"], fields=["name"], chunk_size=2))
+
+        self.assertEqual(sent_fields, [["name", "skyflow_id"], ["name", "skyflow_id"]])
+        self.assertEqual(result.data, [{"name": "name_id2"}, {"name": "name_id1"}, {"name": "name_id0"}])
+
+    def test_get_many_reports_failed_chunks_per_id(self):
+        def bulk_get_record(*args, **kwargs):
+            if "id4" in kwargs["skyflow_ids"]:
+                raise Exception("chunk failed")
+            return Mock(records=[Mock(fields={"skyflow_id": skyflow_id}) for skyflow_id in kwargs["skyflow_ids"]])
+
+        self.vault_client.get_records_api.return_value.record_service_bulk_get_record = bulk_get_record
+
+        result = self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=[f"id{index}" for index in range(6)], chunk_size=2))
+
+        self.assertEqual([record["skyflow_id"] for record in result.data], ["id0", "id1", "id2", "id3"])
+        self.assertEqual([(error["skyflow_id"], error["request_index"], error["error"]) for error in result.errors],
+                         [("id4", 4, "chunk failed"), ("id5", 5, "chunk failed")])
+
+    def test_get_many_invalid_options(self):
+        for options in [{"chunk_size": 0}, {"max_in_flight": "2"}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.get_many(BulkGetRequest(table=TABLE_NAME, ids=["id1"], **options))
+
+    def test_get_many_rejects_paging_and_column_lookups(self):
+        for option, value in [("offset", "5"), ("limit", "10"), ("column_name", "name"), ("column_values", ["a"])]:
+            request = BulkGetRequest(table=TABLE_NAME, ids=["id1"])
+            setattr(request, option, value)
+            with self.assertRaises(SkyflowError) as context:
+                self.vault.get_many(request)
+            self.assertEqual(context.exception.message, SkyflowMessages.Error.INVALID_GET_MANY_OPTIONS.value)
+
+    def make_get_records_api(self, total):
+        requested = []
+        lock = threading.Lock()
+
+        def bulk_get_record(*args, **kwargs):
+            offset, limit = int(kwargs["offset"]), int(kwargs["limit"])
+            with lock:
+                requested.append(offset)
+            return Mock(records=[Mock(fields={"skyflow_id": f"id{index}"}) for index in range(offset, min(offset + limit, total))])
+
+        self.vault_client.get_records_api.return_value.record_service_bulk_get_record = bulk_get_record
+        return requested
+
+    def test_iter_records_reads_every_page(self):
+        requested = self.make_get_records_api(total=60)
+
+        records = list(self.vault.iter_records(TABLE_NAME, fields=["name"], redaction_type=RedactionType.PLAIN_TEXT,
+                                               page_size=25, max_in_flight=3))
+
+        self.assertEqual([record["skyflow_id"] for record in records], [f"id{index}" for index in range(60)])
+        self.assertEqual(sorted(requested)[:3], [0, 25, 50])
+        self.assertLessEqual(len(requested), 5)
+
+    def test_iter_records_stops_on_exact_multiple_of_page_size(self):
+        requested = self.make_get_records_api(total=50)
+
+        records = list(self.vault.iter_records(TABLE_NAME, page_size=25, max_in_flight=1))
+
+        self.assertEqual(len(records), 50)
+        self.assertEqual(requested, [0, 25, 50])
+
+    def test_iter_records_fetches_lazily(self):
+        requested = self.make_get_records_api(total=1000)
+
+        records = self.vault.iter_records(TABLE_NAME, page_size=10, max_in_flight=2)
+        first = [next(records) for _ in range(15)]
+        records.close()
+
+        self.assertEqual(first[-1]["skyflow_id"], "id14")
+        self.assertLessEqual(len(requested), 4)
+
+    def test_iter_records_initializes_client_for_each_batch(self):
+        self.make_get_records_api(total=50)
+        self.vault_client.initialize_client_configuration.reset_mock()
+
+        records = self.vault.iter_records(TABLE_NAME, page_size=25, max_in_flight=1)
+        self.vault_client.initialize_client_configuration.assert_not_called()
+        list(records)
+
+        self.assertEqual(self.vault_client.initialize_client_configuration.call_count, 3)
+
+    def test_iter_records_raises_page_errors(self):
+        self.vault_client.get_records_api.return_value.record_service_bulk_get_record.side_effect = Exception("boom")
+
+        with self.assertRaises(SkyflowError):
+            list(self.vault.iter_records(TABLE_NAME))
+
+    def test_iter_records_invalid_options(self):
+        for options in [{"table": ""}, {"table": TABLE_NAME, "page_size": 26}, {"table": TABLE_NAME, "page_size": 0},
+                        {"table": TABLE_NAME, "max_in_flight": 0}, {"table": TABLE_NAME, "fields": "name"},
+                        {"table": TABLE_NAME, "redaction_type": "PLAIN_TEXT"}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.iter_records(**options)
+
+    def make_query_api(self, total):
+        queries = []
+        lock = threading.Lock()
+
+        def execute_query(vault_id, query, **kwargs):
+            with lock:
+                queries.append(query)
+            limit, offset = (int(value) for value in query.split()[-3::2])
+            return Mock(records=[Mock(fields={"skyflow_id": f"id{index}"}) for index in range(offset, min(offset + limit, total))])
+
+        self.vault_client.get_query_api.return_value.query_service_execute_query = execute_query
+        return queries
+
+    def test_iter_query_reads_every_page(self):
+        queries = self.make_query_api(total=60)
+
+        rows = list(self.vault.iter_query("SELECT * FROM test_table;", page_size=25, max_in_flight=3))
+
+        self.assertEqual([row["skyflow_id"] for row in rows], [f"id{index}" for index in range(60)])
+        # Pages past the short one may already have started while it was read.
+        self.assertTrue({f"SELECT * FROM test_table LIMIT 25 OFFSET {offset}" for offset in (0, 25, 50)} <= set(queries))
+        self.assertLessEqual(len(queries), 5)
+
+    def test_iter_query_keeps_trailing_limit_and_offset(self):
+        queries = self.make_query_api(total=100)
+
+        rows = list(self.vault.iter_query("SELECT * FROM test_table LIMIT 30 OFFSET 10", page_size=25))
+
+        self.assertEqual([row["skyflow_id"] for row in rows], [f"id{index}" for index in range(10, 40)])
+        self.assertEqual(queries, ["SELECT * FROM test_table LIMIT 25 OFFSET 10", "SELECT * FROM test_table LIMIT 5 OFFSET 35"])
+
+    def test_iter_query_reads_limit_offset_count(self):
+        queries = self.make_query_api(total=100)
+
+        rows = list(self.vault.iter_query("SELECT * FROM test_table ORDER BY skyflow_id LIMIT 10, 30", page_size=25))
+
+        self.assertEqual([row["skyflow_id"] for row in rows], [f"id{index}" for index in range(10, 40)])
+        self.assertEqual(queries, ["SELECT * FROM test_table ORDER BY skyflow_id LIMIT 25 OFFSET 10",
+                                   "SELECT * FROM test_table ORDER BY skyflow_id LIMIT 5 OFFSET 35"])
+
+    @patch("skyflow.vault.controller._vault.log_warn")
+    def test_iter_query_warns_without_order_by(self, mock_log_warn):
+        self.make_query_api(total=0)
+
+        list(self.vault.iter_query("SELECT * FROM test_table ORDER BY skyflow_id"))
+        mock_log_warn.assert_not_called()
+        list(self.vault.iter_query("SELECT * FROM test_table"))
+        mock_log_warn.assert_called_once_with(SkyflowMessages.Warning.ITER_QUERY_WITHOUT_ORDER_BY.value, ANY)
+
+    def test_iter_query_fetches_lazily(self):
+        queries = self.make_query_api(total=1000)
+
+        rows = self.vault.iter_query("SELECT * FROM test_table", page_size=10, max_in_flight=2)
+        first = [next(rows) for _ in range(15)]
+        rows.close()
+
+        self.assertEqual(first[-1]["skyflow_id"], "id14")
+        self.assertLessEqual(len(queries), 4)
+
+    def test_iter_query_initializes_client_for_each_batch(self):
+        self.make_query_api(total=60)
+        self.vault_client.initialize_client_configuration.reset_mock()
+
+        list(self.vault.iter_query("SELECT * FROM test_table", page_size=25, max_in_flight=1))
+
+        self.assertEqual(self.vault_client.initialize_client_configuration.call_count, 3)
+
+    def test_iter_query_raises_page_errors(self):
+        self.vault_client.get_query_api.return_value.query_service_execute_query.side_effect = Exception("boom")
+
+        with self.assertRaises(SkyflowError):
+            list(self.vault.iter_query("SELECT * FROM test_table"))
+
+    def test_iter_query_invalid_options(self):
+        for options in [{"query": "DELETE FROM test_table"}, {"query": ""}, {"query": "SELECT 1", "page_size": 26},
+                        {"query": "SELECT 1", "max_in_flight": 0}, {"query": "SELECT 1 LIMIT 5 LIMIT 10"}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.iter_query(**options)
+
     @patch("skyflow.vault.controller._vault.validate_query_request")
     @patch("skyflow.vault.controller._vault.parse_query_response")
     def test_query_successful(self, mock_parse_response, mock_validate):
@@ -538,6 +1023,205 @@ class TestVault(unittest.TestCase):
 
         tokens_api.with_raw_response.record_service_detokenize.assert_called_once()
 
+    def make_detokenize_api(self, delay=0.0, reverse=False):
+        sent_batches = []
+
+        def detokenize(*args, **kwargs):
+            sent_batches.append([record.token for record in kwargs["detokenization_parameters"]])
+            time.sleep(delay)
+            records = [Mock(token=record.token, value=f"value_{record.token}", value_type=None,
+                            error="Token not found" if record.token.startswith("bad") else None)
+                       for record in kwargs["detokenization_parameters"]]
+            if reverse:
+                records.reverse()
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(records=records))
+
+        self.vault_client.get_tokens_api.return_value.with_raw_response.record_service_detokenize = detokenize
+        return sent_batches
+
+    def test_detokenize_batching_coalesces_concurrent_calls(self):
+        sent_batches = self.make_detokenize_api()
+        self.vault.enable_detokenize_batching(max_batch_size=6, max_wait_time=5)
+        results = {}
+
+        def detokenize(index):
+            request = DetokenizeRequest(data=[{"token": f"t{index}a"}, {"token": f"t{index}b"}])
+            results[index] = self.vault.detokenize(request)
+
+        threads = [threading.Thread(target=detokenize, args=(index,)) for index in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(len(sent_batches), 1)
+        self.assertEqual(sorted(sent_batches[0]), sorted(f"t{i}{s}" for i in range(3) for s in "ab"))
+        for index in range(3):
+            self.assertEqual([f["value"] for f in results[index].detokenized_fields],
+                             [f"value_t{index}a", f"value_t{index}b"])
+            self.assertIsNone(results[index].errors)
+
+    def test_detokenize_batching_matches_reordered_records_by_token(self):
+        self.make_detokenize_api(reverse=True)
+        self.vault.enable_detokenize_batching(max_batch_size=4, max_wait_time=5)
+        results = {}
+
+        def detokenize(index):
+            request = DetokenizeRequest(data=[{"token": f"t{index}a"}, {"token": f"t{index}b"}])
+            results[index] = self.vault.detokenize(request)
+
+        threads = [threading.Thread(target=detokenize, args=(index,)) for index in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        for index in range(2):
+            self.assertEqual([f["value"] for f in results[index].detokenized_fields],
+                             [f"value_t{index}a", f"value_t{index}b"])
+
+    def test_detokenize_batching_rejects_records_it_cannot_match(self):
+        self.make_detokenize_api(reverse=True)
+        self.vault.enable_detokenize_batching(max_batch_size=100, max_wait_time=0)
+        request = DetokenizeRequest(data=[{"token": "t1", "redaction_type": RedactionType.PLAIN_TEXT},
+                                          {"token": "t1", "redaction_type": RedactionType.MASKED},
+                                          {"token": "t2", "redaction_type": RedactionType.PLAIN_TEXT}])
+
+        with self.assertRaises(SkyflowError) as context:
+            self.vault.detokenize(request)
+        self.assertEqual(context.exception.message, SkyflowMessages.Error.DETOKENIZE_BATCH_MISMATCH.value)
+
+    def test_detokenize_batching_sends_after_max_wait_time(self):
+        sent_batches = self.make_detokenize_api()
+        self.vault.enable_detokenize_batching(max_batch_size=100, max_wait_time=0.01)
+
+        result = self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}]))
+
+        self.assertEqual(sent_batches, [["t1"]])
+        self.assertEqual(result.detokenized_fields[0]["value"], "value_t1")
+
+    def test_detokenize_batching_splits_batches_at_max_batch_size(self):
+        sent_batches = self.make_detokenize_api(delay=0.01)
+        self.vault.enable_detokenize_batching(max_batch_size=2, max_wait_time=5)
+
+        threads = [threading.Thread(target=self.vault.detokenize,
+                                    args=(DetokenizeRequest(data=[{"token": f"t{index}"}]),)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+
+        self.assertEqual(sorted(len(batch) for batch in sent_batches), [2, 2])
+
+    def test_detokenize_batching_keeps_errors_per_caller(self):
+        self.make_detokenize_api()
+        self.vault.enable_detokenize_batching(max_batch_size=100, max_wait_time=0)
+
+        result = self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}, {"token": "bad1"}], continue_on_error=True))
+        self.assertEqual([f["token"] for f in result.detokenized_fields], ["t1"])
+        self.assertEqual(result.errors, [{"token": "bad1", "error": "Token not found", "request_id": "rid"}])
+
+        with self.assertRaises(SkyflowError) as context:
+            self.vault.detokenize(DetokenizeRequest(data=[{"token": "bad2"}]))
+        self.assertEqual(context.exception.message, "Token not found")
+        self.assertEqual(context.exception.request_id, "rid")
+        self.assertEqual(context.exception.http_code, 404)
+
+    def test_detokenize_batching_rejects_every_caller_when_batch_fails(self):
+        tokens_api = self.vault_client.get_tokens_api.return_value.with_raw_response
+        tokens_api.record_service_detokenize.side_effect = Exception("boom")
+        self.vault.enable_detokenize_batching(max_wait_time=0)
+
+        with self.assertRaises(SkyflowError):
+            self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}]))
+
+    def test_detokenize_batching_gives_followers_the_leader_error(self):
+        started = threading.Event()
+
+        def detokenize(*args, **kwargs):
+            started.set()
+            time.sleep(0.05)
+            raise ApiError(status_code=503, headers=JSON_HEADERS,
+                           body={"error": {"message": "unavailable", "http_code": 503}})
+
+        self.vault_client.get_tokens_api.return_value.with_raw_response.record_service_detokenize = detokenize
+        self.vault.enable_detokenize_batching(max_batch_size=100, max_wait_time=0)
+        errors = []
+
+        def call(token):
+            try:
+                self.vault.detokenize(DetokenizeRequest(data=[{"token": token}]))
+            except SkyflowError as e:
+                errors.append(e.http_code)
+
+        leader = threading.Thread(target=call, args=("t1",))
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=call, args=("t2",))
+        follower.start()
+        for thread in (leader, follower):
+            thread.join(10)
+
+        self.assertEqual(errors, [503, 503])
+
+    def test_detokenize_batching_bounds_follower_wait(self):
+        release = threading.Event()
+        self.vault_client.get_timeout.return_value = 0.05
+
+        def detokenize(*args, **kwargs):
+            release.wait(5)
+            return Mock(headers={"x-request-id": "rid"}, data=Mock(records=[]))
+
+        self.vault_client.get_tokens_api.return_value.with_raw_response.record_service_detokenize = detokenize
+        self.vault.enable_detokenize_batching(max_batch_size=2, max_wait_time=0.5)
+        leader = threading.Thread(target=self.vault.detokenize, args=(DetokenizeRequest(data=[{"token": "t1"}]),))
+        leader.start()
+        time.sleep(0.05)
+        try:
+            with self.assertRaises(SkyflowError) as context:
+                self.vault.detokenize(DetokenizeRequest(data=[{"token": "t2"}]))
+        finally:
+            release.set()
+            leader.join(10)
+        self.assertEqual(context.exception.message,
+                         SkyflowMessages.Error.DETOKENIZE_BATCH_TIMED_OUT.value.format(0.55))
+        self.assertEqual(context.exception.http_code, 500)
+
+    def test_detokenize_batching_invalid_options(self):
+        for options in [{"max_batch_size": 0}, {"max_batch_size": "10"}, {"max_wait_time": -1}, {"max_wait_time": True}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.enable_detokenize_batching(**options)
+
+    def test_detokenize_cache_sends_only_uncached_tokens(self):
+        sent_batches = self.make_detokenize_api()
+        self.vault.enable_detokenize_cache(max_size=10, ttl=60)
+
+        self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}, {"token": "t2"}]))
+        result = self.vault.detokenize(DetokenizeRequest(data=[{"token": "t3"}, {"token": "t1"}]))
+        cached_result = self.vault.detokenize(DetokenizeRequest(data=[{"token": "t2"}]))
+
+        self.assertEqual(sent_batches, [["t1", "t2"], ["t3"]])
+        self.assertEqual([f["value"] for f in result.detokenized_fields], ["value_t3", "value_t1"])
+        self.assertEqual(cached_result.detokenized_fields, [{"token": "t2", "value": "value_t2", "type": None}])
+        self.assertEqual((self.vault.detokenize_cache.hits, self.vault.detokenize_cache.misses), (2, 3))
+
+    def test_detokenize_cache_invalid_options(self):
+        for options in [{"max_size": 0}, {"max_size": 1.5}, {"ttl": -1}, {"ttl": "60"}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.enable_detokenize_cache(**options)
+        self.assertIsNone(self.vault.detokenize_cache)
+
+    def test_disable_detokenize_batching(self):
+        sent_batches = self.make_detokenize_api()
+        self.vault.enable_detokenize_batching(max_wait_time=0)
+        self.vault.disable_detokenize_batching()
+
+        with patch("skyflow.vault.controller._vault.parse_detokenize_response") as mock_parse_response:
+            result = self.vault.detokenize(DetokenizeRequest(data=[{"token": "t1"}]))
+
+        self.assertEqual(len(sent_batches), 1)
+        self.assertIs(result, mock_parse_response.return_value)
+
     @patch("skyflow.vault.controller._vault.validate_tokenize_request")
     @patch("skyflow.vault.controller._vault.parse_tokenize_response")
     def test_tokenize_successful(self, mock_parse_response, mock_validate):
@@ -585,6 +1269,47 @@ class TestVault(unittest.TestCase):
         # Check that the result matches the expected TokenizeResponse
         self.assertEqual(result.tokenized_fields, expected_fields)
 
+    def make_tokenize_api(self):
+        sent_values = []
+
+        def tokenize(*args, **kwargs):
+            sent_values.append([record.value for record in kwargs["tokenization_parameters"]])
+            return Mock(records=[Mock(token=f"token_{record.value}") for record in kwargs["tokenization_parameters"]])
+
+        self.vault_client.get_tokens_api.return_value.record_service_tokenize = tokenize
+        return sent_values
+
+    def test_tokenize_sends_each_distinct_value_once(self):
+        sent_values = self.make_tokenize_api()
+        request = TokenizeRequest(values=[{"value": value, "column_group": "cards"} for value in ["a", "b", "a", "a"]])
+
+        result = self.vault.tokenize(request)
+
+        self.assertEqual(sent_values, [["a", "b"]])
+        self.assertEqual([field["token"] for field in result.tokenized_fields], ["token_a", "token_b", "token_a", "token_a"])
+
+    def test_tokenize_cache_is_used_for_listed_column_groups(self):
+        sent_values = self.make_tokenize_api()
+        self.vault.enable_tokenize_cache(["cards"], max_size=10, ttl=60)
+
+        self.vault.tokenize(TokenizeRequest(values=[{"value": "a", "column_group": "cards"},
+                                                    {"value": "a", "column_group": "names"}]))
+        result = self.vault.tokenize(TokenizeRequest(values=[{"value": "a", "column_group": "names"},
+                                                             {"value": "a", "column_group": "cards"}]))
+        cached_result = self.vault.tokenize(TokenizeRequest(values=[{"value": "a", "column_group": "cards"}]))
+
+        self.assertEqual(sent_values, [["a", "a"], ["a"]])
+        self.assertEqual([field["token"] for field in result.tokenized_fields], ["token_a", "token_a"])
+        self.assertEqual(cached_result.tokenized_fields, [{"token": "token_a"}])
+        self.assertEqual((self.vault.tokenize_cache.hits, self.vault.tokenize_cache.misses), (2, 1))
+
+    def test_tokenize_cache_invalid_options(self):
+        for options in [{"column_groups": "cards"}, {"column_groups": []}, {"column_groups": [""]},
+                        {"column_groups": ["cards"], "max_size": 0}, {"column_groups": ["cards"], "ttl": -1}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.enable_tokenize_cache(**options)
+        self.assertIsNone(self.vault.tokenize_cache)
+
     @patch("skyflow.vault.controller._vault.validate_tokenize_request")
     def test_tokenize_handles_generic_error(self, mock_validate):
         request = TokenizeRequest(
@@ -743,7 +1468,7 @@ class TestVault(unittest.TestCase):
         self.assertIsNone(result.errors)
 
     @patch("skyflow.vault.controller._vault.validate_file_upload_request")
-    @patch("skyflow.vault.controller._vault.open", mock_open(read_data=b"file_content"), create=True)
+    @patch("skyflow.utils._utils.open", mock_open(read_data=b"file_content"), create=True)
     def test_upload_file_file_path_with_existing_file_name(self, mock_validate):
         """Branch 73->76: file_name already set when file_path is present — skips basename call."""
         request = FileUploadRequest(
@@ -762,7 +1487,7 @@ class TestVault(unittest.TestCase):
 
     @patch("skyflow.vault.controller._vault.validate_file_upload_request")
     def test_upload_file_file_object_without_name_attr(self, mock_validate):
-        """Branch 84->89: file_object has no 'name' attr — __get_file_for_file_upload returns None."""
+        """Branch 84->89: file_object has no 'name' attr — get_file_for_file_upload returns None."""
         file_obj = Mock(spec=[])
         request = FileUploadRequest(
             table=TABLE_NAME,
@@ -779,7 +1504,7 @@ class TestVault(unittest.TestCase):
 
     @patch("skyflow.vault.controller._vault.validate_file_upload_request")
     def test_upload_file_no_file_source_returns_none_file(self, mock_validate):
-        """Branch 84->89 (elif False): all file sources None — __get_file_for_file_upload returns None."""
+        """Branch 84->89 (elif False): all file sources None — get_file_for_file_upload returns None."""
         request = FileUploadRequest(
             table=TABLE_NAME,
             column_name="file_col"
@@ -792,6 +1517,126 @@ class TestVault(unittest.TestCase):
         self.vault.upload_file(request)
         mock_api.upload_file_v_2.assert_called_once()
 
+    def test_upload_file_streams_file_path_and_closes_it(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "scan.bin")
+            with open(file_path, "wb") as f:
+                f.write(b"x" * 1000)
+            uploaded = {}
+
+            def upload_file_v_2(vault_id, file, **kwargs):
+                file_name, stream = file
+                uploaded.update(name=file_name, file=stream, content=stream.read())
+                return Mock(data=Mock(skyflow_id="sky123"))
+
+            self.vault_client.get_records_api.return_value.with_raw_response.upload_file_v_2 = upload_file_v_2
+            self.vault.upload_file(FileUploadRequest(table=TABLE_NAME, column_name="file_col", file_path=file_path))
+
+        self.assertEqual((uploaded["name"], uploaded["content"]), ("scan.bin", b"x" * 1000))
+        self.assertTrue(uploaded["file"].closed)
+
+    def test_upload_files_reports_progress_and_resumes_from_checkpoint(self):
+        uploaded = []
+        lock = threading.Lock()
+
+        def upload_file_v_2(vault_id, file, **kwargs):
+            file_name, _ = file
+            if file_name == "doc2.txt":
+                raise Exception("upload failed")
+            with lock:
+                uploaded.append(file_name)
+            return Mock(data=Mock(skyflow_id=f"id-{file_name}"))
+
+        self.vault_client.get_records_api.return_value.with_raw_response.upload_file_v_2 = upload_file_v_2
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index in range(4):
+                paths.append(os.path.join(directory, f"doc{index}.txt"))
+                with open(paths[-1], "w") as f:
+                    f.write("content")
+            checkpoint_path = os.path.join(directory, "checkpoint.jsonl")
+            progress = []
+            requests = (FileUploadRequest(table=TABLE_NAME, column_name="file_col", file_path=path) for path in paths)
+
+            result = self.vault.upload_files(FileUploadBatch(requests, max_in_flight=2, checkpoint_path=checkpoint_path,
+                                                             on_progress=lambda done, entry: progress.append((done, entry["request_index"]))))
+
+            self.assertEqual(sorted(uploaded), ["doc0.txt", "doc1.txt", "doc3.txt"])
+            self.assertEqual(sorted((f["request_index"], f["skyflow_id"]) for f in result.uploaded_files),
+                             [(0, "id-doc0.txt"), (1, "id-doc1.txt"), (3, "id-doc3.txt")])
+            self.assertEqual([error["request_index"] for error in result.errors], [2])
+            self.assertEqual([done for done, _ in progress], [1, 2, 3, 4])
+
+            uploaded.clear()
+            requests = [FileUploadRequest(table=TABLE_NAME, column_name="file_col", file_path=path) for path in paths]
+            result = self.vault.upload_files(FileUploadBatch(requests, checkpoint_path=checkpoint_path))
+
+        self.assertEqual(uploaded, [])
+        self.assertEqual(sorted((f["request_index"], f["skyflow_id"]) for f in result.uploaded_files),
+                         [(0, "id-doc0.txt"), (1, "id-doc1.txt"), (3, "id-doc3.txt")])
+        self.assertEqual([error["request_index"] for error in result.errors], [2])
+
+    def test_upload_files_checkpoint_matches_file_content(self):
+        uploaded = []
+
+        def upload_file_v_2(vault_id, file, **kwargs):
+            file_name, stream = file
+            uploaded.append(stream.read())
+            return Mock(data=Mock(skyflow_id=f"id{len(uploaded)}"))
+
+        self.vault_client.get_records_api.return_value.with_raw_response.upload_file_v_2 = upload_file_v_2
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "checkpoint.jsonl")
+            file_path = os.path.join(directory, "scan.txt")
+            with open(file_path, "w") as f:
+                f.write("first")
+
+            def get_requests():
+                return [FileUploadRequest(table=TABLE_NAME, column_name="file_col", base64="YQ==", file_name="same.txt"),
+                        FileUploadRequest(table=TABLE_NAME, column_name="file_col", base64="Yg==", file_name="same.txt"),
+                        FileUploadRequest(table=TABLE_NAME, column_name="file_col", file_path=file_path)]
+
+            result = self.vault.upload_files(FileUploadBatch(get_requests(), max_in_flight=1, checkpoint_path=checkpoint_path))
+            self.assertEqual(uploaded, [b"a", b"b", b"first"])
+            self.assertEqual([f["skyflow_id"] for f in result.uploaded_files], ["id1", "id2", "id3"])
+
+            with open(file_path, "w") as f:
+                f.write("second!")
+            result = self.vault.upload_files(FileUploadBatch(get_requests(), max_in_flight=1, checkpoint_path=checkpoint_path))
+
+        self.assertEqual(uploaded, [b"a", b"b", b"first", b"second!"])
+        self.assertEqual([f["skyflow_id"] for f in result.uploaded_files], ["id1", "id2", "id4"])
+
+    def test_upload_files_reads_file_objects_whole_after_keying_them(self):
+        uploaded = []
+
+        def upload_file_v_2(vault_id, file, **kwargs):
+            uploaded.append(file[1].read())
+            return Mock(data=Mock(skyflow_id="id1"))
+
+        self.vault_client.get_records_api.return_value.with_raw_response.upload_file_v_2 = upload_file_v_2
+        file_object = io.BytesIO(b"content")
+        file_object.name = "doc.txt"
+        with tempfile.TemporaryDirectory() as directory:
+            self.vault.upload_files(FileUploadBatch([FileUploadRequest(table=TABLE_NAME, column_name="file_col", file_object=file_object)],
+                                                    checkpoint_path=os.path.join(directory, "checkpoint.jsonl")))
+
+        self.assertEqual(uploaded, [b"content"])
+
+    def test_upload_files_reports_invalid_requests_per_file(self):
+        result = self.vault.upload_files(FileUploadBatch([FileUploadRequest(table=TABLE_NAME, column_name="file_col",
+                                                                            file_path="/missing/file.txt")]))
+
+        self.assertEqual(result.uploaded_files, [])
+        self.assertEqual(result.errors[0]["error"], SkyflowMessages.Error.INVALID_FILE_PATH.value)
+
+    def test_upload_files_invalid_batch(self):
+        for options in [{"requests": "file.txt"}, {"requests": [], "max_in_flight": 0},
+                        {"requests": [], "checkpoint_path": "/missing/dir/checkpoint.jsonl"},
+                        {"requests": [], "on_progress": "print"}]:
+            with self.assertRaises(SkyflowError):
+                self.vault.upload_files(FileUploadBatch(**options))
+
 class TestFileUploadValidation(unittest.TestCase):
     def setUp(self):
         self.logger = Mock()
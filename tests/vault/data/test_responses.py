@@ -4,6 +4,7 @@ from skyflow.vault.data._file_upload_response import FileUploadResponse
 from skyflow.vault.data._get_response import GetResponse
 from skyflow.vault.data._insert_response import InsertResponse
 from skyflow.vault.data._query_response import QueryResponse
+from skyflow.vault.data._query_row import QueryRow
 from skyflow.vault.data._update_response import UpdateResponse
 from skyflow.vault.data._upload_file_request import UploadFileRequest
 
@@ -83,6 +84,19 @@ class TestQueryResponse(unittest.TestCase):
         self.assertIsNone(r.errors)
 
 
+class TestQueryRow(unittest.TestCase):
+    def test_mapping(self):
+        fields = {"name": "John", "skyflow_id": "id1"}
+        r = QueryRow(fields)
+        self.assertEqual(r["name"], "John")
+        self.assertEqual(r.get("missing"), None)
+        self.assertEqual(len(r), 2)
+        self.assertEqual(r, fields)
+        self.assertEqual(r.to_dict(), fields)
+        self.assertIsNot(r.to_dict(), fields)
+        self.assertEqual(str(r), repr(r))
+
+
 class TestUpdateResponse(unittest.TestCase):
     def test_repr(self):
         r = UpdateResponse(updated_field={"skyflow_id": "id1"}, errors=None)
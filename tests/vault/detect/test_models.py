@@ -8,6 +8,8 @@ from skyflow.vault.detect._text_index import TextIndex
 from skyflow.vault.detect._date_transformation import DateTransformation
 from skyflow.vault.detect._transformations import Transformations
 from skyflow.vault.detect._file import File
+from skyflow.vault.detect._detect_run import DetectRun
+from skyflow.vault.detect._deidentify_file_response import DeidentifyFileResponse
 from skyflow.utils.enums import DetectEntities
 
 
@@ -173,5 +175,29 @@ class TestFile(unittest.TestCase):
         self.assertIn("File", repr(f))
 
 
+
+class TestDetectRun(unittest.TestCase):
+    def test_status_while_pending(self):
+        run = DetectRun("run1")
+        self.assertEqual(run.run_id, "run1")
+        self.assertEqual(run.status(), "IN_PROGRESS")
+        self.assertEqual(repr(run), "DetectRun(run_id='run1', status='IN_PROGRESS')")
+
+    def test_status_of_completed_run(self):
+        run = DetectRun("run1")
+        run.set_result(DeidentifyFileResponse(run_id="run1", status="SUCCESS"))
+        self.assertEqual(run.status(), "SUCCESS")
+
+    def test_status_of_failed_poll(self):
+        run = DetectRun("run1")
+        run.set_exception(Exception("poll error"))
+        self.assertEqual(run.status(), "FAILED")
+
+    def test_status_of_cancelled_run(self):
+        run = DetectRun("run1")
+        self.assertTrue(run.cancel())
+        self.assertEqual(run.status(), "UNKNOWN")
+
+
 if __name__ == "__main__":
     unittest.main()